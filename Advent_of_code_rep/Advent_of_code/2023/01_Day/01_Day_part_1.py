@@ -1,3 +1,24 @@
+import os
+import sys
+from functools import partial
+
+from Advent_of_code_rep.Advent_of_code.utils import loader
+from Advent_of_code_rep.Advent_of_code.utils.parsing import numpy_for
+
+SAMPLE = """\
+1abc2
+pqr3stu8vwx
+a1b2c3d4e5f
+treb7uchet
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 142}
+
+# Deleting every other byte leaves each line as just its digits
+NOT_DIGITS = bytes(c for c in range(256) if c not in b"0123456789\n")
+
+
 def extract_calibration_value(line):
     # Extract the first and last digit from the line
     first_digit = None
@@ -14,18 +35,67 @@ def extract_calibration_value(line):
     return int(first_digit + last_digit)
 
 
-def sum_of_calibration_values(file_path):
-    total = 0
-    with open(file_path, 'r') as file:
-        for line in file:
-            line = line.strip()  # Remove any surrounding whitespace or newlines
-            total += extract_calibration_value(line)
-    return total
+def calibration_sum(buffer):
+    # Sum the calibration values of a bytes-like buffer of whole lines, without
+    # a Python-level loop over its characters: translate() drops all but the
+    # digits and newlines in C, and a digit right after a newline is the first
+    # of its line, one right before a newline the last. NumPy is only
+    # imported for large chunks, such as those of `parallel_calibration_sum`
+    digits = b"\n" + bytes(buffer).translate(None, NOT_DIGITS) + b"\n"
+    np = numpy_for(len(buffer))
+    if np is None:
+        return sum(10 * line[0] + line[-1] - 11 * ord("0") for line in digits.split())
+    chars = np.frombuffer(digits, dtype=np.uint8)
+    newline = chars == ord("\n")
+    first = newline[:-2] & ~newline[1:-1]
+    last = newline[2:] & ~newline[1:-1]
+    values = chars[1:-1] - ord("0")
+    return int(10 * values[first].sum(dtype=np.int64) + values[last].sum(dtype=np.int64))
+
+
+def sum_range(file_path, start, end):
+    # Worker of `parallel_calibration_sum`: sums one newline-aligned byte range
+    # of the file, a chunk at a time, so memory stays bounded
+    with loader.map_input(file_path) as data:
+        return sum(calibration_sum(chunk) for chunk in loader.iter_chunks(data, loader.CHUNK_SIZE * 16, start, end))
+
+
+def parallel_calibration_sum(file_path, workers=None):
+    # Split the memory-mapped file into one newline-aligned range per worker
+    # and add up the workers' sums. The pool is imported here, as it takes
+    # longer to import than solving a puzzle input does
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count()
+    with loader.map_input(file_path) as data:
+        ranges = loader.split_ranges(data, workers)
+    if len(ranges) <= 1:
+        return sum_range(file_path, 0, ranges[0][1]) if ranges else 0
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        return sum(pool.map(partial(sum_range, file_path), *zip(*ranges)))
+
+
+def sum_of_calibration_values(lines):
+    return calibration_sum("\n".join(lines).encode())
+
+
+def parse(text):
+    # Remove any surrounding whitespace or newlines
+    return [line.strip() for line in loader.lines(text)]
+
+
+def part1(lines):
+    return sum_of_calibration_values(lines)
+
+
+# Contribution of a single input line to each part's sum, used by `harness.stream`
+PER_LINE = {"part1": extract_calibration_value}
 
 
-# Path to the input file
-file_path = 'input'
+if __name__ == "__main__":
+    # Path to the input file, and optionally the number of worker processes
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'input'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
 
-# Calculate the result
-result = sum_of_calibration_values(file_path)
-print(result)
\ No newline at end of file
+    # Calculate the result straight from the memory-mapped file
+    print(parallel_calibration_sum(file_path, workers))
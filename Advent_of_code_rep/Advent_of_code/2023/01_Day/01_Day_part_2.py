@@ -1,53 +1,75 @@
 import re
 
+from Advent_of_code_rep.Advent_of_code.utils import loader
+from Advent_of_code_rep.Advent_of_code.utils.matching import Automaton
+
 """
-    Not super proud of the part 2 solution due to the many nested for() loops.
+    Part 2 finds the first and last digit, spelled out or not, with an
+    Aho-Corasick automaton (`utils.matching`) instead of nested for() loops.
 """
 
-file_name = '/Users/Anita.Squires/PycharmProjects/pythonProject/2023/01_Day/input'
-input = []
-with open(file_name) as file:
-    input = [line.strip() for line in file.readlines()]
+# Expected answers on the sample input (`test_data`), checked by `harness.verify`
+SAMPLE_ANSWERS = {"part2": 281}
+
+
+def parse(text):
+    return [line.strip() for line in loader.lines(text)]
+
+
+DIGIT_WORDS = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9"
+}
+
+
+def digit_value(line):
+    line = re.sub(r'\D', '', line)  # remove non-digits from string
+    return int(line[0] + line[-1])  # retain only first and last digit, convert to integer
 
 
-def part1():
+# Finds the spelled-out and the plain digits, overlaps included
+DIGITS = Automaton({**DIGIT_WORDS, **{digit: digit for digit in DIGIT_WORDS.values()}})
+
+
+def spelled_value(line):
+    # scan forward to the first digit and backward to the last one, so words
+    # sharing letters like "oneight" count as both "one" and "eight".
+    first = DIGITS.first(line)
+    if first is None:
+        raise ValueError(f"no digit in {line!r}")
+    return int(first + DIGITS.last(line))
+
+
+def part1(lines):
     total = 0
-    for line in input:
-        line = re.sub('\D', '', line)  # remove non-digits from string
-        nums = int(line[0] + line[-1])  # retain only first and last digit, convert to integer
-        total += nums  # add to running total
+    for line in lines:
+        total += digit_value(line)  # add to running total
     return total
 
 
-def part2():
-    values = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9"
-    }
+def part2(lines):
     pairs = []
-    for line in input:
-        digits = []
-        # start at the first letter and move through it letter by letter.
-        # this is the only way i've found to account for overlapping words.
-        # an example is "oneight", which only matches "one" when using re.findall.
-        for i, c in enumerate(line):
-            if line[i].isdigit():
-                digits.append(line[i])
-            else:
-                for k in values.keys():
-                    if line[i:].startswith(k):
-                        digits.append(values[k])
-        pairs.append(int(f"{digits[0]}{digits[-1]}"))
+    for line in lines:
+        pairs.append(spelled_value(line))
 
     return sum(pairs)
 
 
-print("Part one:", part1())
-print("Part two:", part2())
\ No newline at end of file
+# Contribution of a single input line to each part's sum, used by `harness.stream`
+PER_LINE = {"part1": digit_value, "part2": spelled_value}
+
+
+if __name__ == "__main__":
+    file_name = 'input'
+    with open(file_name) as file:
+        lines = parse(file.read())
+
+    print("Part one:", part1(lines))
+    print("Part two:", part2(lines))
@@ -1,66 +1,36 @@
-import re
-from typing import Generator, Tuple, List
+from typing import Iterable, List, Union
 
-# Open the file and read the lines into a list
-lines: List[str] = open("input.txt").read().splitlines()
+from Advent_of_code_rep.Advent_of_code.utils import loader, schematic
 
+# The sample engine schematic (`test_input` holds the cube games of the other solver)
+SAMPLE = """\
+467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
 
-def is_symbol(char: str) -> bool:
-    """
-    Checks if a character is a symbol.
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 4361}
 
-    Parameters:
-    char (str): The character to check.
 
-    Returns:
-    bool: True if the character is a symbol, False otherwise.
-    """
-    return char != "." and not char.isdigit()
+def parse(text: Union[str, Iterable[str]]) -> List[str]:
+    return list(loader.lines(text))
 
 
-def get_numbers() -> Generator[Tuple[int, str, int, int, int], None, None]:
-    """
-    Generates tuples containing the line index, line content, start index, end index, and number for each number in the lines.
-    """
-    for i, line in enumerate(lines):
-        # Loop over each number in the line
-        for match in re.finditer(r"\d+", line):
-            start_index = match.start(0) - 1
-            end_index = match.end(0)
-            number = int(match.group(0))
-            yield i, line, start_index, end_index, number
+def part1(lines: Iterable[str]) -> int:
+    # Each row is settled once the row below it is read (the last one against
+    # an empty row), so only three rows are ever held, see `schematic.scan`
+    return sum(sum(parts) for parts, _ in schematic.scan(lines))
 
 
-count = 0
-
-# Iterate over the generated tuples
-for (
-    i,
-    line,
-    start_index,
-    end_index,
-    number,
-) in get_numbers():
-    # Check if number is not surrounded by symbols
-    if (start_index >= 0 and is_symbol(line[start_index])) or (
-        end_index < len(line) and is_symbol(line[end_index])
-    ):
-        count += number
-        continue
-
-    # Check if number is surrounded by symbols on the line above or below
-    # the current line
-    # loop over each digit in the number
-    for j in range(start_index, end_index + 1):
-        # Check if we are at the end of the line
-        if j >= len(line):
-            continue
-
-        # Check the line above and below for symbols
-        if (i > 0 and is_symbol(lines[i - 1][j])) or (
-            i < len(lines) - 2 and is_symbol(lines[i + 1][j])
-        ):
-            count += number
-            break
-
-print(count)
\ No newline at end of file
+if __name__ == "__main__":
+    # Stream the file through the scanner, a row at a time
+    with open("input.txt") as file:
+        print(part1(file))
@@ -1,63 +1,159 @@
-# Read the input from a file (assuming input.txt is in the same directory)
-input_file = "input"
+import re
+from numbers import Integral
+from typing import NamedTuple
 
-valid_game_ids = []
+from Advent_of_code_rep.Advent_of_code.utils import loader
+from Advent_of_code_rep.Advent_of_code.utils.parsing import numpy_for
 
-# Open and read the file
-with open(input_file, "r") as file:
-    games_input = file.readlines()
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 8, "part2": 2286}
 
-# Initialize variable to store the sum of the powers
-total_power = 0
+COLORS = ("red", "green", "blue")
 
-# Process each game
-for game in games_input:
-    game = game.strip()  # Remove any extra whitespace or newlines
+# Every "<count> <color>" of a game, whichever set it was revealed in
+CUBES = {color: re.compile(rf"(\d+) {color}") for color in COLORS}
+GAME = re.compile(r"Game (\d+):")
 
-    if not game:  # Skip empty lines
-        continue
+# The (red, green, blue) cubes in the bag of part 1
+BAG = (12, 13, 14)
 
-    try:
-        # Split the game data into the game ID and revealed sets
-        game_id, revealed_sets = game.split(": ", 1)
+# Bags compared at once by `possible_id_sums`, to bound the size of the comparison matrix
+BAG_BLOCK = 1024
 
-        # Split the revealed sets by ';' to process each individual set
-        sets = revealed_sets.split(";")
 
-        # Initialize the maximum values for red, green, and blue cubes
-        max_red = 0
-        max_green = 0
-        max_blue = 0
+class Games(NamedTuple):
+    # The game log in columns: the game ids, shape (n,), and the most red,
+    # green and blue cubes revealed at once in every game, shape (n, 3).
+    # NumPy arrays for large logs, else lists (see `parsing.numpy_for`).
+    ids: list
+    maxima: list
 
-        # Process each set of revealed cubes
-        for set_info in sets:
-            cubes = set_info.split(", ")
 
-            # Track the maximum cubes for each color in this set
-            red, green, blue = 0, 0, 0
-            for cube in cubes:
-                count, color = cube.split()
-                count = int(count)
+def game_maxima(game):
+    # Only the most cubes of each color matter, so the sets need not be split
+    return tuple(max(map(int, CUBES[color].findall(game)), default=0) for color in COLORS)
 
-                if color == "red":
-                    red = count
-                elif color == "green":
-                    green = count
-                elif color == "blue":
-                    blue = count
 
-            # Update the maximum values for each color
-            max_red = max(max_red, red)
-            max_green = max(max_green, green)
-            max_blue = max(max_blue, blue)
+def game_power(game):
+    # Calculate the power for this game (product of max red, green, blue cubes)
+    red, green, blue = game_maxima(game)
+    return red * green * blue
 
-        # Calculate the power for this game (product of max red, green, blue cubes)
-        power = max_red * max_green * max_blue
-        total_power += power
 
-    except ValueError as e:
-        # Handle error case: print a message if the line cannot be split properly
-        print(f"Error processing game line: {game} - {e}")
+def possible_id(game):
+    # The game id if the game is possible with the cubes of `BAG`, else 0
+    if all(most <= cubes for most, cubes in zip(game_maxima(game), BAG)):
+        return int(GAME.match(game).group(1))
+    return 0
 
-# Output the final sum of powers for all games
-print("Sum of the powers:", total_power)
\ No newline at end of file
+
+def parse(text):
+    # Parse the game log once into columns, skipping empty lines
+    ids, maxima = [], []
+    size = 0
+    for game in loader.lines(text):
+        size += len(game)
+        game = game.strip()
+        if not game:
+            continue
+        match = GAME.match(game)
+        if match is None:
+            raise ValueError(f"not a game: {game!r}")
+        ids.append(int(match.group(1)))
+        maxima.append(game_maxima(game))
+
+    np = numpy_for(size)
+    if np is None:
+        return Games(ids, maxima)
+    return as_arrays(np, Games(ids, maxima))
+
+
+def as_arrays(np, games):
+    # The columns as NumPy arrays, converting those of a log parsed into lists
+    return Games(np.asarray(games.ids, dtype=np.int64),
+                 np.asarray(games.maxima, dtype=np.int64).reshape(-1, len(COLORS)))
+
+
+def is_single(bags):
+    # Whether `bags` is one (red, green, blue) bag rather than a sequence of them
+    return len(bags) > 0 and isinstance(bags[0], Integral)
+
+
+def comparison_numpy(games, bags):
+    # NumPy when comparing the games with the bags is large enough to be
+    # worth importing it, whichever form the columns have
+    if not isinstance(games.ids, list):
+        import numpy
+        return numpy
+    count = 1 if is_single(bags) else len(bags)
+    return numpy_for(8 * len(COLORS) * count * len(games.ids))
+
+
+def powers(games):
+    # The power of every game
+    if isinstance(games.maxima, list):
+        return [red * green * blue for red, green, blue in games.maxima]
+    return games.maxima.prod(axis=1)
+
+
+def feasible(games, bags):
+    # Which games are possible with a bag of (red, green, blue) cubes: one
+    # flag per game for a single bag, or one row of flags per bag for a
+    # sequence of bags, all compared in one vectorized pass
+    np = comparison_numpy(games, bags)
+    if np is None:
+        if is_single(bags):
+            return [all(most <= cubes for most, cubes in zip(maxima, bags)) for maxima in games.maxima]
+        return [feasible(games, bag) for bag in bags]
+    games = as_arrays(np, games)
+    bags = np.asarray(bags, dtype=np.int64)
+    return (games.maxima <= bags[..., np.newaxis, :]).all(axis=-1)
+
+
+def possible_id_sums(games, bags):
+    # The sum of the ids of the games possible with every bag: a number for a
+    # single bag, or one sum per bag for a sequence of bags (an array when
+    # compared with NumPy)
+    np = comparison_numpy(games, bags)
+    if np is None:
+        if is_single(bags):
+            return sum(game_id for game_id, possible in zip(games.ids, feasible(games, bags)) if possible)
+        return [possible_id_sums(games, bag) for bag in bags]
+    games = as_arrays(np, games)
+    bags = np.asarray(bags, dtype=np.int64)
+    if bags.ndim == 1:
+        return int(feasible(games, bags) @ games.ids)
+    sums = np.empty(len(bags), dtype=np.int64)
+    for start in range(0, len(bags), BAG_BLOCK):
+        sums[start:start + BAG_BLOCK] = feasible(games, bags[start:start + BAG_BLOCK]) @ games.ids
+    return sums
+
+
+def part1(games):
+    # Sum of the ids of the games possible with the bag of part 1
+    return int(possible_id_sums(games, BAG))
+
+
+def part2(games):
+    # Sum of the powers of all games, summed by NumPy when they are an array
+    game_powers = powers(games)
+    if isinstance(game_powers, list):
+        return sum(game_powers)
+    return int(game_powers.sum())
+
+
+# Contribution of a single input line to each part's sum, used by `harness.stream`
+PER_LINE = {"part1": possible_id, "part2": game_power}
+
+
+if __name__ == "__main__":
+    # Read the input from a file (assuming input.txt is in the same directory)
+    input_file = "input"
+
+    # Open and read the file
+    with open(input_file, "r") as file:
+        games_input = parse(file.read())
+
+    # Output the sum of possible game ids and the final sum of powers for all games
+    print("Sum of the possible game ids:", part1(games_input))
+    print("Sum of the powers:", part2(games_input))
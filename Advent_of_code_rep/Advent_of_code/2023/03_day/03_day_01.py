@@ -1,86 +1,90 @@
 import math
 import re
-from itertools import product
-
-
-def get_check_coords(
-    lines: list[str], line_coord: int, match: re.Match
-) -> tuple[tuple[int, int], ...]:
-    def in_range(x, y):
-        return 0 <= x < len(lines) and 0 <= y < len(lines[0])
-
-    return tuple(
-        (check_line_coord, check_char_coord)
-        for check_line_coord, check_char_coord in product(
-            range(line_coord - 1, line_coord + 2),
-            range(match.start() - 1, match.end() + 1),
-        )
-        if in_range(check_line_coord, check_char_coord)
-        and (check_line_coord, check_char_coord)
-        not in product([line_coord], range(match.start(), match.end()))
+from typing import NamedTuple
+
+from Advent_of_code_rep.Advent_of_code.utils import schematic
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+GEAR = ord("*")
+
+NUMBER = re.compile(rb"\d+")
+# The same symbols as the streaming scanner, matched in the grid's bytes
+SYMBOL = re.compile(schematic.SYMBOL.pattern.encode())
+
+SAMPLE = """\
+467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 4361, "part2": 467835}
+
+
+class Engine(NamedTuple):
+    # The schematic as a padded grid (see `Grid`): its row stride, every
+    # symbol by flat index, and the (start, end, value) span of every number
+    width: int
+    symbols: dict[int, int]
+    numbers: list[tuple[int, int, int]]
+
+
+def get_check_coords(width: int, start: int, end: int) -> tuple[int, ...]:
+    """Flat indices of the cells around the number at cells[start:end]; the '.' padding makes them all valid."""
+    return (
+        *range(start - 1 - width, end + 1 - width),
+        start - 1,
+        end,
+        *range(start - 1 + width, end + 1 + width),
     )
 
 
-def get_coordinates_to_check(
-    multi_lines_str: str,
-) -> dict[int, list[tuple[tuple[int, int]], ...]]:
-    lines = multi_lines_str.splitlines()
-    coordinates = {}
+def get_symbols(grid: Grid) -> dict[int, int]:
+    """Maps the flat index of every symbol to its character."""
+    return {match.start(): match.group()[0] for match in SYMBOL.finditer(grid.cells)}
 
-    for line_coord, line in enumerate(lines):
-        for match in re.finditer(r"\d+", line):
-            number = int(match.group(0))
-            check_coords = get_check_coords(lines, line_coord, match)
-            coordinates.setdefault(number, []).append(tuple(check_coords))
 
-    return coordinates
+def get_numbers(grid: Grid) -> list[tuple[int, int, int]]:
+    """The span and value of every number; the padding separates the rows, so no number runs on into the next row."""
+    return [(match.start(), match.end(), int(match.group())) for match in NUMBER.finditer(grid.cells)]
 
 
-def get_part_numbers(multi_lines_str: str) -> list[int]:
-    coordinates_to_check = get_coordinates_to_check(multi_lines_str)
-    lines = multi_lines_str.splitlines()
-    part_numbers = []
+def touched_symbols(engine: Engine, start: int, end: int) -> list[int]:
+    """Flat indices of the symbols touching the number at cells[start:end]."""
+    return [coord for coord in get_check_coords(engine.width, start, end) if coord in engine.symbols]
 
-    for number, coordinates_list in coordinates_to_check.items():
-        for coordinates in coordinates_list:
-            for line_coord, char_coord in coordinates:
-                char = lines[line_coord][char_coord]
-                if char != "." and not char.isalnum():
-                    part_numbers.append(number)
-                    break
 
-    return part_numbers
+def parse(multi_lines_str: str) -> Engine:
+    grid = Grid.parse(multi_lines_str, fill=".")
+    return Engine(grid.width, get_symbols(grid), get_numbers(grid))
 
 
-def get_gears_ratios(multi_lines_str: str) -> list[int]:
-    coordinates_to_check = get_coordinates_to_check(multi_lines_str)
-    lines = multi_lines_str.splitlines()
+def part1(engine: Engine) -> int:
+    # Every number, including repeated values, is checked at its own position
+    return sum(value for start, end, value in engine.numbers if touched_symbols(engine, start, end))
 
-    potential_gears_coord = {}
-    gears_ratios = []
-    for number, coordinates_list in coordinates_to_check.items():
-        for coordinates in coordinates_list:
-            for line_coord, char_coord in coordinates:
-                if lines[line_coord][char_coord] == "*":
-                    potential_gears_coord.setdefault(
-                        (line_coord, char_coord), []
-                    ).append(number)
 
-    for numbers in potential_gears_coord.values():
-        if len(numbers) == 2:
-            gears_ratios.append(math.prod(numbers))
-
-    return gears_ratios
+def part2(engine: Engine) -> int:
+    # The numbers touching every '*'; the gears are those touched by exactly two
+    gear_numbers = {}
+    for start, end, value in engine.numbers:
+        for coord in touched_symbols(engine, start, end):
+            if engine.symbols[coord] == GEAR:
+                gear_numbers.setdefault(coord, []).append(value)
+    return sum(math.prod(numbers) for numbers in gear_numbers.values() if len(numbers) == 2)
 
 
 if __name__ == "__main__":
+    # Stream the file through the three-row scanner instead of building the
+    # whole grid, so schematics of any size fit in memory
     with open("input.txt", "r") as file:
-        input_text = file.read()
-        print(
-            "The sum of all of the part numbers in the engine schematic is:",
-            sum(get_part_numbers(input_text)),
-        )
-        print(
-            "The sum of all of the gear ratios in the engine schematic is:",
-            sum(get_gears_ratios(input_text)),
-        )
\ No newline at end of file
+        part_sum, ratio_sum = schematic.sums(file)
+    print("The sum of all of the part numbers in the engine schematic is:", part_sum)
+    print("The sum of all of the gear ratios in the engine schematic is:", ratio_sum)
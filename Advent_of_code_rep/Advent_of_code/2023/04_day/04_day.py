@@ -1,32 +1,96 @@
-import re
+from array import array
+from functools import reduce
+from operator import or_
 
-with open('input.txt', 'r') as f:
-    puzzle_input = f.read()
+from Advent_of_code_rep.Advent_of_code.utils import loader
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
 
+SAMPLE = """\
+Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
+"""
 
-def part1(puzzle_input):
-    regex = r':(.*)\|(.*)'
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 13, "part2": 30}
+
+
+def bitmask(numbers):
+    # Card numbers are small integers, so a set of them fits in one int with bit n for number n
+    return reduce(or_, (1 << number for number in numbers), 0)
+
+
+def popcount(np, words):
+    # The number of set bits in every row of an array of uint64 words
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def match_counts(cards, winning):
+    # Every card as a row of its winning numbers, then the numbers it has.
+    # Both sides become bitmasks of 64-bit words (bit n % 64 of word n // 64
+    # for number n), and a card's matches are the popcount of their AND.
+    # A list of cards gets one Python int bitmask per side instead
+    if isinstance(cards, list):
+        return array('H', ((bitmask(card[:winning]) & bitmask(card[winning:])).bit_count() for card in cards))
+    # Only large inputs come as a NumPy array (see `parsing.ints`), so NumPy is already loaded
+    import numpy as np
+
+    words = int(cards.max(initial=0)) // 64 + 1
+    bits = np.uint64(1) << (cards % 64).astype(np.uint64)
+    masks = []
+    for side in (slice(None, winning), slice(winning, None)):
+        mask = np.zeros((len(cards), words), dtype=np.uint64)
+        for word in range(words):
+            in_word = np.where(cards[:, side] // 64 == word, bits[:, side], np.uint64(0))
+            mask[:, word] = np.bitwise_or.reduce(in_word, axis=1)
+        masks.append(mask)
+    counts = array('H')
+    counts.frombytes(popcount(np, masks[0] & masks[1]).astype(np.uint16).tobytes())
+    return counts
+
+
+def parse(puzzle_input):
+    # Each card is parsed once, into its number of matches, shared by both parts.
+    # All cards have as many numbers as the first: the card id, then the
+    # winning numbers and the numbers it has
+    text = puzzle_input if isinstance(puzzle_input, str) else '\n'.join(loader.lines(puzzle_input))
+    first = next((line for line in text.splitlines() if line.strip()), None)
+    if first is None:
+        return array('H')
+    win_nums, _, true_nums = first.partition(':')[2].partition('|')
+    winning = len(win_nums.split())
+    cards = ints(text, width=1 + winning + len(true_nums.split()), signed=False)
+    if isinstance(cards, memoryview):
+        return match_counts([card[1:] for card in cards.tolist()], winning)
+    return match_counts(cards[:, 1:], winning)
+
+
+def part1(matches):
     points = 0
-    for win_nums, true_nums in re.findall(regex, puzzle_input):
-        overlap = set(win_nums.split()) & set(true_nums.split())
-        if overlap:
-            points += 2 ** (len(overlap) - 1)
+    for count in matches:
+        if count:
+            points += 1 << (count - 1)
 
     return points
 
 
-def part2(puzzle_input):
-    lines = puzzle_input.split('\n')
-    regex = r':(.*)\|(.*)'
-    cards = [1] * len(lines)
-    for i, line in enumerate(lines):
-        win_nums, actual_nums = re.findall(regex, line)[0]
-        overlap = set(win_nums.split()) & set(actual_nums.split())
-        for j in range(len(overlap)):
-            cards[i + j + 1] += cards[i]
+def part2(matches):
+    cards = [1] * len(matches)
+    for i, count in enumerate(matches):
+        for j in range(i + 1, min(i + 1 + count, len(cards))):
+            cards[j] += cards[i]
 
     return sum(cards)
 
 
-print('Part 1:', part1(puzzle_input))
-print('Part 2:', part2(puzzle_input))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input.txt', 'r') as f:
+        puzzle_input = parse(f.read())
+
+    print('Part 1:', part1(puzzle_input))
+    print('Part 2:', part2(puzzle_input))
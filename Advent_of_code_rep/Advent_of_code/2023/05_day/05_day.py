@@ -1,18 +1,62 @@
-import re
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
 
-with open('input.txt', 'r') as f:
-    puzzle_input = f.read()
+SAMPLE = """\
+seeds: 79 14 55 13
 
+seed-to-soil map:
+50 98 2
+52 50 48
 
-def part1(puzzle_input):
+soil-to-fertilizer map:
+0 15 37
+37 52 2
+39 0 15
+
+fertilizer-to-water map:
+49 53 8
+0 11 42
+42 0 7
+57 7 4
+
+water-to-light map:
+88 18 7
+18 25 70
+
+light-to-temperature map:
+45 77 23
+81 45 19
+68 64 13
+
+temperature-to-humidity map:
+0 69 1
+1 0 69
+
+humidity-to-location map:
+60 56 37
+56 93 4
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 35, "part2": 46}
+
+
+def parse(puzzle_input):
+    """
+    Returns the seed numbers and, per map, its (destination, source, length) conversions.
+    """
     segments = puzzle_input.split('\n\n')
-    seeds = re.findall(r'\d+', segments[0])
+    seeds = ints(segments[0], signed=False).tolist()
+    maps = [ints(seg, width=3, signed=False).tolist() for seg in segments[1:]]
+    return seeds, maps
+
+
+def part1(almanac):
+    seeds, maps = almanac
 
     min_location = float('inf')
-    for x in map(int, seeds):
-        for seg in segments[1:]:
-            for conversion in re.findall(r'(\d+) (\d+) (\d+)', seg):
-                destination, start, delta = map(int, conversion)
+    for x in seeds:
+        for conversions in maps:
+            for destination, start, delta in conversions:
                 if x in range(start, start + delta):
                     x += destination - start
                     break
@@ -22,12 +66,11 @@ def part1(puzzle_input):
     return min_location
 
 
-def part2(puzzle_input):
-    segments = puzzle_input.split('\n\n')
+def part2(almanac):
+    seeds, maps = almanac
     intervals = []
 
-    for seed in re.findall(r'(\d+) (\d+)', segments[0]):
-        x1, dx = map(int, seed)
+    for x1, dx in zip(seeds[::2], seeds[1::2]):
         x2 = x1 + dx
         intervals.append((x1, x2, 1))
 
@@ -38,8 +81,7 @@ def part2(puzzle_input):
             min_location = min(x1, min_location)
             continue
 
-        for conversion in re.findall(r'(\d+) (\d+) (\d+)', segments[level]):
-            z, y1, dy = map(int, conversion)
+        for z, y1, dy in maps[level - 1]:
             y2 = y1 + dy
             diff = z - y1
             if x2 <= y1 or y2 <= x1:  # no overlap
@@ -60,5 +102,9 @@ def part2(puzzle_input):
     return min_location
 
 
-print('Part 1:', part1(puzzle_input))
-print('Part 2:', part2(puzzle_input))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input.txt', 'r') as f:
+        almanac = parse(f.read())
+
+    print('Part 1:', part1(almanac))
+    print('Part 2:', part2(almanac))
@@ -1,19 +1,45 @@
 from collections import Counter
 
-a, b = [], []
-with open('input.txt', 'r') as f:
-    for line in f.readlines():
-        x, y = (int(z) for z in line.split())
-        a.append(x)
-        b.append(y)
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
+
+
+SAMPLE = """\
+3   4
+4   3
+2   5
+1   3
+3   9
+3   3
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 11, "part2": 31}
+
+
+def parse(text):
+    # The input is two columns of location IDs
+    ids = ints(text, signed=False).tolist()
+    return sorted(ids[0::2]), sorted(ids[1::2])
 
-a.sort()
-b.sort()
-n = len(a)
 
 # part 1
-print(sum(abs(a[i]-b[i]) for i in range(n)))
+def part1(lists):
+    a, b = lists
+    n = len(a)
+    return sum(abs(a[i]-b[i]) for i in range(n))
+
 
 # part 2
-c = Counter(b)
-print(sum(a[i]*c[a[i]] for i in range(n)))
\ No newline at end of file
+def part2(lists):
+    a, b = lists
+    n = len(a)
+    c = Counter(b)
+    return sum(a[i]*c[a[i]] for i in range(n))
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'r') as f:
+        lists = parse(f.read())
+
+    print(part1(lists))
+    print(part2(lists))
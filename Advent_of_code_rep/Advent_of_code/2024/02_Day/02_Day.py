@@ -1,9 +1,6 @@
-# Open the input file and read the contents
-with open('input.txt', 'r') as file:
-    puzzle_input = file.readlines()  # Read all lines from the file
+from functools import partial
 
-# Remove any leading/trailing whitespace characters (such as newlines)
-puzzle_input = [line.strip() for line in puzzle_input]
+from Advent_of_code_rep.Advent_of_code.utils import loader
 
 
 def is_safe_report(report):
@@ -51,6 +48,35 @@ def count_safe_reports(reports, allow_removal=False):
     return safe_count
 
 
+def parse_report(line):
+    # Convert a report into a list of integers
+    return list(map(int, line.split()))
+
+
+def parse(text):
+    # Parse the input and convert each report into a list of integers
+    return [parse_report(report) for report in loader.lines(text) if report.strip()]
+
+
+# Part 1: Count the number of safe reports without the Problem Dampener
+def part1(reports):
+    return count_safe_reports(reports, allow_removal=False)
+
+
+# Part 2: Count the number of safe reports with the Problem Dampener (allowing one removal)
+def part2(reports):
+    return count_safe_reports(reports, allow_removal=True)
+
+
+# A single report line counts 1 if it is safe, 0 otherwise
+def safe_line(line, allow_removal=False):
+    return count_safe_reports([parse_report(line)], allow_removal)
+
+
+# Contribution of a single input line to each part's sum, used by `harness.stream`
+PER_LINE = {"part1": safe_line, "part2": partial(safe_line, allow_removal=True)}
+
+
 # Example input data (the given puzzle input)
 data = [
     "7 6 4 2 1",
@@ -60,19 +86,26 @@ data = [
     "8 6 4 4 1",
     "1 3 6 7 9"
 ]
+SAMPLE = "\n".join(data)
 
-# Parse the input and convert each report into a list of integers
-report_01 = [list(map(int, report.split())) for report in data]
-reports_02 = [list(map(int, report.split())) for report in puzzle_input]
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 2, "part2": 4}
 
-# Part 1: Count the number of safe reports without the Problem Dampener
-safe_reports_count_part_test_1 = count_safe_reports(report_01, allow_removal=False)
-safe_reports_count_part1 = count_safe_reports(reports_02, allow_removal=False)
-print(f"Part 1 - Safe reports without removal test: {safe_reports_count_part_test_1}")
-print(f"Part 1 - Safe reports without removal: {safe_reports_count_part1}")
 
-# Part 2: Count the number of safe reports with the Problem Dampener (allowing one removal)
-safe_reports_count_part_test_2 = count_safe_reports(report_01, allow_removal=True)
-safe_reports_count_part2 = count_safe_reports(reports_02, allow_removal=True)
-print(f"Part 2 - Safe reports without removal test: {safe_reports_count_part_test_2}")
-print(f"Part 2 - Safe reports with removal: {safe_reports_count_part2}")
+if __name__ == "__main__":
+    # Open the input file and read the contents
+    with open('input.txt', 'r') as file:
+        puzzle_input = file.read()
+
+    report_01 = parse("\n".join(data))
+    reports_02 = parse(puzzle_input)
+
+    safe_reports_count_part_test_1 = part1(report_01)
+    safe_reports_count_part1 = part1(reports_02)
+    print(f"Part 1 - Safe reports without removal test: {safe_reports_count_part_test_1}")
+    print(f"Part 1 - Safe reports without removal: {safe_reports_count_part1}")
+
+    safe_reports_count_part_test_2 = part2(report_01)
+    safe_reports_count_part2 = part2(reports_02)
+    print(f"Part 2 - Safe reports without removal test: {safe_reports_count_part_test_2}")
+    print(f"Part 2 - Safe reports with removal: {safe_reports_count_part2}")
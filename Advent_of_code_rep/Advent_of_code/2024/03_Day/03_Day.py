@@ -1,33 +1,52 @@
 import re
 
-# Open and read the input file
-with open("input.txt") as f:
-    # Read the file content, strip any leading/trailing whitespace
-    data = f.read().strip()
+from Advent_of_code_rep.Advent_of_code.utils import loader
 
-# PART 1: Calculate the total sum of all mul(X, Y) instructions in the data
-# Find all instances of "mul(X, Y)" using regex, where X and Y are numbers
-# Multiply each pair and calculate their total sum
-result_1 = sum(int(x) * int(y) for x, y in re.findall(r"mul\((\d+),(\d+)\)", data))
+# Every instruction the corrupted memory can hold; none of them spans a line
+INSTRUCTION = re.compile(r"mul\((\d+),(\d+)\)|(do\(\))|(don't\(\))")
+
+
+SAMPLE = """\
+xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 161, "part2": 48}
 
-# Print the result of Part 1
-print("Solution 1:", result_1)
 
-# PART 2: Process data to respect "do()" and "don't()" instructions
-# Initialize the total result for Part 2
-result_2 = 0
+def parse(text):
+    """
+    Scans the memory line by line and keeps the product of every mul(X, Y)
+    together with whether the last do() / don't() before it enabled it.
+    """
+    instructions = []
+    enabled = True
+    for line in loader.lines(text):
+        for x, y, do, dont in INSTRUCTION.findall(line):
+            if do:
+                enabled = True
+            elif dont:
+                enabled = False
+            else:
+                instructions.append((int(x) * int(y), enabled))
+    return instructions
+
+
+# PART 1: Calculate the total sum of all mul(X, Y) instructions in the data
+def part1(data):
+    return sum(product for product, _ in data)
+
 
-# Split the input data into sections based on the "do()" instructions
-do_muls = data.split("do()")
+# PART 2: Only count the mul(X, Y) instructions enabled by "do()" and "don't()"
+def part2(data):
+    return sum(product for product, enabled in data if enabled)
 
-# Process each "do()" section individually
-for do_mul in do_muls:
-    # For each section, split by "don't()" and take the first part
-    # Only the portion before "don't()" is valid for multiplication
-    do = do_mul.split("don't()")[0]
 
-    # Extract all "mul(X, Y)" pairs in the valid section and calculate their sum
-    result_2 += sum(int(x) * int(y) for x, y in re.findall(r"mul\((\d+),(\d+)\)", do))
+if __name__ == "__main__":
+    # Open and read the input file
+    with open("input.txt") as f:
+        data = parse(f.read())
 
-# Print the result of Part 2
-print("Solution 2:", result_2)
\ No newline at end of file
+    # Print the results of Part 1 and Part 2
+    print("Solution 1:", part1(data))
+    print("Solution 2:", part2(data))
@@ -1,86 +1,97 @@
-def count_xmas_and_xmas_occurrences(file_path):
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+
+SAMPLE = """\
+MMMSXXMASM
+MSAMXMSMSA
+AMXSXMAAMM
+MSAMASMSMX
+XMASAMXAMM
+XXAMMXXAMA
+SMSMSASXSS
+SAXAMASAAA
+MAMMMXMMMM
+MXMXAXMASX
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 18, "part2": 9}
+
+
+def parse(text):
     """
-    Counts occurrences of the XMAS word and X-MAS pattern in a 2D grid read from a file.
+    Parses the puzzle input into a 2D grid.
+
+    The grid is padded with three rings of empty cells, so a four-letter word
+    starting anywhere on the grid can be read in every direction without
+    bounds checks.
 
     Args:
-    file_path (str): Path to the input file containing the grid.
+    text (str): The puzzle input.
 
     Returns:
-    tuple: (XMAS count, X-MAS count)
+    Grid: The grid.
     """
-    # Read the grid from the input file
-    with open(file_path, 'r') as f:
-        grid = [line.strip() for line in f.readlines()]
-
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Count XMAS occurrences
-    word = "XMAS"
-    word_length = len(word)
-    directions = [
-        (0, 1),  # Horizontal right
-        (0, -1),  # Horizontal left
-        (1, 0),  # Vertical down
-        (-1, 0),  # Vertical up
-        (1, 1),  # Diagonal down-right
-        (-1, -1),  # Diagonal up-left
-        (1, -1),  # Diagonal down-left
-        (-1, 1)  # Diagonal up-right
-    ]
-
-    def is_valid_word(x, y, dx, dy):
-        """Checks if a word fits starting at (x, y) in the direction (dx, dy)."""
-        for i in range(word_length):
-            nx, ny = x + i * dx, y + i * dy
-            if nx < 0 or ny < 0 or nx >= rows or ny >= cols or grid[nx][ny] != word[i]:
-                return False
-        return True
+    return Grid.parse(text, pad=3)
+
+
+def part1(grid):
+    """
+    Counts occurrences of the XMAS word in the grid.
+
+    Args:
+    grid (Grid): The grid.
+
+    Returns:
+    int: XMAS count
+    """
+    cells = grid.cells
+    x, m, a, s = b"XMAS"
 
+    # Count XMAS occurrences in all 8 directions from every X
     xmas_count = 0
-    for row in range(rows):
-        for col in range(cols):
-            for dx, dy in directions:
-                if is_valid_word(row, col, dx, dy):
-                    xmas_count += 1
-
-    # Count X-MAS occurrences
-    def is_valid_xmas(x, y):
-        """Checks if an X-MAS pattern exists centered at (x, y)."""
-        # Ensure the 3x3 grid around (x, y) is within bounds
-        if x - 1 < 0 or x + 1 >= rows or y - 1 < 0 or y + 1 >= cols:
-            return False
-
-        # Check the "X" diagonals and vertical components
-        top_left = grid[x - 1][y - 1]
-        bottom_right = grid[x + 1][y + 1]
-        top_right = grid[x - 1][y + 1]
-        bottom_left = grid[x + 1][y - 1]
-        center = grid[x][y]
-
-        return (
-            # MAS in the top-left to bottom-right diagonal
-                (top_left == "M" and center == "A" and bottom_right == "S") or
-                (top_left == "S" and center == "A" and bottom_right == "M")
-        ) and (
-            # MAS in the top-right to bottom-left diagonal
-                (top_right == "M" and center == "A" and bottom_left == "S") or
-                (top_right == "S" and center == "A" and bottom_left == "M")
-        )
+    for start in grid.positions("X"):
+        for step in grid.dirs8:
+            if (cells[start + step] == m and cells[start + 2 * step] == a
+                    and cells[start + 3 * step] == s):
+                xmas_count += 1
+
+    return xmas_count
+
+
+def part2(grid):
+    """
+    Counts occurrences of the X-MAS pattern in the grid.
+
+    Args:
+    grid (Grid): The grid.
+
+    Returns:
+    int: X-MAS count
+    """
+    cells = grid.cells
+    _, up_right, _, down_right, _, down_left, _, up_left = grid.dirs8
+    # Over the letters X, M, A, S and the padding, only an M and an S add up to this
+    m_plus_s = ord("M") + ord("S")
 
+    # Count X-MAS occurrences centered on every A; both diagonals must read MAS or SAM
     x_mas_count = 0
-    for row in range(rows):
-        for col in range(cols):
-            if is_valid_xmas(row, col):
-                x_mas_count += 1
+    for center in grid.positions("A"):
+        if (cells[center + up_left] + cells[center + down_right] == m_plus_s
+                and cells[center + up_right] + cells[center + down_left] == m_plus_s):
+            x_mas_count += 1
 
-    return xmas_count, x_mas_count
+    return x_mas_count
 
 
-# Specify the path to the input file
-file_path = "input.txt"
+if __name__ == "__main__":
+    # Specify the path to the input file
+    file_path = "input.txt"
+
+    # Read the grid from the input file
+    with open(file_path, 'r') as f:
+        grid = parse(f.read())
 
-# Count occurrences of XMAS and X-MAS
-result_xmas, result_x_mas = count_xmas_and_xmas_occurrences(file_path)
-print("Total occurrences of XMAS:", result_xmas)
-print("Total occurrences of X-MAS:", result_x_mas)
+    # Count occurrences of XMAS and X-MAS
+    print("Total occurrences of XMAS:", part1(grid))
+    print("Total occurrences of X-MAS:", part2(grid))
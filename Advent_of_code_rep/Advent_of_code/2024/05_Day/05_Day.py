@@ -1,17 +1,51 @@
-def parse_input(input_file):
+SAMPLE = """\
+47|53
+97|13
+97|61
+97|47
+75|29
+61|13
+75|53
+29|13
+97|29
+53|29
+61|53
+97|53
+61|29
+47|13
+75|47
+97|75
+47|61
+75|61
+47|29
+75|13
+53|13
+
+75,47,61,53,29
+97,61,53,29,13
+75,29,13
+75,97,47,61,53
+61,13,29
+97,13,75,29,47
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 143, "part2": 123}
+
+
+def parse(text):
     """
-    Parse the input file into rules and updates.
+    Parse the puzzle input into rules and updates.
 
     Args:
-        input_file (str): Path to the input file.
+        text (str): The puzzle input.
 
     Returns:
         tuple: A tuple containing:
             - rules (list of tuples): A list of (X, Y) rules indicating X|Y relationships.
             - updates (list of lists): A list of updates, each containing a list of page numbers.
     """
-    with open(input_file, 'r') as file:
-        data = file.read().strip()
+    data = text.strip()
     rules_section, updates_section = data.split("\n\n")
 
     # Parse rules
@@ -101,37 +135,51 @@ def reorder_update(update, rules):
     return sorted_update
 
 
-def calculate_updates(input_file):
+def part1(parsed):
     """
-    Calculate the sum of middle pages for valid and corrected updates.
+    Calculate the sum of middle pages for valid updates.
 
     Args:
-        input_file (str): Path to the input file.
+        parsed (tuple): The rules and updates returned by `parse`.
 
     Returns:
-        tuple: A tuple containing:
-            - valid_total_middle (int): Sum of middle pages for valid updates.
-            - invalid_total_middle (int): Sum of middle pages for corrected updates.
+        int: Sum of middle pages for valid updates.
     """
-    rules, updates = parse_input(input_file)
+    rules, updates = parsed
     valid_total_middle = 0
-    invalid_total_middle = 0
 
     for update in updates:
         if is_valid_update(update, rules):
-            # Valid updates
             valid_total_middle += middle_page(update)
-        else:
-            # Invalid updates
+
+    return valid_total_middle
+
+
+def part2(parsed):
+    """
+    Calculate the sum of middle pages for corrected updates.
+
+    Args:
+        parsed (tuple): The rules and updates returned by `parse`.
+
+    Returns:
+        int: Sum of middle pages for corrected updates.
+    """
+    rules, updates = parsed
+    invalid_total_middle = 0
+
+    for update in updates:
+        if not is_valid_update(update, rules):
             corrected_update = reorder_update(update, rules)
             invalid_total_middle += middle_page(corrected_update)
 
-    return valid_total_middle, invalid_total_middle
+    return invalid_total_middle
 
 
 # Specify the input file
 if __name__ == "__main__":
     input_file = "input.txt"
-    valid_total, invalid_total = calculate_updates(input_file)
-    print("Sum of middle pages from valid updates:", valid_total)
-    print("Sum of middle pages from corrected updates:", invalid_total)
+    with open(input_file, 'r') as file:
+        parsed = parse(file.read())
+    print("Sum of middle pages from valid updates:", part1(parsed))
+    print("Sum of middle pages from corrected updates:", part2(parsed))
@@ -1,30 +1,50 @@
-def parse_input(input_file):
+from Advent_of_code_rep.Advent_of_code.utils import counters
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+# Guard directions, in the clockwise order of `Grid.dirs4`
+DIRECTIONS = "^>v<"
+EMPTY, OBSTRUCTION, OUTSIDE = ord("."), ord("#"), ord("\0")
+
+# Peak traced memory allowed for any stage, enforced by the benchmark
+MEMORY_BUDGET = 16 * 2 ** 20
+
+SAMPLE = """\
+....#.....
+.........#
+..........
+..#.......
+.......#..
+..........
+.#..^.....
+........#.
+#.........
+......#...
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 41, "part2": 6}
+
+
+def parse(text):
     """
-    Parses the input file to extract the grid, guard's starting position, and direction.
+    Parses the puzzle input to extract the grid, guard's starting position, and direction.
 
     Args:
-        input_file (str): Path to the input file.
+        text (str): The puzzle input.
 
     Returns:
-        tuple: A tuple containing the grid (list of lists),
-               guard's starting position (tuple of x, y),
-               and the direction the guard is facing (str).
+        tuple: A tuple containing the grid (Grid),
+               guard's starting position (flat index into the grid),
+               and the direction the guard is facing (index into `DIRECTIONS`).
     """
-    with open(input_file, 'r') as file:
-        lines = file.read().splitlines()
-
-    grid = [list(line) for line in lines]
-    guard_position = None
-    direction = None
-
-    for y, row in enumerate(grid):
-        for x, char in enumerate(row):
-            if char in "^v<>":
-                guard_position = (x, y)
-                direction = char
-                grid[y][x] = '.'  # Replace the guard's starting position with an empty space
-                break
-        if guard_position:
+    grid = Grid.parse(text)
+    guard_position = direction = None
+
+    for char in DIRECTIONS:
+        guard_position = grid.find(char)
+        if guard_position != -1:
+            direction = DIRECTIONS.index(char)
+            grid.cells[guard_position] = EMPTY  # Replace the guard's starting position with an empty space
             break
 
     return grid, guard_position, direction
@@ -35,142 +55,149 @@ def turn_right(direction):
     Determines the new direction after a 90-degree right turn.
 
     Args:
-        direction (str): Current direction ('^', 'v', '<', '>').
+        direction (int): Current direction, an index into `DIRECTIONS`.
 
     Returns:
-        str: New direction after the turn.
+        int: New direction after the turn.
     """
-    return {
-        '^': '>',
-        '>': 'v',
-        'v': '<',
-        '<': '^',
-    }[direction]
+    return (direction + 1) % 4
 
 
-def move_forward(position, direction):
+def move_forward(grid, position, direction):
     """
     Calculates the new position after moving one step forward.
 
     Args:
-        position (tuple): Current position as (x, y).
-        direction (str): Current direction ('^', 'v', '<', '>').
+        grid (Grid): The map of the lab.
+        position (int): Current position as a flat index.
+        direction (int): Current direction, an index into `DIRECTIONS`.
 
     Returns:
-        tuple: New position as (x, y).
+        int: New position as a flat index.
+    """
+    return position + grid.dirs4[direction]
+
+
+def count_simulation(path_history):
     """
-    x, y = position
-    if direction == '^':
-        return (x, y - 1)
-    elif direction == 'v':
-        return (x, y + 1)
-    elif direction == '<':
-        return (x - 1, y)
-    elif direction == '>':
-        return (x + 1, y)
+    Records one simulation and its steps in the work counters.
+
+    Every step adds one state to the path history, so the steps are counted
+    once the simulation is over rather than in its loop.
+    """
+    counters.count("guard.simulations")
+    counters.count("guard.steps", len(path_history))
 
 
 def simulate_guard(grid, guard_position, direction, obstruction=None):
     """
     Simulates the guard's movement and determines the visited positions.
 
+    States are encoded as `position * 4 + direction`, so the loop detection
+    works on plain ints instead of (position, direction) tuples.
+
     Args:
-        grid (list of list of str): The map of the lab.
-        guard_position (tuple): Guard's starting position as (x, y).
-        direction (str): Guard's initial direction.
-        obstruction (tuple, optional): Position of a new obstruction to temporarily place. Defaults to None.
+        grid (Grid): The map of the lab.
+        guard_position (int): Guard's starting position as a flat index.
+        direction (int): Guard's initial direction.
+        obstruction (int, optional): Position of a new obstruction to temporarily place. Defaults to None.
 
     Returns:
         tuple: A set of visited positions and a boolean indicating if a loop was detected.
     """
+    cells = grid.cells
     visited_positions = set()
     path_history = set()
     current_position = guard_position
     current_direction = direction
 
     # Temporarily place the obstruction if provided
-    if obstruction:
-        x, y = obstruction
-        grid[y][x] = '#'
+    if obstruction is not None:
+        cells[obstruction] = OBSTRUCTION
 
     while True:
         visited_positions.add(current_position)
-        state = (current_position, current_direction)
+        state = current_position * 4 + current_direction
 
         if state in path_history:
             # Loop detected
-            if obstruction:
-                grid[obstruction[1]][obstruction[0]] = '.'
+            if obstruction is not None:
+                cells[obstruction] = EMPTY
+            count_simulation(path_history)
             return visited_positions, True
         path_history.add(state)
 
-        next_position = move_forward(current_position, current_direction)
-        x, y = next_position
+        next_position = move_forward(grid, current_position, current_direction)
 
-        if x < 0 or x >= len(grid[0]) or y < 0 or y >= len(grid):
+        if cells[next_position] == OUTSIDE:
             # Guard left the map
             break
 
-        if grid[y][x] == '#':
+        if cells[next_position] == OBSTRUCTION:
             current_direction = turn_right(current_direction)
         else:
             current_position = next_position
 
     # Remove obstruction if it was placed
-    if obstruction:
-        grid[obstruction[1]][obstruction[0]] = '.'
+    if obstruction is not None:
+        cells[obstruction] = EMPTY
 
+    count_simulation(path_history)
     return visited_positions, False
 
 
-def part_one(input_file):
+def part1(parsed):
     """
     Solves Part 1 by predicting the guard's patrol path and counting distinct visited positions.
 
     Args:
-        input_file (str): Path to the input file.
+        parsed (tuple): The grid, guard's starting position and direction returned by `parse`.
 
     Returns:
         int: The number of distinct positions visited by the guard.
     """
-    grid, guard_position, direction = parse_input(input_file)
+    grid, guard_position, direction = parsed
     visited_positions, _ = simulate_guard(grid, guard_position, direction)
     return len(visited_positions)
 
 
-def part_two(input_file):
+def part2(parsed):
     """
     Solves Part 2 by finding the number of positions where adding an obstruction causes a loop.
 
     Args:
-        input_file (str): Path to the input file.
+        parsed (tuple): The grid, guard's starting position and direction returned by `parse`.
 
     Returns:
         int: The number of positions that can cause the guard to loop.
     """
-    grid, guard_position, direction = parse_input(input_file)
+    grid, guard_position, direction = parsed
+    grid = grid.copy()  # Obstructions are placed on a copy of the map
     possible_positions = set()
 
     # Precompute the guard's path without obstructions
     initial_visited, _ = simulate_guard(grid, guard_position, direction)
 
-    for x, y in initial_visited:
-        if grid[y][x] == '.' and (x, y) != guard_position:
-            # Simulate with obstruction at (x, y)
-            _, is_loop = simulate_guard(grid, guard_position, direction, obstruction=(x, y))
+    for position in initial_visited:
+        if grid.cells[position] == EMPTY and position != guard_position:
+            # Simulate with obstruction at this position
+            _, is_loop = simulate_guard(grid, guard_position, direction, obstruction=position)
             if is_loop:
-                possible_positions.add((x, y))
+                possible_positions.add(position)
 
     return len(possible_positions)
 
 
-# Specify the input file
-input_file = "input.txt"
+if __name__ == "__main__":
+    # Specify the input file
+    input_file = "input.txt"
+    with open(input_file, 'r') as file:
+        parsed = parse(file.read())
 
-# Solve Part 1
-part_one_result = part_one(input_file)
-print("Part 1 - Distinct positions visited by the guard:", part_one_result)
+    # Solve Part 1
+    part_one_result = part1(parsed)
+    print("Part 1 - Distinct positions visited by the guard:", part_one_result)
 
-# Solve Part 2
-part_two_result = part_two(input_file)
-print("Part 2 - Positions causing a loop:", part_two_result)
+    # Solve Part 2
+    part_two_result = part2(parsed)
+    print("Part 2 - Positions causing a loop:", part_two_result)
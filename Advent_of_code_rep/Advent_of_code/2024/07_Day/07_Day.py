@@ -1,5 +1,23 @@
+from functools import partial
 from itertools import product
 
+from Advent_of_code_rep.Advent_of_code.utils import counters, loader
+
+SAMPLE = """\
+190: 10 19
+3267: 81 40 27
+83: 17 5
+156: 15 6
+7290: 6 8 6 15
+161011: 16 10 13
+192: 17 8 14
+21037: 9 7 18 13
+292: 11 6 16 20
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 3749, "part2": 11387}
+
 
 def parse_equation(equation):
     """Parse a single equation into the target value and a list of numbers."""
@@ -18,12 +36,23 @@ def evaluate_left_to_right_basic(numbers, operators):
     return result
 
 
+def combinations_tried(operators, operators_to_try):
+    """Position (counted from 1) of `operators` in the order `product` tries the combinations."""
+    position = 0
+    for op in operators:
+        position = position * len(operators_to_try) + operators_to_try.index(op)
+    return position + 1
+
+
 def is_solvable_basic(target, numbers):
     """Check if a target value can be achieved using only + and * operators."""
     num_operators = len(numbers) - 1
     for operators in product("+*", repeat=num_operators):
         if evaluate_left_to_right_basic(numbers, operators) == target:
+            if counters.enabled():
+                counters.count("basic.combinations", combinations_tried(operators, "+*"))
             return True
+    counters.count("basic.combinations", 2 ** num_operators)
     return False
 
 
@@ -55,29 +84,53 @@ def is_solvable_extended(target, numbers):
 
     for operators in product(operators_to_try, repeat=num_operators):
         if evaluate_with_operators(numbers, operators) == target:
+            if counters.enabled():
+                counters.count("extended.combinations", combinations_tried(operators, operators_to_try))
             return True
+    counters.count("extended.combinations", 3 ** num_operators)
     return False
 
 
-# Read the input equations from a file
-input_file = "input.txt"
-with open(input_file, "r") as file:
-    equations = file.readlines()
+def parse(text):
+    """Parse every equation of the puzzle input."""
+    return [parse_equation(equation.strip()) for equation in loader.lines(text) if equation.strip()]
+
+
+def calibration_value(equation, extended=False):
+    """Target of an equation line if the operators can produce it, 0 otherwise."""
+    target, numbers = parse_equation(equation)
+    is_solvable = is_solvable_extended if extended else is_solvable_basic
+    return target if is_solvable(target, numbers) else 0
+
+
+# Contribution of a single input line to each part's sum, used by `harness.stream`
+PER_LINE = {"part1": calibration_value, "part2": partial(calibration_value, extended=True)}
+
+
+def part1(equations):
+    """Total calibration result using only + and * operators."""
+    total_calibration_result_basic = 0
+    for target, numbers in equations:
+        if is_solvable_basic(target, numbers):
+            total_calibration_result_basic += target
+    return total_calibration_result_basic
 
-# Compute the total calibration results for both methods
-total_calibration_result_basic = 0
-total_calibration_result_extended = 0
 
-for equation in equations:
-    target, numbers = parse_equation(equation.strip())
+def part2(equations):
+    """Total calibration result using +, * and || operators."""
+    total_calibration_result_extended = 0
+    for target, numbers in equations:
+        if is_solvable_extended(target, numbers):
+            total_calibration_result_extended += target
+    return total_calibration_result_extended
 
-    # Check with basic operators (+, *)
-    if is_solvable_basic(target, numbers):
-        total_calibration_result_basic += target
 
-    # Check with extended operators (+, *, ||)
-    if is_solvable_extended(target, numbers):
-        total_calibration_result_extended += target
+if __name__ == "__main__":
+    # Read the input equations from a file
+    input_file = "input.txt"
+    with open(input_file, "r") as file:
+        equations = parse(file.read())
 
-print(f"Total calibration result (basic operators): {total_calibration_result_basic}")
-print(f"Total calibration result (extended operators): {total_calibration_result_extended}")
+    # Compute the total calibration results for both methods
+    print(f"Total calibration result (basic operators): {part1(equations)}")
+    print(f"Total calibration result (extended operators): {part2(equations)}")
@@ -1,5 +1,23 @@
 from collections import defaultdict
 
+SAMPLE = """\
+............
+........0...
+.....0......
+.......0....
+....0.......
+......A.....
+............
+............
+........A...
+.........A..
+............
+............
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 14, "part2": 34}
+
 
 def get_antennas(grid):
     """
@@ -37,9 +55,22 @@ def on_grid(node, n_rows, n_cols):
     return 0 <= node[0] < n_rows and 0 <= node[1] < n_cols
 
 
-def main():
+def parse(text):
     """
-    Main function to compute the number of unique antinodes based on a given grid.
+    Parse the puzzle input into a grid.
+
+    Args:
+        text (str): The puzzle input.
+
+    Returns:
+        list of str: A list of strings representing the grid.
+    """
+    return [line.strip() for line in text.splitlines()]  # Strip whitespace and read lines into a list
+
+
+def get_antinodes(grid):
+    """
+    Compute the antinodes created by every pair of antennas in the grid.
 
     Part 1:
         - Identify antinodes (potential connections) that are reachable by moving in the
@@ -48,11 +79,14 @@ def main():
     Part 2:
         - Additionally identify all intermediate antinodes that can be visited along the
           path from one antenna to another.
+
+    Args:
+        grid (list of str): A list of strings representing the grid.
+
+    Returns:
+        tuple: The set of Part 1 antinodes and the set of additional Part 2 antinodes.
     """
-    # Read the grid from input.txt
-    with open("input.txt", "rt") as f:
-        grid = [line.strip() for line in f]  # Strip whitespace and read lines into a list
-        n_rows, n_cols = len(grid), len(grid[0])  # Get grid dimensions
+    n_rows, n_cols = len(grid), len(grid[0])  # Get grid dimensions
 
     # Get the coordinates of all antennas grouped by their identifiers
     antennas = get_antennas(grid)
@@ -102,10 +136,24 @@ def main():
                     ):
                         antinodes_part2.add(antinode)  # Add to Part 2
 
-    # Output results
-    print(f"Part 1: {len(antinodes_part1)}")  # Unique antinodes for Part 1
-    print(f"Part 2: {len(antinodes_part1 | antinodes_part2)}")  # Union of both sets
+    return antinodes_part1, antinodes_part2
+
+
+def part1(grid):
+    antinodes_part1, _ = get_antinodes(grid)
+    return len(antinodes_part1)  # Unique antinodes for Part 1
+
+
+def part2(grid):
+    antinodes_part1, antinodes_part2 = get_antinodes(grid)
+    return len(antinodes_part1 | antinodes_part2)  # Union of both sets
 
 
 if __name__ == "__main__":
-    main()
+    # Read the grid from input.txt
+    with open("input.txt", "rt") as f:
+        grid = parse(f.read())
+
+    # Output results
+    print(f"Part 1: {part1(grid)}")
+    print(f"Part 2: {part2(grid)}")
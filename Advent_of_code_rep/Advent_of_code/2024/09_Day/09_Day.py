@@ -1,3 +1,14 @@
+# Peak traced memory allowed for any stage, enforced by the benchmark
+MEMORY_BUDGET = 32 * 2 ** 20
+
+SAMPLE = """\
+2333133121414131402
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 1928, "part2": 2858}
+
+
 class DiskCompactor:
     _free_space = "."
     _expanded_disk_map = None
@@ -98,6 +109,18 @@ class DiskCompactor:
         )
 
 
+def parse(text):
+    return DiskCompactor("".join(ln.strip() for ln in text.splitlines()))
+
+
+def part1(compactor):
+    return compactor.compacted_checksum()
+
+
+def part2(compactor):
+    return compactor.compacted_checksum(allow_fragmented_files=False)
+
+
 def get_lines(test=False):
     with open(("test" if test else "input") + ".txt") as file:
         for ln in file:
@@ -105,6 +128,6 @@ def get_lines(test=False):
 
 
 if __name__ == "__main__":
-    compactor = DiskCompactor("".join(get_lines()))
-    print("1:", compactor.compacted_checksum())
-    print("2:", compactor.compacted_checksum(allow_fragmented_files=False))
\ No newline at end of file
+    compactor = parse("\n".join(get_lines()))
+    print("1:", part1(compactor))
+    print("2:", part2(compactor))
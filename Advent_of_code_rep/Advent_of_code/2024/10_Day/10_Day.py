@@ -1,150 +1,167 @@
 from collections import deque
 
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+from Advent_of_code_rep.Advent_of_code.utils.memo import memoize
 
-def read_input():
+SUMMIT = ord("9")
+
+
+SAMPLE = """\
+89010123
+78121874
+87430965
+96549874
+45678903
+32019012
+01329801
+10456732
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 36, "part2": 81}
+
+
+def parse(text):
     """
-    Reads the input file `input.txt` and parses it into a 2D list of integers.
+    Parses the puzzle input into a grid of height digits.
+
+    Args:
+        text (str): The puzzle input.
 
     Returns:
-        list[list[int]]: A grid representing the topographic map, where each integer
-        represents the height at that position.
+        Grid: The topographic map; each cell holds the height as the digit
+        characters '0' to '9', so climbing one step is adding 1 to the byte.
     """
-    with open('input.txt', 'r') as file:
-        return [[int(x) for x in line.strip()] for line in file]
+    return Grid.parse(text)
 
 
-def get_neighbors(x, y, grid):
+def get_uphill_neighbors(position, grid):
     """
-    Computes the valid neighbors of a given position (x, y) in the grid.
+    Computes the neighbors of a given position that are exactly one step higher.
+
+    The grid is padded, so neighbors of edge cells land on padding cells, whose
+    value never matches a height.
 
     Args:
-        x (int): The x-coordinate of the current position.
-        y (int): The y-coordinate of the current position.
-        grid (list[list[int]]): The topographic grid.
+        position (int): The flat index of the current position.
+        grid (Grid): The topographic grid.
 
     Returns:
-        list[tuple[int, int]]: A list of (x, y) tuples representing valid neighboring positions.
+        list[int]: The flat indices of the neighboring positions one step higher.
     """
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
-    neighbors = []
-    height = len(grid)
-    width = len(grid[0])
+    cells = grid.cells
+    next_height = cells[position] + 1
+    return [position + step for step in grid.dirs4 if cells[position + step] == next_height]
 
-    for dx, dy in directions:
-        new_x, new_y = x + dx, y + dy
-        if 0 <= new_x < height and 0 <= new_y < width:
-            neighbors.append((new_x, new_y))
 
-    return neighbors
-
-
-def count_paths(start_x, start_y, grid):
+def summit_paths(grid):
     """
-    Counts all valid paths from a trailhead (height 0) to height 9,
-    where each step must increase in height by exactly 1.
+    Builds the memoized count of paths from a position up to any height 9.
+
+    The count only depends on the position, so one memo serves every
+    trailhead of the grid; it lives as long as the grid is being solved.
 
     Args:
-        start_x (int): The x-coordinate of the trailhead.
-        start_y (int): The y-coordinate of the trailhead.
-        grid (list[list[int]]): The topographic grid.
+        grid (Grid): The topographic grid.
 
     Returns:
-        int: The number of valid paths from the trailhead to a 9.
+        Memo: Maps a flat index to its number of valid paths to a 9.
     """
-    memo = {}  # Memoization to avoid redundant calculations
+    cells = grid.cells
 
-    def dfs(x, y, current_height):
+    @memoize(name="count_paths")
+    def dfs(position):
         """
         Depth-First Search helper to recursively count paths.
 
         Args:
-            x (int): Current x-coordinate.
-            y (int): Current y-coordinate.
-            current_height (int): Current height in the path.
+            position (int): Current flat index.
 
         Returns:
             int: Total paths from this position to a height of 9.
         """
-        if (x, y, current_height) in memo:
-            return memo[(x, y, current_height)]
-
-        if grid[x][y] == 9:  # Reached a height of 9
+        if cells[position] == SUMMIT:  # Reached a height of 9
             return 1
 
         total_paths = 0
 
-        for next_x, next_y in get_neighbors(x, y, grid):
-            next_height = grid[next_x][next_y]
-            if next_height == current_height + 1:
-                total_paths += dfs(next_x, next_y, next_height)
+        for next_position in get_uphill_neighbors(position, grid):
+            total_paths += dfs(next_position)
 
-        memo[(x, y, current_height)] = total_paths
         return total_paths
 
-    return dfs(start_x, start_y, 0)
+    return dfs
 
 
-def find_trailheads(grid):
+def count_paths(start, grid, paths=None):
     """
-    Identifies all trailheads (positions with height 0) in the grid.
+    Counts all valid paths from a trailhead (height 0) to height 9,
+    where each step must increase in height by exactly 1.
 
     Args:
-        grid (list[list[int]]): The topographic grid.
+        start (int): The flat index of the trailhead.
+        grid (Grid): The topographic grid.
+        paths (Memo, optional): The grid's `summit_paths`, to share across trailheads.
 
     Returns:
-        list[tuple[int, int]]: A list of (x, y) coordinates of trailheads.
+        int: The number of valid paths from the trailhead to a 9.
     """
-    trailheads = []
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 0:
-                trailheads.append((i, j))
-    return trailheads
+    if paths is None:
+        paths = summit_paths(grid)
+    return paths(start)
 
 
-def find_reachable_nines(start_x, start_y, grid):
+def find_trailheads(grid):
     """
-    Finds all reachable positions with height 9 from a trailhead (start_x, start_y).
+    Identifies all trailheads (positions with height 0) in the grid.
 
     Args:
-        start_x (int): The x-coordinate of the trailhead.
-        start_y (int): The y-coordinate of the trailhead.
-        grid (list[list[int]]): The topographic grid.
+        grid (Grid): The topographic grid.
 
     Returns:
-        set[tuple[int, int]]: A set of coordinates representing all reachable height-9 positions.
+        list[int]: The flat indices of the trailheads.
     """
-    visited, reachable_nines = set(), set()
-    queue = deque([(start_x, start_y, 0)])  # Queue stores (x, y, current height)
+    return grid.positions("0")
 
-    while queue:
-        x, y, current_height = queue.popleft()
 
-        if (x, y) in visited:
-            continue
+def find_reachable_nines(start, grid):
+    """
+    Finds all reachable positions with height 9 from a trailhead.
 
-        visited.add((x, y))
+    The search keeps its own visited set rather than a buffer the size of the
+    grid, so a trailhead only costs the positions it can reach.
 
-        if grid[x][y] == 9:
-            reachable_nines.add((x, y))
-            continue
+    Args:
+        start (int): The flat index of the trailhead.
+        grid (Grid): The topographic grid.
 
-        for next_x, next_y in get_neighbors(x, y, grid):
-            next_height = grid[next_x][next_y]
+    Returns:
+        set[int]: The flat indices of all reachable height-9 positions.
+    """
+    cells = grid.cells
+    visited, reachable_nines = {start}, set()
+    queue = deque([start])
 
-            if next_height == current_height + 1:
-                queue.append((next_x, next_y, next_height))
+    while queue:
+        position = queue.popleft()
+        if cells[position] == SUMMIT:
+            reachable_nines.add(position)
+            continue
+        for next_position in get_uphill_neighbors(position, grid):
+            if next_position not in visited:
+                visited.add(next_position)
+                queue.append(next_position)
 
     return reachable_nines
 
 
-def first_part(grid):
+def part1(grid):
     """
     Calculates the total score for the first part, which is the sum of all reachable
     height-9 positions from every trailhead.
 
     Args:
-        grid (list[list[int]]): The topographic grid.
+        grid (Grid): The topographic grid.
 
     Returns:
         int: Total score for the first part.
@@ -152,40 +169,43 @@ def first_part(grid):
     total_score = 0
     trailheads = find_trailheads(grid)
 
-    for x, y in trailheads:
-        reachable_nines = find_reachable_nines(start_x=x, start_y=y, grid=grid)
+    for start in trailheads:
+        reachable_nines = find_reachable_nines(start, grid)
         score = len(reachable_nines)
         total_score += score
 
     return total_score
 
 
-def second_part(grid):
+def part2(grid):
     """
     Calculates the total score for the second part, which is the total number
     of valid paths from all trailheads to height-9 positions.
 
     Args:
-        grid (list[list[int]]): The topographic grid.
+        grid (Grid): The topographic grid.
 
     Returns:
         int: Total score for the second part.
     """
     total = 0
     trailheads = find_trailheads(grid)
+    paths = summit_paths(grid)
 
-    for x, y in trailheads:
-        rating = count_paths(x, y, grid)
+    for start in trailheads:
+        rating = count_paths(start, grid, paths)
         total += rating
 
+    paths.report()
     return total
 
 
 if __name__ == "__main__":
-    grid = read_input()
+    with open('input.txt', 'r') as file:
+        grid = parse(file.read())
 
     # First part: Sum of reachable height-9 positions
-    print("First part result: " + str(first_part(grid)))
+    print("First part result: " + str(part1(grid)))
 
     # Second part: Total number of valid paths to height-9 positions
-    print("Second part result: " + str(second_part(grid)))
+    print("Second part result: " + str(part2(grid)))
@@ -1,6 +1,45 @@
 # Import necessary modules
 from collections import Counter
-from typing import Counter as CounterType
+from typing import Counter as CounterType, List, Tuple
+
+from Advent_of_code_rep.Advent_of_code.utils.memo import memoize
+
+SAMPLE = """\
+125 17
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 55312}
+
+
+# A stone always becomes the same stones, so the cache is kept for the whole
+# process: part 2 and later inputs reuse every transformation seen before.
+# An input meets about 4000 distinct stones over 75 blinks; the bound keeps a
+# long-lived process, such as the solver daemon, from growing it forever
+BLINK_CACHE_SIZE = 8192
+
+
+@memoize(maxsize=BLINK_CACHE_SIZE)
+def blink(stone: int) -> Tuple[int, ...]:
+    """
+    Transform a single stone according to the rules.
+
+    Parameters:
+        stone (int): The stone value.
+
+    Returns:
+        Tuple[int, ...]: The one or two stones it becomes.
+    """
+    if stone == 0:
+        # Rule 1: Replace 0 with 1
+        return (1,)
+    digits = str(stone)
+    if len(digits) % 2 == 0:
+        # Rule 2: Split stones with an even number of digits
+        half = len(digits) // 2
+        return int(digits[:half]), int(digits[half:])
+    # Rule 3: Multiply by 2024
+    return (stone * 2024,)
 
 def transform_stones_with_count(stones: CounterType[int]) -> CounterType[int]:
     """
@@ -14,36 +53,21 @@ def transform_stones_with_count(stones: CounterType[int]) -> CounterType[int]:
     """
     new_stones = Counter()
     for stone, count in stones.items():
-        if stone == 0:
-            # Rule 1: Replace 0 with 1
-            new_stones[1] += count
-        elif len(str(stone)) % 2 == 0:
-            # Rule 2: Split stones with an even number of digits
-            digits = str(stone)
-            half = len(digits) // 2
-            left, right = int(digits[:half]), int(digits[half:])
-            new_stones[left] += count
-            new_stones[right] += count
-        else:
-            # Rule 3: Multiply by 2024
-            new_stones[stone * 2024] += count
+        for new_stone in blink(stone):
+            new_stones[new_stone] += count
     return new_stones
 
-def simulate_blinks(file_path: str, blinks: int) -> int:
+def simulate_blinks(initial_stones: List[int], blinks: int) -> int:
     """
     Simulate the blinking process for a given number of iterations, using frequency counts.
 
     Parameters:
-        file_path (str): Path to the input file containing the initial stone arrangement.
+        initial_stones (List[int]): The initial stone arrangement.
         blinks (int): The number of times to blink.
 
     Returns:
         int: The number of stones after the specified number of blinks.
     """
-    # Read the initial arrangement from the file
-    with open(file_path, 'r') as file:
-        initial_stones = map(int, file.read().strip().split())
-
     # Initialize a Counter to track stone frequencies
     stone_counter = Counter(initial_stones)
 
@@ -51,9 +75,28 @@ def simulate_blinks(file_path: str, blinks: int) -> int:
     for _ in range(blinks):
         stone_counter = transform_stones_with_count(stone_counter)
 
+    blink.report()
     # Return the total count of stones
     return sum(stone_counter.values())
 
+def parse(text: str) -> List[int]:
+    """
+    Parse the initial stone arrangement.
+
+    Parameters:
+        text (str): The puzzle input.
+
+    Returns:
+        List[int]: The initial stones.
+    """
+    return [int(stone) for stone in text.strip().split()]
+
+def part1(stones: List[int]) -> int:
+    return simulate_blinks(stones, 25)
+
+def part2(stones: List[int]) -> int:
+    return simulate_blinks(stones, 75)
+
 # Example usage
 if __name__ == "__main__":
     # Specify the input file and number of blinks
@@ -61,9 +104,13 @@ if __name__ == "__main__":
     num_blinks = 25
     num_blinks2 = 75
 
+    # Read the initial arrangement from the file
+    with open(input_file, 'r') as file:
+        stones = parse(file.read())
+
     # Run the simulation
-    result = simulate_blinks(input_file, num_blinks)
-    result2 = simulate_blinks(input_file, num_blinks2)
+    result = simulate_blinks(stones, num_blinks)
+    result2 = simulate_blinks(stones, num_blinks2)
 
     # Output the result
     print(f"Number of stones after {num_blinks} blinks: {result}")
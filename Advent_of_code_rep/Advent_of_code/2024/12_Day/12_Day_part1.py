@@ -1,38 +1,59 @@
-import numpy as np
-
-with open('input.txt', 'r') as f:
-    lines = f.read().split('\n')
-
-rows = len(lines)
-cols = len(lines[0])
-garden = np.empty((rows, cols), dtype=int)
-for i, L in enumerate(lines):
-    for j, c in enumerate(L):
-        garden[i,j] = ord(c)
-
-total_cost = 0
-for i in range(rows):
-    for j in range(cols):
-        if garden[i,j] == ord('.'):
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+VISITED = ord('.')
+
+
+SAMPLE = """\
+RRRRIICCFF
+RRRRIICCCF
+VVRRRCCFFF
+VVRCCCJFFF
+VVVVCJJCFE
+VVIVCCJJEE
+VVIIICJJEE
+MIIIIIJJEE
+MIIISIJEEE
+MMMISSJEEE
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 1930}
+
+
+def parse(text):
+    return Grid.parse(text)
+
+
+def part1(garden):
+    garden = garden.copy()  # visited cells are overwritten with '.'
+    cells = garden.cells
+
+    total_cost = 0
+    for i in garden.indices():
+        if cells[i] == VISITED:
             continue
 
-        current_crop = garden[i,j]
-        cells_to_process = {(i,j)}
+        current_crop = cells[i]
+        cells_to_process = {i}
         current_region = set()
         perimeter = 0
         while cells_to_process:
             c = cells_to_process.pop()
-            for d in {(-1,0), (1,0), (0,-1), (0,1)}:
-                if (c[0] + d[0], c[1] + d[1]) in current_region:
+            for d in garden.dirs4:
+                if c + d in current_region:
                     pass
-                elif c[0] + d[0] < 0 or c[0] + d[0] >= rows \
-                    or c[1] + d[1] < 0 or c[1] + d[1] >= cols \
-                        or garden[c[0] + d[0], c[1] + d[1]] != current_crop:
+                elif cells[c + d] != current_crop:  # another crop or the padding
                     perimeter += 1
                 else:
-                    cells_to_process.add((c[0] + d[0], c[1] + d[1]))
+                    cells_to_process.add(c + d)
             current_region.add(c)
-            garden[c] = ord('.')
+            cells[c] = VISITED
         area = len(current_region)
         total_cost += perimeter * area
-print("Part 1 results= ",total_cost)
\ No newline at end of file
+    return total_cost
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'r') as f:
+        garden = parse(f.read())
+    print("Part 1 results= ", part1(garden))
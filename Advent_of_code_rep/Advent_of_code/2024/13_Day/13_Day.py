@@ -1,24 +1,46 @@
 from collections import namedtuple
-import re
 
-# Read the input file and strip trailing whitespaces from each line
-with open('input.txt') as f:
-    lines = [line.rstrip() for line in f]
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
 
 # Define a named tuple to represent each claw machine configuration
 Claw = namedtuple('Claw', ['button_a', 'button_b', 'prize'])
-claws = []
 
-# Parse the input file in chunks of 4 lines, corresponding to the button configurations and prize positions
-for i in range(0, len(lines) // 4 + 1):
-    # Extract button A configuration (e.g., "Button A: X+94, Y+34") using regex to find integers
-    a = tuple([int(x) for x in re.findall(r'\d+', lines[i * 4])])
-    # Extract button B configuration (e.g., "Button B: X+22, Y+67")
-    b = tuple([int(x) for x in re.findall(r'\d+', lines[i * 4 + 1])])
-    # Extract prize coordinates (e.g., "Prize: X=8400, Y=5400")
-    p = tuple([int(x) for x in re.findall(r'\d+', lines[i * 4 + 2])])
-    # Add the parsed data as a Claw object to the list of claws
-    claws.append(Claw(a, b, p))
+# The increment for Part 2 modifies prize positions significantly
+increase = 10000000000000
+
+
+SAMPLE = """\
+Button A: X+94, Y+34
+Button B: X+22, Y+67
+Prize: X=8400, Y=5400
+
+Button A: X+26, Y+66
+Button B: X+67, Y+21
+Prize: X=12748, Y=12176
+
+Button A: X+17, Y+86
+Button B: X+84, Y+37
+Prize: X=7870, Y=6450
+
+Button A: X+69, Y+23
+Button B: X+27, Y+71
+Prize: X=18641, Y=10279
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 480}
+
+
+def parse(text):
+    claws = []
+
+    # Every claw machine is 6 integers: button A (e.g., "Button A: X+94, Y+34"),
+    # button B (e.g., "Button B: X+22, Y+67") and the prize (e.g., "Prize: X=8400, Y=5400")
+    for ax, ay, bx, by, px, py in ints(text, width=6, signed=False).tolist():
+        # Add the parsed data as a Claw object to the list of claws
+        claws.append(Claw((ax, ay), (bx, by), (px, py)))
+
+    return claws
 
 
 # Function to find the minimum token cost to win the prize for a single claw machine
@@ -53,20 +75,21 @@ def find_solution(test_claw: Claw, incr=0):
         return 0
 
 
-# Initialize total costs for Part 1 and Part 2
-total_cost_1 = 0  # Part 1: original prize positions
-total_cost_2 = 0  # Part 2: prize positions adjusted by the increment
+# Part 1: original prize positions
+def part1(claws):
+    return sum(find_solution(this_claw) for this_claw in claws)
+
+
+# Part 2: prize positions adjusted by the increment
+def part2(claws):
+    return sum(find_solution(this_claw, increase) for this_claw in claws)
 
-# The increment for Part 2 modifies prize positions significantly
-increase = 10000000000000
 
-# Calculate total costs by iterating over all claw machines
-for this_claw in claws:
-    # Add the cost for this claw machine in Part 1 (no increment)
-    total_cost_1 += find_solution(this_claw)
-    # Add the cost for this claw machine in Part 2 (with increment)
-    total_cost_2 += find_solution(this_claw, increase)
+if __name__ == '__main__':
+    # Read the input file
+    with open('input.txt') as f:
+        claws = parse(f.read())
 
-# Print the results for Part 1 and Part 2
-print(f"Part 1: {total_cost_1}")  # Total cost for winning all prizes in Part 1
-print(f"Part 2: {total_cost_2}")  # Total cost for winning all prizes in Part 2
\ No newline at end of file
+    # Print the results for Part 1 and Part 2
+    print(f"Part 1: {part1(claws)}")  # Total cost for winning all prizes in Part 1
+    print(f"Part 2: {part2(claws)}")  # Total cost for winning all prizes in Part 2
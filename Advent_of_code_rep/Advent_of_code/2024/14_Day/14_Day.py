@@ -1,4 +1,4 @@
-import re
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
 
 test = False
 if test:
@@ -11,13 +11,9 @@ else:
     area_height = 103
 
 
-with open(filename) as f:
-    lines = [line.rstrip() for line in f]
-
-robots = []
-for this_line in lines:
-    robot_nums = [int(x) for x in re.findall('-?\d+', this_line)]
-    robots.append(robot_nums)
+def parse(text):
+    # Every robot line "p=px,py v=dx,dy" holds 4 integers
+    return ints(text, width=4).tolist()
 
 
 def get_quadrant(x: int, y: int):
@@ -41,35 +37,53 @@ def get_robot_position(bot: list, s: int):
     return px, py
 
 
-safety_scores = []
-for i in range(10000):
+def get_safety_score(robots: list, s: int):
     quadrants = [0, 0, 0, 0]
     for this_robot in robots:
-        bx, by = get_robot_position(this_robot, i)
+        bx, by = get_robot_position(this_robot, s)
         q = get_quadrant(bx, by)
         if q is not None:
             quadrants[q] += 1
     safety_score = 1
     for q in quadrants:
         safety_score *= q
-    safety_scores.append(safety_score)
-    if i == 100:
-        print(f"Part 1: {safety_score}")
-
-# Guess: the picture will have a minimum safety score because lots of robots will be grouped together
-min_safety = safety_scores.index(min(safety_scores))
-
-# Print the picture, for fun (and confirmation)
-tree_picture = set()
-for this_robot in robots:
-    tree_picture.add(get_robot_position(this_robot, min_safety))
-for this_y in range(area_height):
-    print_line = ''
-    for this_x in range(area_width):
-        if (this_x, this_y) in tree_picture:
-            print_line += '🟢'
-        else:
-            print_line += '⬜'
-    print(print_line)
-
-print(f"Part 2: {min_safety}")
\ No newline at end of file
+    return safety_score
+
+
+def part1(robots: list):
+    return get_safety_score(robots, 100)
+
+
+def part2(robots: list):
+    safety_scores = [get_safety_score(robots, i) for i in range(10000)]
+
+    # Guess: the picture will have a minimum safety score because lots of robots will be grouped together
+    return safety_scores.index(min(safety_scores))
+
+
+def print_picture(robots: list, s: int):
+    tree_picture = set()
+    for this_robot in robots:
+        tree_picture.add(get_robot_position(this_robot, s))
+    for this_y in range(area_height):
+        print_line = ''
+        for this_x in range(area_width):
+            if (this_x, this_y) in tree_picture:
+                print_line += '🟢'
+            else:
+                print_line += '⬜'
+        print(print_line)
+
+
+if __name__ == '__main__':
+    with open(filename) as f:
+        robots = parse(f.read())
+
+    print(f"Part 1: {part1(robots)}")
+
+    min_safety = part2(robots)
+
+    # Print the picture, for fun (and confirmation)
+    print_picture(robots, min_safety)
+
+    print(f"Part 2: {min_safety}")
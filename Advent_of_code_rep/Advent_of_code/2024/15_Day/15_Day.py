@@ -1,132 +1,149 @@
-
 import argparse
-
-
-DIRECTION_MAP = {
-    '^': (-1, 0),
-    '>': (0, 1),
-    'v': (1, 0),
-    '<': (0, -1),
-}
-
-
-def read_input(filename):
-    """ read_input returns a grid as a list of strings, and steps as a string """
-    with open(filename, 'r') as file:
-        grid = []
-        steps = []
-        for line in file:
-            if len(line) == 1:
-                break
-            grid.append(line.strip())
-        for line in file:
-            steps.append(line.strip())
+from collections import deque
+
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+EMPTY, WALL, BOX, ROBOT = ord('.'), ord('#'), ord('O'), ord('@')
+BOX_LEFT, BOX_RIGHT = ord('['), ord(']')
+
+
+SAMPLE = """\
+##########
+#..O..O.O#
+#......O.#
+#.OO..O.O#
+#..O@..O.#
+#O#..O...#
+#O..O..O.#
+#.OO.O.OO#
+#....O...#
+##########
+
+<vv>^<v^>v>^vv^v>v<>v^v<v<^vv<<<^><<><>>v<vvv<>^v^>^<<<><<v<<<v^vv^v>^
+vvv<<^>^v^^><<>>><>^<<><^vv^^<>vvv<>><^^v>^>vv<>v<<<<v<^v>^<^^>>>^<v<v
+><>vv>v^v^<>><>>>><^^>vv>v<^^^>>v^v^<^^>v^^>v^<^v>v<>>v^v^<v>v^^<^^vv<
+<<v<^>>^^^^>>>v^<>vvv^><v<<<>^^^vv^<vvv>^>v<^^^^v<>^>vvvv><>>v^<<^^^^^
+^><^><>>><>^^<<^^v>>><^<v>^<vv>>v>>>^v><>^v><<<<v>>v<v<v>vvv>^<><<>^><
+^>><>^v<><^vvv<^^<><v<<<<<><^v<<<><<<^^<v<^^^><^>>^<v^><<<^>>^v<v^v<v^
+>^>>^v>vv>^<<^v<>><<><<v<<v><>v<^vv<<<>^^v^>^^>>><<^v>>v^v><^^>>^<>vv^
+<><^^>^^^<><vvvvv^v<v<<>^v<v>v<<^><<><<><<<^^<<<^<<>><<><^^^>^^<>^>v<>
+^^>vv<^v^v<vv>^<><v<^v>^^^>>>^^vvv^>vvv<>>>^<^>>>>>^<<^v>^vvv<>^<><<v>
+v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 10092, "part2": 9021}
+
+
+def parse(text):
+    """ parse returns the warehouse as a Grid, and steps as a string """
+    grid_section, _, steps_section = text.partition("\n\n")
+    grid = Grid.parse(grid_section)
+    steps = [line.strip() for line in steps_section.splitlines()]
     return grid, ''.join(steps)
 
 
-def analyze_grid_str(grid_str):
-    """ analyze_grid returns a list of character lists, and starting position"""
-    start_pos = None
-    for r, row in enumerate(grid_str):
-        c = row.find('@')
-        if c != -1:
-            start_pos = (r, c)
-            break
+def direction_offsets(grid):
+    """ direction_offsets maps every step character to its flat offset in the grid """
+    up, right, down, left = grid.dirs4
+    return {'^': up, '>': right, 'v': down, '<': left}
 
-    return [list(row) for row in grid_str], start_pos
 
-
-def expand_grid_str(grid_str):
+def expand_grid(grid):
     new_grid = []
-    for row in grid_str:
+    for row in grid.lines():
         line = row
         line = line.replace("#", "##")
         line = line.replace("O", "[]")
         line = line.replace(".", "..")
         line = line.replace("@", "@.")
         new_grid.append(line)
-    return new_grid
+    return Grid(new_grid, grid.pad)
 
 
 def calculate_gps_sum(grid):
     total = 0
-    for r, row in enumerate(grid):
-        for c, cell in enumerate(row):
-            if cell == 'O' or cell == '[':
-                total += (100 * r) + c
+    for box in grid.positions('O') + grid.positions('['):
+        r, c = grid.coords(box)
+        total += (100 * r) + c
     return total
 
 
-def part1(grid_str, steps):
-    grid, start_pos = analyze_grid_str(grid_str)
-    r, c = start_pos
+def part1(parsed):
+    grid, steps = parsed
+    grid = grid.copy()
+    cells = grid.cells
+    offsets = direction_offsets(grid)
+    pos = grid.find('@')
     for step in steps:
-        d = DIRECTION_MAP[step]
-        nr, nc = r + d[0], c + d[1]
+        d = offsets[step]
+        n = pos + d
 
-        if grid[nr][nc] == '#':
+        if cells[n] == WALL:
             continue
-        if grid[nr][nc] == '.':
-            grid[r][c] = '.'
-            grid[nr][nc] = '@'
-            r, c = nr, nc
+        if cells[n] == EMPTY:
+            cells[pos] = EMPTY
+            cells[n] = ROBOT
+            pos = n
             continue
 
         # Scan in direction until we hit "." or "#"
-        peek_r, peek_c = nr + d[0], nc + d[1]
-        while grid[peek_r][peek_c] != '.' and grid[peek_r][peek_c] != '#':
-            peek_r, peek_c = peek_r + d[0], peek_c + d[1]
+        peek = n + d
+        while cells[peek] != EMPTY and cells[peek] != WALL:
+            peek += d
 
-        if grid[peek_r][peek_c] == '.':
-            grid[peek_r][peek_c] = 'O'
-            grid[r][c] = '.'
-            grid[nr][nc] = '@'
-            r, c = nr, nc
+        if cells[peek] == EMPTY:
+            cells[peek] = BOX
+            cells[pos] = EMPTY
+            cells[n] = ROBOT
+            pos = n
 
     return calculate_gps_sum(grid)
 
 
-def part2(grid_str, steps):
-
-    expanded_grid_str = expand_grid_str(grid_str)
-    grid, start_pos = analyze_grid_str(expanded_grid_str)
+def part2(parsed):
+    grid, steps = parsed
+    grid = expand_grid(grid)
+    cells = grid.cells
+    offsets = direction_offsets(grid)
+    horizontal = {offsets['<'], offsets['>']}
 
-    r, c = start_pos
+    pos = grid.find('@')
     for step in steps:
-        d = DIRECTION_MAP[step]
-        nr, nc, = r + d[0], c + d[1]
+        d = offsets[step]
+        n = pos + d
 
         # Immediately blocked
-        if grid[nr][nc] == '#':
+        if cells[n] == WALL:
             continue
 
         # Simple left/right case
-        if grid[nr][nc] == '.':
-            grid[r][c] = '.'
-            grid[nr][nc] = '@'
-            r, c = nr, nc
+        if cells[n] == EMPTY:
+            cells[pos] = EMPTY
+            cells[n] = ROBOT
+            pos = n
             continue
 
         # Special cases
         ##################
-        if d[1] != 0:  # Push box(es) left/right
-            peek_c = nc
+        if d in horizontal:  # Push box(es) left/right
+            peek = n
 
             # Peek until we see a blank space or a wall
-            while grid[r][peek_c] != '.' and grid[r][peek_c] != '#':
-                peek_c += d[1]
+            while cells[peek] != EMPTY and cells[peek] != WALL:
+                peek += d
 
             # Boxes are flush against a wall, no movement
-            if grid[r][peek_c] == '#':
+            if cells[peek] == WALL:
                 continue
 
             # If we hit an open space, shift the previous cells 1 unit over
-            shift_c = peek_c
-            while shift_c != c - d[1]:
-                grid[r][shift_c] = grid[r][shift_c - d[1]]
-                shift_c -= d[1]
-            grid[r][c] = '.'
-            c = nc
+            shift = peek
+            while shift != pos - d:
+                cells[shift] = cells[shift - d]
+                shift -= d
+            cells[pos] = EMPTY
+            pos = n
 
         else:  # Vertically shift boxes
 
@@ -135,43 +152,37 @@ def part2(grid_str, steps):
                     This returns a dictionary of pieces that are valid to shift
                     otherwise None
                 """
-                queue = []
-                queue.append((r, c))
-                visited = {}
-                visited[(nr, nc)] = grid[nr][nc]
+                queue = deque([pos])
+                visited = {n: cells[n]}
                 while queue:
-                    cur_r, cur_c = queue.pop(0)
-                    peek_r, peek_c = cur_r + d[0], cur_c + d[1]
+                    peek = queue.popleft() + d
 
-                    if grid[peek_r][peek_c] == '#':
+                    if cells[peek] == WALL:
                         return None
-                    if grid[peek_r][peek_c] == '.':
+                    if cells[peek] == EMPTY:
                         continue
 
-                    visited[(peek_r, peek_c)
-                            ] = grid[peek_r][peek_c]
-                    if grid[peek_r][peek_c] == '[':
-                        queue.append((peek_r, peek_c))
-                        queue.append((peek_r, peek_c + 1))
-                        visited[(peek_r, peek_c + 1)
-                                ] = grid[peek_r][peek_c + 1]
-                    elif grid[peek_r][peek_c] == ']':
-                        queue.append((peek_r, peek_c))
-                        queue.append((peek_r, peek_c - 1))
-                        visited[(peek_r, peek_c - 1)
-                                ] = grid[peek_r][peek_c - 1]
+                    visited[peek] = cells[peek]
+                    if cells[peek] == BOX_LEFT:
+                        queue.append(peek)
+                        queue.append(peek + 1)
+                        visited[peek + 1] = cells[peek + 1]
+                    elif cells[peek] == BOX_RIGHT:
+                        queue.append(peek)
+                        queue.append(peek - 1)
+                        visited[peek - 1] = cells[peek - 1]
                 return visited
 
             pieces_to_shift = get_shift_chain()
             if pieces_to_shift:
+                for pt in pieces_to_shift:
+                    cells[pt] = EMPTY
                 for (pt, cell) in pieces_to_shift.items():
-                    grid[pt[0]][pt[1]] = '.'
-                for (pt, cell) in pieces_to_shift.items():
-                    grid[pt[0] + d[0]][pt[1] + d[1]] = cell
+                    cells[pt + d] = cell
 
-                grid[r][c] = '.'
-                grid[nr][c] = '@'
-                r, c = nr, nc
+                cells[pos] = EMPTY
+                cells[n] = ROBOT
+                pos = n
 
     return calculate_gps_sum(grid)
 
@@ -182,10 +193,11 @@ if __name__ == '__main__':
                         help="input filename", default="input.txt")
     args = parser.parse_args()
 
-    grid_str, steps = read_input(args.filename)
+    with open(args.filename, 'r') as file:
+        parsed = parse(file.read())
 
-    p1 = part1(grid_str, steps)
+    p1 = part1(parsed)
     print(f"Part1: sum = {p1}")
 
-    p2 = part2(grid_str, steps)
+    p2 = part2(parsed)
     print(f"Part2: sum = {p2}")
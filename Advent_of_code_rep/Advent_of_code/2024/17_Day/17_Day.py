@@ -1,23 +1,36 @@
 import sys
-from typing import List
+from typing import List, Tuple
 
-# Specify the input file via command-line argument or use "input.txt" as default
-FILE = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+SAMPLE = """\
+Register A: 729
+Register B: 0
+Register C: 0
 
-def read_lines_to_list() -> List[str]:
+Program: 0,1,5,4,3,0
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": "4,6,3,5,6,3,5,2,1,0"}
+
+
+def parse(text: str) -> Tuple[int, int, int, List[int]]:
     """
-    Reads lines from the input file, strips whitespace, and returns them as a list of strings.
+    Parses the registers and program instructions from the puzzle input.
+
+    Args:
+        text (str): The puzzle input.
 
     Returns:
-        List[str]: The lines of the input file as a list of strings.
+        Tuple[int, int, int, List[int]]: The initial values of registers A, B and C, and the program.
     """
-    lines: List[str] = []
-    with open(FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()  # Remove leading and trailing whitespace
-            lines.append(line)
+    lines = [line.strip() for line in text.splitlines()]  # Remove leading and trailing whitespace
 
-    return lines
+    register_a = int(lines[0].split(": ")[-1])  # Extract initial value of register A
+    register_b = int(lines[1].split(": ")[-1])  # Extract initial value of register B
+    register_c = int(lines[2].split(": ")[-1])  # Extract initial value of register C
+    program = [int(v) for v in lines[4].split(": ")[-1].split(",")]  # Parse the program into a list of integers
+
+    return register_a, register_b, register_c, program
 
 def combo(register_a, register_b, register_c, operand) -> int:
     """
@@ -47,19 +60,13 @@ def combo(register_a, register_b, register_c, operand) -> int:
 
     return combo
 
-def part_one():
+def part1(parsed) -> str:
     """
     Executes the program in part one and calculates the output sequence.
     """
-    lines = read_lines_to_list()  # Read the input
+    register_a, register_b, register_c, program = parsed
     answer = ""
 
-    # Parse registers and program instructions from the input
-    register_a = int(lines[0].split(": ")[-1])  # Extract initial value of register A
-    register_b = int(lines[1].split(": ")[-1])  # Extract initial value of register B
-    register_c = int(lines[2].split(": ")[-1])  # Extract initial value of register C
-    program = [int(v) for v in lines[4].split(": ")[-1].split(",")]  # Parse the program into a list of integers
-
     pc = 0  # Program counter
     out = []  # Output values
 
@@ -104,18 +111,17 @@ def part_one():
 
     # Join the output values into a comma-separated string
     answer = ",".join(out)
-    print(f"Part 1: {answer}")
+    return answer
 
-def part_two():
+def part2(parsed) -> int:
     """
     Solves part two by finding the smallest initial value of register A
     that causes the program to output a copy of itself.
     """
-    lines = read_lines_to_list()  # Read the input
     answer = 0
 
-    # Parse the program instructions
-    program = [int(v) for v in lines[4].split(": ")[-1].split(",")]
+    # The program instructions
+    program = parsed[3]
 
     def test(a):
         """
@@ -143,8 +149,15 @@ def part_two():
 
     answer = min(answers)  # Find the smallest valid initial value for register A
 
-    print(f"Part 2: {answer}")
+    return answer
+
+if __name__ == "__main__":
+    # Specify the input file via command-line argument or use "input.txt" as default
+    FILE = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+
+    with open(FILE, "r", encoding="utf-8") as f:
+        parsed = parse(f.read())
 
-# Execute both parts
-part_one()
-part_two()
+    # Execute both parts
+    print(f"Part 1: {part1(parsed)}")
+    print(f"Part 2: {part2(parsed)}")
@@ -1,68 +1,119 @@
 from bisect import bisect_left  # Import bisect_left for binary search functionality
 
-# Read and parse the input data
-# - Reads the file "input.txt"
+from Advent_of_code_rep.Advent_of_code.utils import search
+from Advent_of_code_rep.Advent_of_code.utils.grid import Grid
+
+WALL = ord("#")  # A corrupted memory cell
+
+# The known memory spaces, by largest coordinate, and the bytes that have
+# fallen in each in part 1: the 7x7 sample space and the 71x71 puzzle one
+SPACES = ((6, 12), (70, 1024))
+
+SAMPLE = """\
+5,4
+4,2
+4,5
+3,0
+2,1
+6,3
+2,4
+1,5
+0,6
+3,3
+2,6
+5,1
+1,2
+5,5
+2,5
+6,5
+1,4
+0,4
+6,4
+1,1
+6,1
+1,0
+0,5
+1,6
+2,0
+"""
+
+# Expected answers on the sample input, checked by `harness.verify`
+SAMPLE_ANSWERS = {"part1": 22, "part2": "6,1"}
+
+# Peak traced memory allowed for any stage, enforced by the benchmark
+MEMORY_BUDGET = 8 * 2 ** 20
+
+
+# Parse the input data
 # - Splits the content into lines, then splits each line by commas
 # - Converts each number to an integer and stores the result as a list of tuples
-data = open("input.txt").read()
-data = [tuple(int(n) for n in line.split(",")) for line in data.split("\n")]
+def parse(text):
+    return [tuple(int(n) for n in line.split(",")) for line in text.splitlines()]
+
+
+# The smallest known memory space holding every byte: its largest coordinate
+# and the bytes fallen in part 1 (a space as large as the bytes reach, with
+# the puzzle's 1024, beyond the known ones)
+def memory_space(data):
+    reach = max((max(x, y) for x, y in data), default=0)
+    for W, fallen in SPACES:
+        if reach <= W:
+            return W, fallen
+    return reach, SPACES[-1][1]
 
-# Define the four cardinal directions for movement:
-# - (1, 0): Move down
-# - (0, 1): Move right
-# - (-1, 0): Move up
-# - (0, -1): Move left
-DIRS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
 
 # Define a BFS function to find the shortest path from (0, 0) to (W, W)
-def bfs(delay=1024, W=70):
-    # Set of blocked cells determined by the first 'delay' entries in data
-    blocks = set(data[:delay])
-
-    # Initialize the BFS with the starting point (0, 0) and the target point (W, W)
-    boundary, target = set([(0, 0)]), (W, W)
-
-    # Track the number of steps and keep a set of seen cells to avoid revisits
-    step, seen = 0, set()
-
-    # Perform BFS until there are no more cells to explore
-    while boundary:
-        newb = set()  # Temporary set for the next layer of cells to explore
-        while boundary:
-            y, x = boundary.pop()  # Pop a cell from the current boundary
-            if (y, x) in seen:  # Skip if already visited
-                continue
-            if (y, x) == target:  # Return the step count if the target is reached
-                return step
-            seen.add((y, x))  # Mark the current cell as visited
-
-            # Explore all neighboring cells based on the directions in DIRS
-            for dy, dx in DIRS:
-                ny, nx = y + dy, x + dx  # Calculate the new coordinates
-                # Add valid neighbors (inside bounds and not blocked) to the next layer
-                if 0 <= y <= W and 0 <= x <= W and (y, x) not in blocks:
-                    newb.add((ny, nx))
-        boundary = newb  # Move to the next layer of cells
-        step += 1  # Increment the step counter
+# - The memory space is a Grid padded with walls, so moves never leave it
+# - The search itself is the shared BFS over flat indices, stopping at the target
+def bfs(data, delay=1024, W=70):
+    grid = Grid(["." * (W + 1)] * (W + 1), fill="#")
+    cells, dirs = grid.cells, grid.dirs4
+
+    # Corrupt the cells of the first 'delay' entries in data
+    for x, y in data[:delay]:
+        cells[grid.index(x, y)] = WALL
+
+    # Neighbours of a cell are the adjacent cells that are not corrupted
+    def neighbours(position):
+        return [position + offset for offset in dirs if cells[position + offset] != WALL]
+
+    # Search from the starting point (0, 0) to the target point (W, W)
+    target = grid.index(W, W)
+    result = search.bfs(len(cells), [grid.index(0, 0)], neighbours, targets={target})
 
     # If the target is not reachable, return 0
-    return 0
+    return result.dist[target] if result.target != search.UNREACHED else 0
+
 
-# Call the BFS function with default parameters and print the result
-# - Finds the number of steps to reach (70, 70) from (0, 0)
-print(bfs())
+# Part 1: Finds the number of steps to reach (70, 70) from (0, 0)
+def part1(data):
+    W, fallen = memory_space(data)
+    return bfs(data, fallen, W)
 
-# Use binary search to find the maximum delay where BFS fails (returns 0)
+
+# Part 2: Use binary search to find the maximum delay where BFS fails (returns 0)
 # - Iterates through data indices
 # - Calls bfs() for each delay to determine when the target becomes unreachable
 # - Finds the first index where bfs(i) == 0 using bisect_left
-# - Outputs the last successful coordinate before BFS fails
-print(
-    *data[
-        bisect_left(
-            range(len(data)),  # Range of indices to search
-            True,  # Condition to check
-            key=lambda i: bfs(i) == 0  # Key function to evaluate bfs(i)
-        ) - 1  # Step back to the last successful delay
-    ], sep=","
-)
+# - Returns the last successful coordinate before BFS fails
+def part2(data):
+    W, _ = memory_space(data)
+    return ",".join(
+        str(n) for n in data[
+            bisect_left(
+                range(len(data)),  # Range of indices to search
+                True,  # Condition to check
+                key=lambda i: bfs(data, i, W) == 0  # Key function to evaluate bfs(i)
+            ) - 1  # Step back to the last successful delay
+        ]
+    )
+
+
+if __name__ == "__main__":
+    # Read the file "input.txt"
+    with open("input.txt") as f:
+        data = parse(f.read())
+
+    # Call the BFS function with default parameters and print the result
+    print(part1(data))
+    print(part2(data))
@@ -0,0 +1,133 @@
+"""
+Solves many inputs of the same day in one go.
+
+The day's modules are imported once per worker process (at pool start-up), so
+module-level state such as compiled regexes and precomputed tables is reused
+for every input the worker is handed. Inputs are submitted to the pool in
+chunks of `--chunksize`, and one row per (input, solver module) is written as
+CSV or JSON Lines, in input order.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.batch 2024 7 inputs/ --format csv --output answers.csv
+    python -m Advent_of_code_rep.Advent_of_code.harness.batch 2024 1 a.txt b.txt --workers 4 --format jsonl
+"""
+import argparse
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from Advent_of_code_rep.Advent_of_code.harness.cache import to_json
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver, discover, import_solver
+from Advent_of_code_rep.Advent_of_code.harness.runner import PARTS, RunResult, run_solver
+
+STAGES = ("parse",) + PARTS
+FIELDS = ["input", "solver", *PARTS, *(f"{stage}_seconds" for stage in STAGES), "error"]
+
+
+def load_solvers(solvers: List[Solver]):
+    """Imports the solver modules once; the initializer of the worker processes."""
+    for solver in solvers:
+        import_solver(solver)
+
+
+def solve_input(solvers: List[Solver], path: Path) -> List[RunResult]:
+    """Runs every solver on one input, in a worker."""
+    return [run_solver(solver, input_path=path) for solver in solvers]
+
+
+def expand_paths(paths: Iterable[Path]) -> List[Path]:
+    """Replaces every directory by the (non-hidden) files it holds, sorted by name."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files += sorted(file for file in path.iterdir() if file.is_file() and not file.name.startswith("."))
+        else:
+            files.append(path)
+    return files
+
+
+def to_row(path: Path, result: RunResult) -> Dict[str, Any]:
+    row = {"input": str(path), "solver": result.solver.key}
+    row.update({part: result.answers.get(part) for part in PARTS})
+    row.update({f"{stage}_seconds": result.timings.get(stage) for stage in STAGES})
+    row["error"] = result.error
+    return row
+
+
+def solve_many(
+    year: int,
+    day: int,
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    chunksize: int = 8,
+    name: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solves many inputs of one day on a process pool.
+
+    Args:
+        year (int): The year.
+        day (int): The day.
+        paths (iterable of Path): Input files, or directories of input files.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        chunksize (int): Number of inputs handed to a worker at a time.
+        name (str, optional): Only run this solver module of the day.
+
+    Yields:
+        dict: One row per input and solver module, in input order, with the
+        answers, per-stage seconds and the error of a failed run (see `FIELDS`).
+    """
+    solvers = [solver for solver in discover(years=[year], days=[day]) if name in (None, solver.name)]
+    if not solvers:
+        raise LookupError(f"no solver for {year}/{day:02d}" + (f" named {name}" if name else ""))
+    paths = expand_paths(paths)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_solvers, initargs=(solvers,)) as pool:
+        for path, results in zip(paths, pool.map(partial(solve_input, solvers), paths, chunksize=chunksize)):
+            for result in results:
+                yield to_row(path, result)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], stream: TextIO, fmt: str = "csv") -> int:
+    """Writes rows as CSV or JSON Lines, returning the number of failed runs."""
+    failures = 0
+    writer = csv.DictWriter(stream, FIELDS) if fmt == "csv" else None
+    if writer:
+        writer.writeheader()
+    for row in rows:
+        failures += row["error"] is not None
+        if writer:
+            writer.writerow({field: "" if value is None else value for field, value in row.items()})
+        else:
+            stream.write(to_json(row) + "\n")
+        stream.flush()
+    return failures
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("batch")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("paths", nargs="+", type=Path, help="input files or directories of input files")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=8, help="inputs handed to a worker at a time")
+    parser.add_argument("--name", default=None, help="only run this solver module of the day")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="output format")
+    parser.add_argument("--output", type=Path, default=None, help="output file (default: stdout)")
+    args = parser.parse_args(args)
+
+    rows = solve_many(args.year, args.day, args.paths, args.workers, args.chunksize, args.name)
+    if args.output:
+        with open(args.output, "w", newline="") as stream:
+            failures = write_rows(rows, stream, args.format)
+    else:
+        failures = write_rows(rows, sys.stdout, args.format)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+Benchmarks every implemented day and guards against timing regressions.
+
+Each day's parse and parts run `--repeat` times; min/median/p95 wall times and
+the tracemalloc peak are stored in a JSON history file keyed by git commit. The
+run fails when a stage's median is slower than the baseline by more than
+`--threshold`, or when a stage's peak exceeds the day's `MEMORY_BUDGET` (see
+`memory`).
+
+With `--parse-cache` the parse stage measures loading the parsed input from the
+parse cache (see `parse_cache`) instead of parsing it.
+
+With `--scales` the 2024 days instead run on synthetic inputs of growing size
+(see `generators`), printing how each stage's runtime grows with the input.
+Memory budgets then grow linearly with scales above 1, so only super-linear
+memory use fails the run.
+
+With `--ints RECORDS` it instead compares `utils.parsing.ints` with per-line
+`re.findall` on a synthetic 2024 day 14 input of that many robot records.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.benchmark 2024 9 --repeat 5
+    python -m Advent_of_code_rep.Advent_of_code.harness.benchmark --sample --baseline 1a2b3c4
+    python -m Advent_of_code_rep.Advent_of_code.harness.benchmark 2024 6 9 --scales 0.25 0.5 1 2 --csv scaling.csv
+    python -m Advent_of_code_rep.Advent_of_code.harness.benchmark --ints 1000000 --repeat 3
+"""
+import argparse
+import csv
+import json
+import math
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.harness.discovery import ROOT, Solver, discover, import_solver
+from Advent_of_code_rep.Advent_of_code.harness.generators import GENERATORS, generate
+from Advent_of_code_rep.Advent_of_code.harness.memory import format_bytes, memory_budget, peak_memory
+from Advent_of_code_rep.Advent_of_code.harness.parse_cache import cached_parse
+from Advent_of_code_rep.Advent_of_code.harness.runner import PARTS, read_input
+from Advent_of_code_rep.Advent_of_code.utils.parsing import ints
+
+HISTORY_FILE = ROOT / "benchmark_history.json"
+
+# Stages faster than this are too noisy to flag as regressions
+NOISE_FLOOR = 0.001
+
+# Runtime growing faster than size ** SUPERLINEAR is reported as super-linear
+SUPERLINEAR = 1.3
+
+
+def git_commit() -> str:
+    """
+    Returns the current git commit, suffixed with `+dirty` for uncommitted changes.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("+dirty" if status else "")
+
+
+def history_key(commit: str, sample: bool) -> str:
+    """Runs on the samples are stored next to, not over, the real-input runs."""
+    return f"{commit}/sample" if sample else commit
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Returns the min, median and 95th percentile of the samples."""
+    ordered = sorted(samples)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[math.ceil(0.95 * len(ordered)) - 1],
+    }
+
+
+def benchmark_stage(func: Callable, arg: Any, repeat: int) -> Dict[str, float]:
+    """
+    Times `func(arg)` `repeat` times and measures its peak memory.
+
+    Args:
+        func (Callable): The parse or part function.
+        arg: Its argument (the input text or the parsed input).
+        repeat (int): Number of timed repetitions.
+
+    Returns:
+        dict: min/median/p95 in seconds and `peak_memory` in bytes.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - start)
+
+    stats = summarize(samples)
+    stats["peak_memory"] = peak_memory(func, arg)
+    return stats
+
+
+def benchmark_solver(
+    solver: Solver,
+    repeat: int = 5,
+    sample: bool = False,
+    parse_cache: bool = False,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks parse and every part of a solver.
+
+    Args:
+        solver (Solver): The solver to benchmark.
+        repeat (int): Number of timed repetitions per stage.
+        sample (bool): Benchmark on the sample input instead of the real one.
+        parse_cache (bool): Time loading the parsed input from the parse cache instead of parsing.
+
+    Returns:
+        dict: Stage name to its statistics, see `benchmark_stage`.
+    """
+    module = import_solver(solver)
+    parse = partial(cached_parse, solver, module) if parse_cache else module.parse
+    return benchmark_text(module, read_input(solver, sample), repeat, parse)
+
+
+def benchmark_text(
+    module: ModuleType,
+    text: str,
+    repeat: int,
+    parse: Optional[Callable] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Benchmarks parse (by default `module.parse`) and every part of a solver module on the given input."""
+    parse = parse or module.parse
+    parsed = parse(text)
+
+    results = {"parse": benchmark_stage(parse, text, repeat)}
+    for part in PARTS:
+        if hasattr(module, part):
+            results[part] = benchmark_stage(getattr(module, part), parsed, repeat)
+    return results
+
+
+def benchmark_scaling(
+    solver: Solver,
+    scales: List[float],
+    repeat: int = 1,
+    seed: int = 0,
+) -> List[Tuple[float, int, Dict[str, Dict[str, float]]]]:
+    """
+    Benchmarks a 2024 solver on synthetic inputs of increasing size.
+
+    Args:
+        solver (Solver): The solver to benchmark.
+        scales (list[float]): Input scales, see `generators.generate`.
+        repeat (int): Number of timed repetitions per stage.
+        seed (int): Seed for the input generator.
+
+    Returns:
+        list[tuple]: (scale, input size in bytes, stage statistics) per scale.
+    """
+    module = import_solver(solver)
+    rows = []
+    for scale in sorted(scales):
+        text = generate(solver.day, scale, seed)
+        rows.append((scale, len(text), benchmark_text(module, text, repeat)))
+    return rows
+
+
+def regex_ints(text: str) -> List[List[int]]:
+    """The per-line `re.findall` extraction that `ints` replaces."""
+    return [[int(x) for x in re.findall(r"-?\d+", line)] for line in text.splitlines()]
+
+
+def benchmark_ints(records: int, repeat: int = 5, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Times `ints` against `regex_ints` on a 2024 day 14 input of `records` robots.
+
+    Returns:
+        dict: "regex" and "ints" to their statistics, see `benchmark_stage`.
+    """
+    text = generate(14, records / 500, seed)
+    if ints(text, width=4).tolist() != regex_ints(text):
+        raise AssertionError("ints and re.findall disagree")
+    return {
+        "regex": benchmark_stage(regex_ints, text, repeat),
+        "ints": benchmark_stage(partial(ints, width=4), text, repeat),
+    }
+
+
+def find_overruns(
+    key: str, results: Dict[str, Dict[str, float]], budget: Optional[int], scale: float = 1.0
+) -> List[str]:
+    """
+    Lists the stages whose tracemalloc peak exceeds a memory budget.
+
+    Args:
+        key (str): The solver key, used in the descriptions.
+        results (dict): Stage name to its statistics, see `benchmark_stage`.
+        budget (int, optional): The budget in bytes for a real-size input; None for no budget.
+        scale (float): Size of the input relative to a real one; budgets grow with scales above 1.
+
+    Returns:
+        list[str]: A description of every stage over budget.
+    """
+    if budget is None:
+        return []
+    budget = budget * max(1.0, scale)
+    return [
+        f"{key} {stage}: peak {format_bytes(stats['peak_memory'])} over budget {format_bytes(budget)}"
+        for stage, stats in results.items()
+        if stats["peak_memory"] > budget
+    ]
+
+
+def growth_exponent(size_a: int, seconds_a: float, size_b: int, seconds_b: float) -> Optional[float]:
+    """
+    Estimates k in `seconds ~ size ** k` from two measurements.
+
+    Returns None when the measurements are too small or too close to tell.
+    """
+    if size_a == size_b or min(seconds_a, seconds_b) < NOISE_FLOOR:
+        return None
+    return math.log(seconds_b / seconds_a) / math.log(size_b / size_a)
+
+
+def report_scaling(
+    solvers: List[Solver], scales: List[float], repeat: int, seed: int, csv_path: Optional[Path]
+) -> List[str]:
+    """
+    Prints (and optionally writes as CSV) runtime against input size for each stage.
+
+    Returns:
+        list[str]: The memory budget overruns, see `find_overruns`.
+    """
+    rows = []
+    overruns = []
+    for solver in solvers:
+        if solver.year != 2024 or solver.day not in GENERATORS:
+            print(f"{solver.key:<28} skipped: no input generator")
+            continue
+
+        previous = {}
+        budget = memory_budget(import_solver(solver))
+        for scale, size, results in benchmark_scaling(solver, scales, repeat, seed):
+            overruns += find_overruns(f"{solver.key} at scale {scale:g}", results, budget, scale)
+            for stage, stats in results.items():
+                exponent = None
+                if stage in previous:
+                    exponent = growth_exponent(*previous[stage], size, stats["median"])
+                previous[stage] = (size, stats["median"])
+
+                note = ""
+                if exponent is not None:
+                    note = f"~size^{exponent:.2f}" + ("  super-linear" if exponent > SUPERLINEAR else "")
+                print(f"{solver.key:<28} {stage:<6} scale {scale:7.2f}  {size:>11,} bytes  "
+                      f"median {stats['median']:9.4f}s  peak {format_bytes(stats['peak_memory']):>10}  {note}")
+                rows.append([solver.key, stage, scale, size, stats["median"], stats["peak_memory"]])
+
+    if csv_path:
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["solver", "stage", "scale", "bytes", "median_seconds", "peak_memory"])
+            writer.writerows(rows)
+
+    for overrun in overruns:
+        print(f"Memory budget exceeded: {overrun}")
+    return overruns
+
+
+def load_history(path: Path) -> Dict[str, Any]:
+    if not path.is_file():
+        return {}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def save_history(path: Path, history: Dict[str, Any]):
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2, sort_keys=True)
+
+
+def find_regressions(
+    current: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float,
+) -> List[str]:
+    """
+    Compares median timings against a baseline run.
+
+    Args:
+        current (dict): Solver key to stage statistics for this run.
+        baseline (dict): The same structure for the baseline run.
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20 %.
+
+    Returns:
+        list[str]: A description of every stage that regressed.
+    """
+    regressions = []
+    for key, stages in current.items():
+        for stage, stats in stages.items():
+            before = baseline.get(key, {}).get(stage)
+            if before is None:
+                continue
+            now, then = stats["median"], before["median"]
+            if now > then * (1 + threshold) and now - then > NOISE_FLOOR:
+                regressions.append(f"{key} {stage}: {then:.4f}s -> {now:.4f}s (+{(now / then - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("benchmark")
+    parser.add_argument("year", nargs="?", type=int, help="only benchmark this year")
+    parser.add_argument("days", nargs="*", type=int, help="only benchmark these days")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed repetitions per stage")
+    parser.add_argument("--sample", action="store_true", help="benchmark on the sample inputs")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE, help="JSON history file")
+    parser.add_argument("--baseline", default=None,
+                        help="commit to compare against (default: the latest other entry)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative slowdown of a stage's median (default: 0.2)")
+    parser.add_argument("--no-save", action="store_true", help="do not record this run")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="time loading parsed inputs from the parse cache instead of parsing")
+    parser.add_argument("--scales", type=float, nargs="+", default=None,
+                        help="benchmark the 2024 days on synthetic inputs of these scales instead")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("--csv", type=Path, default=None, help="write the --scales results to this CSV")
+    parser.add_argument("--ints", type=int, default=None, metavar="RECORDS",
+                        help="compare ints() with re.findall on this many records instead")
+    args = parser.parse_args(args)
+
+    if args.ints:
+        results = benchmark_ints(args.ints, args.repeat, args.seed)
+        for method, stats in results.items():
+            print(f"{method:<6} min {stats['min']:8.4f}s  median {stats['median']:8.4f}s  "
+                  f"peak {format_bytes(stats['peak_memory']):>10}")
+        print(f"ints is {results['regex']['median'] / results['ints']['median']:.1f}x faster")
+        sys.exit(0)
+
+    solvers = discover(years=[args.year] if args.year else None, days=args.days)
+    if args.scales:
+        overruns = report_scaling(solvers, args.scales, args.repeat, args.seed, args.csv)
+        sys.exit(1 if overruns else 0)
+
+    results = {}
+    failures = []
+    overruns = []
+    for solver in solvers:
+        try:
+            results[solver.key] = benchmark_solver(solver, args.repeat, args.sample, args.parse_cache)
+        except FileNotFoundError as e:
+            print(f"{solver.key:<28} skipped: {e}")
+            continue
+        except Exception as e:
+            failures.append(solver.key)
+            print(f"{solver.key:<28} FAILED: {type(e).__name__}: {e}")
+            continue
+        overruns += find_overruns(solver.key, results[solver.key], memory_budget(import_solver(solver)))
+        for stage, stats in results[solver.key].items():
+            print(f"{solver.key:<28} {stage:<6} min {stats['min']:8.4f}s  median {stats['median']:8.4f}s  "
+                  f"p95 {stats['p95']:8.4f}s  peak {format_bytes(stats['peak_memory']):>10}")
+
+    history = load_history(args.history)
+    current_key = history_key(git_commit(), args.sample)
+    if args.baseline:
+        baseline_key = history_key(args.baseline, args.sample)
+    else:
+        runs = {key: run for key, run in history.items() if key != current_key and run["sample"] == args.sample}
+        baseline_key = max(runs, key=lambda key: runs[key]["timestamp"], default=None)
+
+    regressions = []
+    if baseline_key in history:
+        regressions = find_regressions(results, history[baseline_key]["results"], args.threshold)
+        print(f"Compared against {baseline_key}: {len(regressions)} regression(s)")
+        for regression in regressions:
+            print(f"    {regression}")
+    elif baseline_key:
+        print(f"No benchmark recorded for baseline {baseline_key}")
+
+    for overrun in overruns:
+        print(f"Memory budget exceeded: {overrun}")
+
+    if not args.no_save:
+        history[current_key] = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "sample": args.sample,
+            "results": results,
+        }
+        save_history(args.history, history)
+
+    sys.exit(1 if regressions or failures or overruns else 0)
+
+
+if __name__ == "__main__":
+    main()
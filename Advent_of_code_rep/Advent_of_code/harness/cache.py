@@ -0,0 +1,147 @@
+"""
+On-disk cache of answers, keyed by the input and the solver source.
+
+An entry is only reused when both the sha256 of the input text and the sha256
+of the solver source match, so editing a solver, the shared `utils` package it
+builds on, or its input is enough to invalidate it. Entries live in a SQLite
+file and the least recently used runs are evicted once there are more than
+`max_entries` rows.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.harness.discovery import ROOT, Solver
+
+CACHE_FILE = ROOT / "answer_cache.sqlite3"
+
+# Shared code imported by the solvers, hashed along with each solver's module
+SHARED_SOURCES = ROOT / "utils"
+
+# Number of stage rows (parse, part1, part2) kept before evicting the oldest
+MAX_ENTRIES = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    input_sha TEXT NOT NULL,
+    source_sha TEXT NOT NULL,
+    answer TEXT,
+    seconds REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (year, day, name, stage, input_sha, source_sha)
+)
+"""
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def source_digest(solver: Solver) -> str:
+    """Returns the sha256 of a solver module together with the shared sources."""
+    digest = hashlib.sha256(solver.path.read_bytes())
+    for path in sorted(SHARED_SOURCES.glob("*.py")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def to_json(answer: Any) -> str:
+    """Serializes an answer; NumPy scalars are stored as plain Python numbers."""
+    return json.dumps(answer, default=lambda value: value.item())
+
+
+class AnswerCache:
+    """
+    Stores the answers and stage timings of successful runs.
+
+    Args:
+        path (Path): The SQLite file, created if missing.
+        max_entries (int): Maximum number of stage rows kept.
+    """
+
+    def __init__(self, path: Path = CACHE_FILE, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute(SCHEMA)
+
+    def __enter__(self) -> "AnswerCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def get(
+        self, solver: Solver, input_sha: str, source_sha: str
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, float]]]:
+        """
+        Looks up a previous run of a solver on the same input and source.
+
+        Args:
+            solver (Solver): The solver.
+            input_sha (str): sha256 of the input text.
+            source_sha (str): sha256 of the solver source, see `source_digest`.
+
+        Returns:
+            tuple or None: The answers and the stage timings, or None on a miss.
+        """
+        key = (solver.year, solver.day, solver.name, input_sha, source_sha)
+        rows = self.connection.execute(
+            "SELECT stage, answer, seconds FROM answers "
+            "WHERE year = ? AND day = ? AND name = ? AND input_sha = ? AND source_sha = ?",
+            key,
+        ).fetchall()
+        if not rows:
+            return None
+
+        with self.connection:
+            self.connection.execute(
+                "UPDATE answers SET last_used = ? "
+                "WHERE year = ? AND day = ? AND name = ? AND input_sha = ? AND source_sha = ?",
+                (time.time(), *key),
+            )
+        answers = {stage: json.loads(answer) for stage, answer, _ in rows if answer is not None}
+        timings = {stage: seconds for stage, _, seconds in rows}
+        return answers, timings
+
+    def put(
+        self,
+        solver: Solver,
+        input_sha: str,
+        source_sha: str,
+        answers: Dict[str, Any],
+        timings: Dict[str, float],
+    ):
+        """
+        Stores the answers and timings of a successful run, then evicts old entries.
+
+        Args:
+            solver (Solver): The solver.
+            input_sha (str): sha256 of the input text.
+            source_sha (str): sha256 of the solver source, see `source_digest`.
+            answers (dict): Part name to answer.
+            timings (dict): Stage name to wall time in seconds.
+        """
+        now = time.time()
+        rows = [
+            (solver.year, solver.day, solver.name, stage, input_sha, source_sha,
+             to_json(answers[stage]) if stage in answers else None, seconds, now)
+            for stage, seconds in timings.items()
+        ]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            # The stages of one run share `last_used`, so runs are evicted whole
+            self.connection.execute(
+                "DELETE FROM answers WHERE last_used < "
+                "(SELECT last_used FROM answers ORDER BY last_used DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries - 1,),
+            )
@@ -0,0 +1,263 @@
+"""
+Long-lived solver daemon with warm imports and in-memory caches.
+
+`serve` imports every day module once and answers requests on a Unix domain
+socket (an asyncio server), so a request pays neither interpreter start-up nor
+module imports. Requests and responses are one JSON object per line:
+
+    {"year": 2024, "day": 6, "part": "part1", "input": "/abs/path/input.txt"}
+    {"ok": true, "answer": 5162, "cached": false, "timings": {"parse": 0.0003, "part1": 0.0021}}
+
+`input` defaults to the day's puzzle input (or its sample with `"sample": true`,
+from the module's inline `SAMPLE` when there is no sample file) and `name`
+picks a module when a day has several. Answers are kept in memory, keyed by the
+sha256 of the input, so repeated requests are answered without touching the
+pool; inputs are only re-hashed when their size or mtime changes.
+Misses run on a process pool whose workers inherit (or, without fork,
+re-import) the warm modules and keep their own parsed inputs, so asking for
+part2 after part1 skips the parse. Identical concurrent requests share one run.
+Restart the daemon after editing a solver.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.daemon serve --workers 4
+    python -m Advent_of_code_rep.Advent_of_code.harness.daemon ask 2024 6 part1
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.harness.cache import sha256_text, to_json
+from Advent_of_code_rep.Advent_of_code.harness.discovery import ROOT, Solver, discover, find_input, import_solver
+from Advent_of_code_rep.Advent_of_code.harness.runner import PARTS, timed
+from Advent_of_code_rep.Advent_of_code.harness.verify import INLINE_SAMPLE
+
+SOCKET_FILE = ROOT / "solver.sock"
+
+# Answers kept by the daemon, and parsed inputs kept by each worker
+MAX_ANSWERS = 4096
+MAX_PARSED = 16
+
+# Per-worker state, filled by `warm_up`
+_modules: Dict[str, ModuleType] = {}
+_parsed: "LRUCache" = None
+
+
+class LRUCache:
+    """A dict that forgets its least recently used entries beyond `max_entries`."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+def warm_up(solvers: List[Solver]):
+    """Imports every solver module; also the initializer of the worker processes."""
+    global _parsed
+    for solver in solvers:
+        if solver.key not in _modules:
+            _modules[solver.key] = import_solver(solver)
+    if _parsed is None:
+        _parsed = LRUCache(MAX_PARSED)
+
+
+def solve(solver: Solver, path: str, input_sha: str, part: str) -> Tuple[str, Dict[str, float]]:
+    """
+    Runs one part of a solver in a worker, reusing the worker's parsed input.
+
+    `path` is the input file, or `INLINE_SAMPLE` for the module's `SAMPLE`.
+
+    Returns:
+        tuple: The answer as JSON and the stage timings; `parse` is missing
+        when the parsed input was reused.
+    """
+    module = _modules[solver.key]
+    timings = {}
+    parsed = _parsed.get((solver.key, input_sha))
+    if parsed is None:
+        text = module.SAMPLE if path == INLINE_SAMPLE else Path(path).read_text()
+        parsed = timed(timings, "parse", module.parse, text)
+        _parsed.put((solver.key, input_sha), parsed)
+    answer = timed(timings, part, getattr(module, part), parsed)
+    return to_json(answer), timings
+
+
+class SolverDaemon:
+    """
+    Answers solver requests from warm modules and in-memory caches.
+
+    Args:
+        solvers (list[Solver]): The solvers to serve.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        max_answers (int): Number of answers kept in memory.
+    """
+
+    def __init__(self, solvers: List[Solver], workers: Optional[int] = None, max_answers: int = MAX_ANSWERS):
+        self.solvers = solvers
+        warm_up(solvers)
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_up, initargs=(solvers,))
+        self.answers = LRUCache(max_answers)
+        self.digests: Dict[str, Tuple[int, int, str]] = {}
+        self.pending: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+    def find_solver(self, year: int, day: int, part: str, name: Optional[str] = None) -> Solver:
+        """Returns the (named) module of a day exposing `part`."""
+        for solver in self.solvers:
+            if (solver.year, solver.day) == (year, day) and name in (None, solver.name) \
+                    and hasattr(_modules[solver.key], part):
+                return solver
+        raise LookupError(f"no solver for {year}/{day:02d} {part}" + (f" named {name}" if name else ""))
+
+    def input_digest(self, path: str) -> str:
+        """Returns the sha256 of an input file, hashing it again only when its size or mtime changed."""
+        stat = os.stat(path)
+        known = self.digests.get(path)
+        if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        self.digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    async def answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answers one request, see the module docstring for its fields."""
+        start = time.perf_counter()
+        part = request.get("part")
+        part = f"part{part}" if isinstance(part, int) else part
+        if part not in PARTS:
+            raise ValueError(f"part must be one of {', '.join(PARTS)}")
+        solver = self.find_solver(int(request["year"]), int(request["day"]), part, request.get("name"))
+
+        sample = bool(request.get("sample"))
+        path = request.get("input") or find_input(solver, sample)
+        if path is None and sample and hasattr(_modules[solver.key], "SAMPLE"):
+            path, digest = INLINE_SAMPLE, sha256_text(_modules[solver.key].SAMPLE)
+        elif path is None:
+            raise FileNotFoundError(f"no {'sample' if sample else 'puzzle'} input for {solver.key}")
+        else:
+            path = str(path)
+            digest = self.input_digest(path)
+        key = (solver.key, digest, part)
+
+        hit = self.answers.get(key)
+        cached = hit is not None
+        if not cached:
+            future = self.pending.get(key)
+            if future is None:
+                loop = asyncio.get_running_loop()
+                future = self.pending[key] = loop.run_in_executor(self.pool, solve, solver, path, key[1], part)
+                future.add_done_callback(lambda _: self.pending.pop(key, None))
+            hit = await future
+            self.answers.put(key, hit)
+
+        answer, timings = hit
+        return {"ok": True, "solver": solver.key, "answer": json.loads(answer), "cached": cached,
+                "timings": timings, "seconds": time.perf_counter() - start}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answers the requests of one connection, one JSON line each."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.answer(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, path: Path = SOCKET_FILE):
+        """Listens on a Unix domain socket until cancelled, or until the process gets SIGTERM."""
+        if path.is_socket():
+            path.unlink()
+        server = await asyncio.start_unix_server(self.handle, path=str(path))
+        print(f"Serving {len(self.solvers)} solvers on {path}", flush=True)
+        # Stop like on Ctrl-C, so the workers are shut down and the socket removed
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            loop.remove_signal_handler(signal.SIGTERM)
+            self.pool.shutdown(cancel_futures=True)
+            if path.is_socket():
+                path.unlink()
+
+
+def ask(request: Dict[str, Any], path: Path = SOCKET_FILE) -> Dict[str, Any]:
+    """Sends one request to a running daemon and returns its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as stream:
+            return json.loads(stream.readline())
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("daemon")
+    parser.add_argument("--socket", type=Path, default=SOCKET_FILE, help="Unix domain socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="start the daemon")
+    serve.add_argument("year", nargs="?", type=int, help="only serve this year")
+    serve.add_argument("days", nargs="*", type=int, help="only serve these days")
+    serve.add_argument("-w", "--workers", type=int, default=None,
+                       help="number of worker processes (default: CPU count)")
+    serve.add_argument("--max-answers", type=int, default=MAX_ANSWERS, help="answers kept in memory")
+
+    request = commands.add_parser("ask", help="ask a running daemon for an answer")
+    request.add_argument("year", type=int)
+    request.add_argument("day", type=int)
+    request.add_argument("part", choices=PARTS)
+    request.add_argument("--input", type=Path, default=None, help="input file (default: the day's input)")
+    request.add_argument("--sample", action="store_true", help="use the day's sample input")
+    request.add_argument("--name", default=None, help="solver module, when a day has several")
+    args = parser.parse_args(args)
+
+    if args.command == "ask":
+        response = ask({
+            "year": args.year, "day": args.day, "part": args.part, "sample": args.sample, "name": args.name,
+            "input": str(args.input.resolve()) if args.input else None,
+        }, args.socket)
+        print(json.dumps(response, indent=2))
+        return
+
+    solvers = discover(years=[args.year] if args.year else None, days=args.days)
+    if not solvers:
+        parser.error("no solvers found")
+    daemon = SolverDaemon(solvers, args.workers, args.max_answers)
+    try:
+        asyncio.run(daemon.serve(args.socket))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
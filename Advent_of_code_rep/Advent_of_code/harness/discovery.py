@@ -0,0 +1,120 @@
+import importlib
+import re
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, List, NamedTuple, Optional
+
+# Directory holding the year folders (2023/, 2024/, ...) and its package name
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = __name__.rsplit(".", 2)[0]
+
+YEAR_PATTERN = re.compile(r"^\d{4}$")
+DAY_PATTERN = re.compile(r"^(\d{2})_[Dd]ay$")
+
+# File names tried, in order, when looking for a day's puzzle input or sample
+INPUT_NAMES = ("input.txt", "input")
+SAMPLE_NAMES = ("test.txt", "test_input", "test_data")
+
+
+class Solver(NamedTuple):
+    """A single solver module, e.g. 2024/06_Day/06_Day.py."""
+    year: int
+    day: int
+    name: str
+    path: Path
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day:02d}/{self.name}"
+
+    @property
+    def module_name(self) -> str:
+        return f"{PACKAGE}.{self.path.parent.parent.name}.{self.path.parent.name}.{self.name}"
+
+
+def discover(
+    root: Path = ROOT,
+    years: Optional[Iterable[int]] = None,
+    days: Optional[Iterable[int]] = None,
+) -> List[Solver]:
+    """
+    Finds every implemented solver module below `root`.
+
+    Empty placeholder modules (such as the `_day.py` stubs) and `__init__.py`
+    files are skipped.
+
+    Args:
+        root (Path): Directory containing the year folders.
+        years (iterable of int, optional): Only keep these years.
+        days (iterable of int, optional): Only keep these days.
+
+    Returns:
+        list[Solver]: The solvers, sorted by year, day and module name.
+    """
+    years = set(years) if years else None
+    days = set(days) if days else None
+    solvers = []
+
+    for year_dir in root.iterdir():
+        if not year_dir.is_dir() or not YEAR_PATTERN.match(year_dir.name):
+            continue
+        year = int(year_dir.name)
+        if years and year not in years:
+            continue
+
+        for day_dir in year_dir.iterdir():
+            match = DAY_PATTERN.match(day_dir.name)
+            if not day_dir.is_dir() or not match:
+                continue
+            day = int(match.group(1))
+            if days and day not in days:
+                continue
+
+            for path in day_dir.glob("*.py"):
+                if path.name.startswith("__") or path.stat().st_size == 0:
+                    continue
+                solvers.append(Solver(year, day, path.stem, path))
+
+    return sorted(solvers)
+
+
+def import_solver(solver: Solver) -> ModuleType:
+    """
+    Imports a solver module through importlib.
+
+    The year and day folders are not valid identifiers (`2024`, `06_Day`), so a
+    plain `import` statement cannot reach them, but `importlib.import_module`
+    accepts the dotted name as a string. Importing a day has no side effects; the
+    script behaviour lives under `if __name__ == "__main__":`.
+
+    Args:
+        solver (Solver): The solver to import.
+
+    Returns:
+        ModuleType: The module, exposing `parse` and `part1` and/or `part2`.
+    """
+    return importlib.import_module(solver.module_name)
+
+
+def find_input(solver: Solver, sample: bool = False) -> Optional[Path]:
+    """
+    Finds the puzzle input (or sample) next to a solver.
+
+    The 2023 inputs may also live in a shared `puzzle_input/<day>.txt` folder.
+
+    Args:
+        solver (Solver): The solver to find the input for.
+        sample (bool): Look for the sample input instead of the real one.
+
+    Returns:
+        Path or None: The input file, if there is one.
+    """
+    day_dir = solver.path.parent
+    for name in SAMPLE_NAMES if sample else INPUT_NAMES:
+        if (day_dir / name).is_file():
+            return day_dir / name
+
+    shared = day_dir.parent / "puzzle_input" / f"{solver.day:02d}.txt"
+    if not sample and shared.is_file():
+        return shared
+    return None
@@ -0,0 +1,284 @@
+"""
+Generates valid synthetic puzzle inputs for the implemented 2024 days.
+
+`scale` multiplies the size of a typical puzzle input: the grid side for grid
+days and the line (or record) count for line-oriented days, so 10 turns the
+130x130 guard map of day 6 into a 1300x1300 one. Fractional scales are allowed.
+The same seed always gives the same input.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.generators 6 --scale 10 > big_map.txt
+"""
+import argparse
+import random
+import string
+import sys
+from typing import Callable, Dict, List
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    """Scales a base size, never going below `minimum`."""
+    return max(minimum, round(base * scale))
+
+
+def day01(rng: random.Random, scale: float) -> str:
+    """Two columns of location IDs."""
+    lines = scaled(1000, scale)
+    return "\n".join(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}" for _ in range(lines))
+
+
+def day02(rng: random.Random, scale: float) -> str:
+    """Reports that are safe, safe after one removal, or unsafe."""
+    reports = []
+    for _ in range(scaled(1000, scale)):
+        level = rng.randint(10, 90)
+        step = rng.choice((-1, 1))
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += step * rng.randint(1, 3)
+            report.append(level)
+        if rng.random() < 0.5:
+            report[rng.randrange(len(report))] += rng.randint(-4, 4)
+        reports.append(" ".join(map(str, report)))
+    return "\n".join(reports)
+
+
+def day03(rng: random.Random, scale: float) -> str:
+    """Corrupted memory with mul(X,Y), do() and don't() instructions."""
+    noise = string.ascii_letters + string.digits + "()[]{},;:'!@#$%^&*<>?/ -+"
+    pieces = []
+    for _ in range(scaled(4000, scale)):
+        roll = rng.random()
+        if roll < 0.25:
+            pieces.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif roll < 0.28:
+            pieces.append("do()")
+        elif roll < 0.31:
+            pieces.append("don't()")
+        else:
+            pieces.append("".join(rng.choice(noise) for _ in range(rng.randint(1, 8))))
+    return "".join(pieces)
+
+
+def day04(rng: random.Random, scale: float) -> str:
+    """Word search grid over the letters X, M, A and S."""
+    side = scaled(140, scale)
+    return "\n".join("".join(rng.choice("XMAS") for _ in range(side)) for _ in range(side))
+
+
+def day05(rng: random.Random, scale: float) -> str:
+    """
+    Ordering rules and updates.
+
+    The pages come in groups of up to 49, each totally ordered by a rule for
+    every pair of its pages, and every update takes its pages from one group.
+    `scale` sets the number of groups (the group size, below 1) as well as the
+    number of updates, so the rules grow with the input like the updates do.
+    """
+    groups = max(1, round(scale))
+    size = min(49, scaled(49, scale, minimum=5))
+    pages = rng.sample(range(10, 100 * groups), size * groups)
+    orders = [pages[start:start + size] for start in range(0, len(pages), size)]
+    rules = [f"{order[i]}|{order[j]}" for order in orders for i in range(size) for j in range(i + 1, size)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled(200, scale)):
+        order = rng.choice(orders)
+        update = rng.sample(order, rng.randrange(5, min(24, size + 1), 2))
+        if rng.random() < 0.5:
+            update.sort(key=order.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def day06(rng: random.Random, scale: float) -> str:
+    """Lab map with scattered obstructions and a guard facing up."""
+    side = scaled(130, scale, minimum=3)
+    grid = [["#" if rng.random() < 0.05 else "." for _ in range(side)] for _ in range(side)]
+    grid[rng.randrange(side // 2, side)][rng.randrange(side)] = "^"
+    return "\n".join("".join(row) for row in grid)
+
+
+def day07(rng: random.Random, scale: float) -> str:
+    """Calibration equations, roughly half of them solvable."""
+    lines = []
+    for _ in range(scaled(850, scale)):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice("+*|")
+            target = target + number if op == "+" else target * number if op == "*" else int(f"{target}{number}")
+        if rng.random() < 0.5:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines)
+
+
+def day08(rng: random.Random, scale: float) -> str:
+    """Antenna map."""
+    side = scaled(50, scale)
+    frequencies = string.ascii_letters + string.digits
+    return "\n".join(
+        "".join(rng.choice(frequencies) if rng.random() < 0.08 else "." for _ in range(side))
+        for _ in range(side)
+    )
+
+
+def day09(rng: random.Random, scale: float) -> str:
+    """Dense disk map alternating file and free-space lengths."""
+    length = scaled(10000, scale) * 2 - 1
+    return "".join(str(rng.randint(1, 9) if ii % 2 == 0 else rng.randint(0, 9)) for ii in range(length))
+
+
+def day10(rng: random.Random, scale: float) -> str:
+    """Topographic map of diagonal uphill slopes with noise, so that trails exist."""
+    side = scaled(45, scale)
+    return "\n".join(
+        "".join(str((r + c) % 10 if rng.random() < 0.8 else rng.randint(0, 9)) for c in range(side))
+        for r in range(side)
+    )
+
+
+def day11(rng: random.Random, scale: float) -> str:
+    """Initial stone arrangement."""
+    return " ".join(str(rng.randint(0, 999999)) for _ in range(scaled(8, scale)))
+
+
+def day12(rng: random.Random, scale: float) -> str:
+    """Garden of blobby plant regions: each row mostly repeats the one above."""
+    side = scaled(140, scale)
+    row = [rng.choice(string.ascii_uppercase) for _ in range(side)]
+    rows = []
+    for _ in range(side):
+        row = row.copy()
+        for _ in range(max(1, side // 20)):
+            start = rng.randrange(side)
+            end = min(side, start + rng.randint(1, 6))
+            row[start:end] = rng.choice(string.ascii_uppercase) * (end - start)
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+def day13(rng: random.Random, scale: float) -> str:
+    """Claw machines, most of them winnable with at most 100 presses per button."""
+    machines = []
+    for _ in range(scaled(320, scale)):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if bx * ay - by * ax != 0:
+                break
+        a, b = rng.randint(0, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.3:
+            px += rng.randint(1, 9)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}")
+    return "\n\n".join(machines)
+
+
+def day14(rng: random.Random, scale: float) -> str:
+    """Robots in the fixed 101x103 area used by the solver."""
+    return "\n".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(scaled(500, scale))
+    )
+
+
+def day15(rng: random.Random, scale: float) -> str:
+    """Walled warehouse with boxes, a robot and its list of moves."""
+    side = scaled(50, scale, minimum=4)
+    grid = [["#"] * side] + [
+        ["#"] + ["O" if rng.random() < 0.3 else "#" if rng.random() < 0.05 else "." for _ in range(side - 2)] + ["#"]
+        for _ in range(side - 2)
+    ] + [["#"] * side]
+    grid[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = "@"
+
+    moves = "".join(rng.choice("^v<>") for _ in range(scaled(20000, scale)))
+    lines = [moves[ii:ii + 1000] for ii in range(0, len(moves), 1000)]
+    return "\n".join("".join(row) for row in grid) + "\n\n" + "\n".join(lines)
+
+
+def day16(rng: random.Random, scale: float) -> str:
+    """Reindeer maze: a random spanning-tree maze with some extra loops."""
+    side = scaled(141, scale, minimum=5) | 1  # the maze needs an odd side
+    grid = [["#"] * side for _ in range(side)]
+
+    stack = [(side - 2, 1)]
+    grid[side - 2][1] = "."
+    while stack:
+        r, c = stack[-1]
+        neighbours = [(r + dr, c + dc, dr, dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                      if 0 < r + dr < side - 1 and 0 < c + dc < side - 1 and grid[r + dr][c + dc] == "#"]
+        if not neighbours:
+            stack.pop()
+            continue
+        nr, nc, dr, dc = rng.choice(neighbours)
+        grid[r + dr // 2][c + dc // 2] = "."
+        grid[nr][nc] = "."
+        stack.append((nr, nc))
+
+    for _ in range(side * side // 50):
+        r, c = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (r + c) % 2 == 1:
+            grid[r][c] = "."
+
+    grid[side - 2][1], grid[1][side - 2] = "S", "E"
+    return "\n".join("".join(row) for row in grid)
+
+
+def day17(rng: random.Random, scale: float) -> str:
+    """Register values for the program whose output the part two search assumes."""
+    digits = scaled(16, scale)
+    register_a = rng.randrange(8 ** (digits - 1), 8 ** digits)
+    return f"Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\nProgram: 2,4,1,1,7,5,1,5,4,0,5,5,0,3,3,0"
+
+
+def day18(rng: random.Random, scale: float) -> str:
+    """
+    Falling byte positions.
+
+    The bytes always fall in the puzzle's 71x71 memory space, whose size the
+    solver reads from them, so `scale` only changes how many of its cells
+    eventually get corrupted (capped at all but start and exit).
+    """
+    cells = [(x, y) for x in range(71) for y in range(71) if (x, y) not in ((0, 0), (70, 70))]
+    rng.shuffle(cells)
+    return "\n".join(f"{x},{y}" for x, y in cells[:min(len(cells), scaled(3450, scale))])
+
+
+GENERATORS: Dict[int, Callable[[random.Random, float], str]] = {
+    1: day01, 2: day02, 3: day03, 4: day04, 5: day05, 6: day06,
+    7: day07, 8: day08, 9: day09, 10: day10, 11: day11, 12: day12,
+    13: day13, 14: day14, 15: day15, 16: day16, 17: day17, 18: day18,
+}
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Generates a synthetic 2024 puzzle input.
+
+    Args:
+        day (int): The puzzle day.
+        scale (float): Size relative to a typical puzzle input.
+        seed (int): Random seed; the same seed gives the same input.
+
+    Returns:
+        str: The puzzle input text.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"no generator for 2024 day {day}")
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def main(args: List[str] = None):
+    parser = argparse.ArgumentParser("generators")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS), help="2024 puzzle day")
+    parser.add_argument("-s", "--scale", type=float, default=1.0, help="size relative to a real input")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args(args)
+
+    sys.stdout.write(generate(args.day, args.scale, args.seed) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Checks that importing every day is cheap and does no file I/O.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.import_check [--max-ms 25]
+"""
+import argparse
+import builtins
+import io
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver, discover, import_solver
+
+
+class ImportResult(NamedTuple):
+    solver: Solver
+    milliseconds: float
+    opened: List[str]
+    error: Optional[str] = None
+
+
+@contextmanager
+def record_opens(opened: List[str]):
+    """Records every file opened through `open` while the context is active."""
+    original_open, original_io_open = builtins.open, io.open
+
+    def recording_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return original_open(file, *args, **kwargs)
+
+    builtins.open = io.open = recording_open
+    try:
+        yield
+    finally:
+        builtins.open, io.open = original_open, original_io_open
+
+
+def check_import(solver: Solver) -> ImportResult:
+    """
+    Imports a solver from scratch, timing it and recording any opened files.
+
+    Args:
+        solver (Solver): The solver to import.
+
+    Returns:
+        ImportResult: The import time in milliseconds, the opened files and the
+        error if the import failed.
+    """
+    sys.modules.pop(solver.module_name, None)
+    opened = []
+    error = None
+
+    start = time.perf_counter()
+    try:
+        with record_opens(opened):
+            import_solver(solver)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    milliseconds = (time.perf_counter() - start) * 1000
+
+    return ImportResult(solver, milliseconds, opened, error)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("import_check")
+    parser.add_argument("--max-ms", type=float, default=25.0,
+                        help="maximum import time per day in milliseconds")
+    args = parser.parse_args(args)
+
+    failures = 0
+    for solver in discover():
+        result = check_import(solver)
+        problems = []
+        if result.error:
+            problems.append(result.error)
+        if result.opened:
+            problems.append(f"opened {', '.join(result.opened)}")
+        if result.milliseconds > args.max_ms:
+            problems.append(f"slower than {args.max_ms:g} ms")
+
+        failures += bool(problems)
+        print(f"{solver.key:<28} {result.milliseconds:8.2f} ms  {'; '.join(problems) or 'ok'}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
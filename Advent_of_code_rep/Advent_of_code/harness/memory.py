@@ -0,0 +1,75 @@
+"""
+Memory accounting for solver stages.
+
+Two numbers are reported per stage: the tracemalloc peak, i.e. the largest
+amount of Python-allocated memory alive during the stage, and the process
+max-RSS (resident set high-water mark) once the stage is done, together with
+how much the stage raised it. Max-RSS also covers memory allocated outside
+Python's allocator, such as NumPy buffers, but it never goes down, so only
+its growth can be attributed to a stage.
+
+A day declares its budget as a module-level `MEMORY_BUDGET` in bytes, which
+every stage's tracemalloc peak must stay under; the benchmark enforces it.
+"""
+import sys
+import tracemalloc
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ru_maxrss is in kilobytes on Linux but in bytes on macOS
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def max_rss() -> int:
+    """Returns the max-RSS of this process in bytes, or 0 where it is unavailable."""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+
+
+def peak_memory(func: Callable, *args) -> int:
+    """Runs `func(*args)` once under tracemalloc and returns the peak in bytes."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_memory(usage: Dict[str, Dict[str, int]], stage: str, func: Callable, *args) -> Any:
+    """
+    Calls `func(*args)`, storing its memory use in `usage[stage]`.
+
+    The stored dict has the tracemalloc `peak`, the process `max_rss` after the
+    call and the `rss_growth` of the max-RSS during the call, all in bytes.
+    """
+    rss_before = max_rss()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    rss_after = max_rss()
+
+    usage[stage] = {"peak": peak, "max_rss": rss_after, "rss_growth": rss_after - rss_before}
+    return result
+
+
+def memory_budget(module: ModuleType) -> Optional[int]:
+    """Returns the `MEMORY_BUDGET` a solver module declares, if any."""
+    return getattr(module, "MEMORY_BUDGET", None)
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -0,0 +1,81 @@
+"""
+On-disk cache of parsed inputs.
+
+The parsed structure of a day is pickled into a `.parsed/` folder next to its
+input; `runner --parse-cache` and `benchmark --parse-cache` use it. An artifact
+is named after the sha256 of the input text and of the solver source, so a
+changed input or parser is never served a stale artifact; artifacts of an older
+solver source are deleted when a new one is written. Parsed values that cannot
+be pickled are simply not cached.
+"""
+import os
+import pickle
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from Advent_of_code_rep.Advent_of_code.harness.cache import sha256_text, source_digest
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver
+
+ARTIFACT_DIR = ".parsed"
+
+
+def artifact_stem(solver: Solver, text: str) -> Path:
+    """Returns the artifact path without its suffix."""
+    digest = f"{sha256_text(text)[:16]}-{source_digest(solver)[:16]}"
+    return solver.path.parent / ARTIFACT_DIR / f"{solver.name}-{digest}"
+
+
+def remove_stale(stem: Path):
+    """
+    Deletes the artifacts of the same solver that were parsed by another source version.
+
+    Temporary files are left alone: another process may be about to rename one.
+    """
+    name, _, source_sha = stem.name.rpartition("-")
+    for path in stem.parent.glob(f"{name.rpartition('-')[0]}-*"):
+        if path.suffix != ".tmp" and not path.name.split(".")[0].endswith(source_sha):
+            path.unlink()
+
+
+def load_artifact(stem: Path) -> Optional[Any]:
+    """Loads a stored artifact, returning None when there is none."""
+    if stem.with_suffix(".pkl").is_file():
+        with open(stem.with_suffix(".pkl"), "rb") as file:
+            return pickle.load(file)
+    return None
+
+
+def save_artifact(stem: Path, parsed: Any):
+    """Stores a parsed value, writing to a temporary file first so readers never see half of it."""
+    stem.parent.mkdir(exist_ok=True)
+    path = stem.with_suffix(".pkl")
+    temporary = stem.with_suffix(".pkl.tmp")
+    try:
+        with open(temporary, "wb") as file:
+            pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        temporary.unlink()
+        return
+    os.replace(temporary, path)
+
+
+def cached_parse(solver: Solver, module: ModuleType, text: str) -> Any:
+    """
+    Returns `module.parse(text)`, from the artifact cache when possible.
+
+    Args:
+        solver (Solver): The solver the module belongs to.
+        module (ModuleType): The imported solver module.
+        text (str): The puzzle input.
+
+    Returns:
+        The parsed input.
+    """
+    stem = artifact_stem(solver, text)
+    parsed = load_artifact(stem)
+    if parsed is None:
+        parsed = module.parse(text)
+        save_artifact(stem, parsed)
+        remove_stale(stem)
+    return parsed
@@ -0,0 +1,91 @@
+"""
+Profiles a call with cProfile and, optionally, a sampling profiler.
+
+The sampling profiler is a background thread that periodically reads the
+stack of the profiled thread through `sys._current_frames()`, so it needs no
+`sys.setprofile` hook and adds little overhead of its own. Its samples are
+written as collapsed stacks (`outer;inner;innermost count` per line), the
+input format of flame-graph tools such as flamegraph.pl and speedscope.
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# Seconds between two stack samples
+SAMPLE_INTERVAL = 0.001
+
+
+class StackSampler:
+    """
+    Counts the stacks of one thread, sampled every `interval` seconds.
+
+    Args:
+        thread_id (int): The thread to sample. Defaults to the calling thread.
+        interval (float): Seconds between samples.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "StackSampler":
+        # The sampler only runs when the profiled thread releases the GIL
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path):
+        """Writes the samples as collapsed stacks."""
+        with open(path, "w") as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+
+def profile_call(
+    func: Callable, *args, sample_interval: Optional[float] = None
+) -> Tuple[Any, cProfile.Profile, Optional[StackSampler]]:
+    """
+    Calls `func(*args)` under cProfile, and under a `StackSampler` if an interval is given.
+
+    Returns:
+        tuple: The result of the call, the profile and the sampler (or None).
+    """
+    profile = cProfile.Profile()
+    if sample_interval is None:
+        return profile.runcall(func, *args), profile, None
+
+    with StackSampler(interval=sample_interval) as sampler:
+        result = profile.runcall(func, *args)
+    return result, profile, sampler
+
+
+def top_functions(profile: cProfile.Profile, top: int = 20, sort: str = "cumulative") -> str:
+    """Returns the pstats report of the `top` functions, sorted by `sort`."""
+    stream = io.StringIO()
+    pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort).print_stats(top)
+    return stream.getvalue()
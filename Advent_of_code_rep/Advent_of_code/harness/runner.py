@@ -0,0 +1,356 @@
+"""
+Runs the solvers of one or more days in parallel.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.runner            # everything
+    python -m Advent_of_code_rep.Advent_of_code.harness.runner 2024       # a whole year
+    python -m Advent_of_code_rep.Advent_of_code.harness.runner 2024 6 7   # selected days
+
+Answers of days whose input and source are unchanged come from the answer
+cache (see `cache`); pass `--no-cache` to recompute them. `--parse-cache` also
+loads parsed inputs from the parse cache (see `parse_cache`), writing `.parsed/`
+folders next to the inputs.
+
+`--memory` also reports the tracemalloc peak and process max-RSS of every
+stage (see `memory`); it bypasses the answer cache.
+
+`--counters` also reports the work counters every stage recorded, such as the
+states a search popped (see `utils.counters`); it bypasses the answer cache.
+
+`--parallel-parts` runs the parts of every day concurrently, each in its own
+process, over one parsed input placed in shared memory (see `shared`).
+
+`--profile` instead runs the selected days one by one in this process under
+cProfile (see `profiling`) and prints their hot functions:
+    python -m Advent_of_code_rep.Advent_of_code.harness.runner 2024 9 --profile --sampling --profile-dir prof
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.harness.cache import CACHE_FILE, AnswerCache, sha256_text, source_digest
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver, discover, find_input, import_solver
+from Advent_of_code_rep.Advent_of_code.harness.memory import format_bytes, measure_memory
+from Advent_of_code_rep.Advent_of_code.harness.parse_cache import cached_parse
+from Advent_of_code_rep.Advent_of_code.harness.profiling import SAMPLE_INTERVAL, profile_call, top_functions
+from Advent_of_code_rep.Advent_of_code.harness.shared import run_parts
+from Advent_of_code_rep.Advent_of_code.utils import counters
+
+PARTS = ("part1", "part2")
+
+
+class RunResult(NamedTuple):
+    solver: Solver
+    answers: Dict[str, Any]
+    timings: Dict[str, float]
+    wall: float
+    cpu: float
+    error: Optional[str] = None
+    cached: bool = False
+    memory: Optional[Dict[str, Dict[str, int]]] = None
+    counters: Optional[Dict[str, Dict[str, int]]] = None
+
+
+def timed(timings: Dict[str, float], stage: str, func: Callable, *args) -> Any:
+    """Calls `func(*args)`, storing its wall time in `timings[stage]`."""
+    start = time.perf_counter()
+    result = func(*args)
+    timings[stage] = time.perf_counter() - start
+    return result
+
+
+def count_work(work: Dict[str, Dict[str, int]], stage: str, func: Callable, *args) -> Any:
+    """Calls `func(*args)` with counting enabled, storing the counters it recorded in `work[stage]`."""
+    with counters.collect() as counter:
+        result = func(*args)
+    work[stage] = dict(counter)
+    return result
+
+
+def run_stage(
+    timings: Dict[str, float],
+    memory: Optional[Dict[str, Dict[str, int]]],
+    stage: str,
+    func: Callable,
+    *args,
+    work: Optional[Dict[str, Dict[str, int]]] = None,
+) -> Any:
+    """
+    Like `timed`, but also records the memory use of the stage unless `memory`
+    is None, and its work counters unless `work` is None.
+    """
+    if work is not None:
+        func = partial(count_work, work, stage, func)
+    if memory is None:
+        return timed(timings, stage, func, *args)
+    return timed(timings, stage, measure_memory, memory, stage, func, *args)
+
+
+def read_input(solver: Solver, sample: bool = False, input_path: Optional[Path] = None) -> str:
+    """
+    Reads the input for a solver.
+
+    Args:
+        solver (Solver): The solver to read the input for.
+        sample (bool): Read the sample input instead of the real one; without a
+            sample file, the module's inline `SAMPLE` is used.
+        input_path (Path, optional): Explicit input file, overriding the lookup.
+
+    Returns:
+        str: The input text.
+    """
+    path = input_path or find_input(solver, sample)
+    if path is None and sample:
+        text = getattr(import_solver(solver), "SAMPLE", None)
+        if text is not None:
+            return text
+    if path is None:
+        raise FileNotFoundError(f"no {'sample' if sample else 'puzzle'} input for {solver.key}")
+    return Path(path).read_text()
+
+
+def run_solver(
+    solver: Solver,
+    sample: bool = False,
+    input_path: Optional[Path] = None,
+    parse_cache: bool = False,
+    track_memory: bool = False,
+    count: bool = False,
+    parallel_parts: bool = False,
+) -> RunResult:
+    """
+    Parses the input of a solver once and runs every part it exposes.
+
+    Args:
+        solver (Solver): The solver to run.
+        sample (bool): Run on the sample input instead of the real one.
+        input_path (Path, optional): Explicit input file, overriding the lookup.
+        parse_cache (bool): Load the parsed input from the parse cache when possible.
+        track_memory (bool): Record the memory use of every stage.
+        count (bool): Record the work counters of every stage.
+        parallel_parts (bool): Run the parts concurrently over one parsed input.
+
+    Returns:
+        RunResult: Answers, per-stage wall times, total wall and CPU time, the
+        error if it failed and, when tracked, the per-stage memory use and counters.
+    """
+    answers, timings = {}, {}
+    memory = {} if track_memory else None
+    work = {} if count else None
+    error = None
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        module = import_solver(solver)
+        text = read_input(solver, sample, input_path)
+        if parse_cache:
+            parsed = run_stage(timings, memory, "parse", cached_parse, solver, module, text, work=work)
+        else:
+            parsed = run_stage(timings, memory, "parse", module.parse, text, work=work)
+        parts = [part for part in PARTS if hasattr(module, part)]
+        if parallel_parts and len(parts) > 1:
+            answers.update(run_parts(solver, parsed, parts, timings, memory, work))
+        else:
+            for part in parts:
+                answers[part] = run_stage(timings, memory, part, getattr(module, part), parsed, work=work)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    return RunResult(solver, answers, timings, wall, cpu, error, memory=memory, counters=work)
+
+
+def run_all(
+    solvers: List[Solver],
+    workers: Optional[int] = None,
+    sample: bool = False,
+    input_path: Optional[Path] = None,
+    parse_cache: bool = False,
+    track_memory: bool = False,
+    count: bool = False,
+    parallel_parts: bool = False,
+) -> Iterator[RunResult]:
+    """
+    Runs the solvers on a process pool, yielding results as they finish.
+
+    Args:
+        solvers (list[Solver]): The solvers to run.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        sample (bool): Run on the sample inputs instead of the real ones.
+        input_path (Path, optional): Explicit input file, overriding the lookup.
+        parse_cache (bool): Load parsed inputs from the parse cache when possible.
+        track_memory (bool): Record the memory use of every stage.
+        count (bool): Record the work counters of every stage.
+        parallel_parts (bool): Run the parts of every solver concurrently over one parsed input.
+
+    Yields:
+        RunResult: One result per solver, in completion order.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_solver, solver, sample, input_path, parse_cache, track_memory, count, parallel_parts)
+                   for solver in solvers]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def cache_key(solver: Solver, sample: bool = False, input_path: Optional[Path] = None) -> Optional[Tuple[str, str]]:
+    """Returns the (input sha256, source sha256) cache key, or None without an input."""
+    try:
+        text = read_input(solver, sample, input_path)
+    except FileNotFoundError:
+        return None
+    return sha256_text(text), source_digest(solver)
+
+
+def run_cached(
+    solvers: List[Solver],
+    cache: AnswerCache,
+    workers: Optional[int] = None,
+    sample: bool = False,
+    input_path: Optional[Path] = None,
+    parse_cache: bool = False,
+    parallel_parts: bool = False,
+) -> Iterator[RunResult]:
+    """
+    Like `run_all`, but answers unchanged solvers from the cache and stores new answers.
+
+    Cache hits report the timings of the run that produced them, with zero
+    wall and CPU time. The process pool is only started for the misses.
+    """
+    keys = {solver: cache_key(solver, sample, input_path) for solver in solvers}
+
+    misses = []
+    for solver in solvers:
+        hit = cache.get(solver, *keys[solver]) if keys[solver] else None
+        if hit is None:
+            misses.append(solver)
+        else:
+            yield RunResult(solver, hit[0], hit[1], 0.0, 0.0, cached=True)
+
+    if misses:
+        for result in run_all(misses, workers, sample, input_path, parse_cache, parallel_parts=parallel_parts):
+            if not result.error and keys[result.solver]:
+                cache.put(result.solver, *keys[result.solver], result.answers, result.timings)
+            yield result
+
+
+def print_result(result: RunResult):
+    status = "FAILED" if result.error else "cached" if result.cached else "ok"
+    print(f"{result.solver.key:<28} wall {result.wall:8.3f}s  cpu {result.cpu:8.3f}s  {status}")
+    for stage, seconds in result.timings.items():
+        answer = result.answers.get(stage, "")
+        usage = ""
+        if result.memory and stage in result.memory:
+            stats = result.memory[stage]
+            usage = (f"  peak {format_bytes(stats['peak']):>10}  max-rss {format_bytes(stats['max_rss']):>10}"
+                     f" (+{format_bytes(stats['rss_growth'])})")
+        print(f"    {stage:<6} {seconds:8.3f}s{usage}  {answer}")
+        for name, value in sorted((result.counters or {}).get(stage, {}).items()):
+            print(f"        {name:<28} {value:>14,}")
+    if result.error:
+        print(f"    {result.error}")
+
+
+def profile_solvers(
+    solvers: List[Solver],
+    sample: bool = False,
+    input_path: Optional[Path] = None,
+    top: int = 20,
+    sort: str = "cumulative",
+    sample_interval: Optional[float] = None,
+    output_dir: Optional[Path] = None,
+):
+    """
+    Runs the solvers in this process under the profiler and prints their hot functions.
+
+    Both caches are bypassed so that parsing and solving are actually profiled.
+
+    Args:
+        solvers (list[Solver]): The solvers to profile.
+        sample (bool): Run on the sample inputs instead of the real ones.
+        input_path (Path, optional): Explicit input file, overriding the lookup.
+        top (int): Number of functions to report.
+        sort (str): pstats sort key, e.g. `cumulative` or `tottime`.
+        sample_interval (float, optional): Also sample stacks at this interval in seconds.
+        output_dir (Path, optional): Write `<year>_<day>_<name>.pstats` (and, when
+            sampling, `.collapsed`) files here.
+    """
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    for solver in solvers:
+        result, profile, sampler = profile_call(run_solver, solver, sample, input_path,
+                                                sample_interval=sample_interval)
+        print_result(result)
+        print(top_functions(profile, top, sort))
+
+        if output_dir:
+            stem = output_dir / f"{solver.year}_{solver.day:02d}_{solver.name}"
+            profile.dump_stats(stem.with_suffix(".pstats"))
+            if sampler:
+                sampler.write_collapsed(stem.with_suffix(".collapsed"))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("runner")
+    parser.add_argument("year", nargs="?", type=int, help="only run this year")
+    parser.add_argument("days", nargs="*", type=int, help="only run these days")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--sample", action="store_true", help="run on the sample inputs")
+    parser.add_argument("--input", type=Path, default=None,
+                        help="input file to use (only with a single day)")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every answer")
+    parser.add_argument("--cache", type=Path, default=CACHE_FILE, help="answer cache file")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="load parsed inputs from the parse cache instead of parsing them")
+    parser.add_argument("--memory", action="store_true",
+                        help="report the tracemalloc peak and max-RSS of every stage (slower, no answer cache)")
+    parser.add_argument("--counters", action="store_true",
+                        help="report the work counters of every stage (no answer cache)")
+    parser.add_argument("--parallel-parts", action="store_true",
+                        help="run the parts of every day concurrently over one parsed input")
+    parser.add_argument("--profile", action="store_true", help="profile the days instead of running them in parallel")
+    parser.add_argument("--top", type=int, default=20, help="number of functions to report when profiling")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key when profiling (default: cumulative)")
+    parser.add_argument("--sampling", type=float, nargs="?", const=SAMPLE_INTERVAL, default=None,
+                        metavar="INTERVAL", help="also sample stacks when profiling (default interval: 1 ms)")
+    parser.add_argument("--profile-dir", type=Path, default=None,
+                        help="write .pstats and collapsed-stack files here when profiling")
+    args = parser.parse_args(args)
+
+    solvers = discover(years=[args.year] if args.year else None, days=args.days)
+    if not solvers:
+        parser.error("no solvers found")
+    if args.input and len({(solver.year, solver.day) for solver in solvers}) > 1:
+        parser.error("--input needs a single day")
+
+    if args.profile:
+        profile_solvers(solvers, args.sample, args.input, args.top, args.sort, args.sampling, args.profile_dir)
+        return
+
+    start = time.perf_counter()
+    cpu_total = 0.0
+    cache = None if args.no_cache or args.memory or args.counters else AnswerCache(args.cache)
+    if cache:
+        results = run_cached(solvers, cache, args.workers, args.sample, args.input, args.parse_cache,
+                             args.parallel_parts)
+    else:
+        results = run_all(solvers, args.workers, args.sample, args.input, args.parse_cache, args.memory,
+                          args.counters, args.parallel_parts)
+    for result in results:
+        print_result(result)
+        cpu_total += result.cpu
+    if cache:
+        cache.close()
+
+    print(f"{len(solvers)} solvers, wall {time.perf_counter() - start:.3f}s, "
+          f"summed cpu {cpu_total:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
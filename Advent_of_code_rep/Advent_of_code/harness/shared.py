@@ -0,0 +1,148 @@
+"""
+Runs the parts of a day in parallel over one parsed input.
+
+Most days compute part 1 and part 2 independently from the same parsed
+structure. `run_parts` parses once, pickles the parsed value with protocol 5
+into `multiprocessing.shared_memory` blocks, and runs every part in its own
+worker process, which attaches to the blocks and unpickles the value. This is
+a copy-based handoff: the parsed values of the days (grids, lists, tuples) are
+rebuilt from the pickle stream, so every part gets a private copy it may
+mutate, and only the parse is saved. Values that pickle out-of-band buffers,
+such as NumPy arrays, keep them in blocks of their own and come back as
+read-only views of them instead.
+
+The blocks belong to the parent process and are unlinked once every part has
+finished.
+"""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver, import_solver
+
+
+class SharedValue(NamedTuple):
+    """Names of the shared memory blocks holding a pickled value: the pickle stream first, then its buffers."""
+    blocks: List[Tuple[str, int]]
+
+
+def share(value: Any) -> Tuple[SharedValue, List[SharedMemory]]:
+    """
+    Copies a pickled value into shared memory blocks, one for the pickle
+    stream and one for every out-of-band buffer.
+
+    Returns:
+        tuple: The handle to pass to `attach` in other processes, and the
+        blocks, which the caller must close and unlink when done.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    stream = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+
+    chunks = [memoryview(stream), *(buffer.raw() for buffer in buffers)]
+    blocks = []
+    try:
+        for chunk in chunks:
+            # Zero-size blocks are not allowed
+            block = SharedMemory(create=True, size=max(chunk.nbytes, 1))
+            blocks.append(block)
+            block.buf[:chunk.nbytes] = chunk
+    except BaseException:
+        release(blocks)
+        raise
+    return SharedValue([(block.name, chunk.nbytes) for block, chunk in zip(blocks, chunks)]), blocks
+
+
+def attach(shared: SharedValue) -> Tuple[Any, List[SharedMemory]]:
+    """
+    Rebuilds a shared value in another process; out-of-band buffers are read-only views of the blocks.
+
+    Returns:
+        tuple: The value and the attached blocks, to close (not unlink) once
+        the value is no longer used.
+    """
+    blocks = [SharedMemory(name=name) for name, _ in shared.blocks]
+    views = [block.buf[:size] for block, (_, size) in zip(blocks, shared.blocks)]
+    value = pickle.loads(views[0], buffers=[view.toreadonly() for view in views[1:]])
+    views[0].release()
+    return value, blocks
+
+
+def release(blocks: Iterable[SharedMemory], unlink: bool = True):
+    """Closes (and by default unlinks) shared memory blocks."""
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # A view of the block is still alive; it is unmapped when the process exits
+            pass
+        if unlink:
+            block.unlink()
+
+
+def run_shared_part(
+    solver: Solver,
+    shared: SharedValue,
+    part: str,
+    track_memory: bool = False,
+    count: bool = False,
+) -> Tuple[Any, float, Optional[Dict[str, int]], Optional[Dict[str, int]]]:
+    """
+    Runs one part on the shared parsed input, in a worker.
+
+    Returns:
+        tuple: The answer, its wall time, and its memory use and work counters when tracked.
+    """
+    # Imported here: the runner imports this module
+    from Advent_of_code_rep.Advent_of_code.harness.runner import run_stage
+
+    module = import_solver(solver)
+    parsed, blocks = attach(shared)
+    timings = {}
+    memory = {} if track_memory else None
+    work = {} if count else None
+    try:
+        answer = run_stage(timings, memory, part, getattr(module, part), parsed, work=work)
+    finally:
+        del parsed
+        release(blocks, unlink=False)
+    return answer, timings[part], (memory or {}).get(part), (work or {}).get(part)
+
+
+def run_parts(
+    solver: Solver,
+    parsed: Any,
+    parts: List[str],
+    timings: Dict[str, float],
+    memory: Optional[Dict[str, Dict[str, int]]] = None,
+    work: Optional[Dict[str, Dict[str, int]]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the parts of a solver concurrently, one worker process each, over one parsed input.
+
+    Args:
+        solver (Solver): The solver whose parts to run.
+        parsed: The parsed input.
+        parts (list[str]): The parts to run.
+        timings (dict): Receives the wall time of every part.
+        memory (dict, optional): Receives the memory use of every part, when tracked.
+        work (dict, optional): Receives the work counters of every part, when tracked.
+
+    Returns:
+        dict: The answer of every part.
+    """
+    shared, blocks = share(parsed)
+    try:
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            futures = {part: pool.submit(run_shared_part, solver, shared, part, memory is not None, work is not None)
+                       for part in parts}
+            answers = {}
+            for part, future in futures.items():
+                answers[part], timings[part], usage, counted = future.result()
+                if memory is not None:
+                    memory[part] = usage
+                if work is not None:
+                    work[part] = counted
+    finally:
+        release(blocks)
+    return answers
@@ -0,0 +1,112 @@
+"""
+Streams an input through a line-oriented day with constant memory.
+
+Days whose answers are sums over independent lines declare `PER_LINE`, which
+maps a part to the function giving one line's contribution to it. `fold_lines`
+applies them to each (non-blank) line of stdin, a file or any iterable as it
+arrives, without ever holding the input, and can report running totals every
+`--every` records, so multi-GB generated inputs can be piped straight through.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.generators 7 --scale 1000 | \\
+        python -m Advent_of_code_rep.Advent_of_code.harness.stream 2024 7 --every 100000
+    python -m Advent_of_code_rep.Advent_of_code.harness.stream 2023 1 --input big.txt --parts part2
+"""
+import argparse
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from Advent_of_code_rep.Advent_of_code.harness.discovery import Solver, discover, import_solver
+from Advent_of_code_rep.Advent_of_code.utils import loader
+
+PerLine = Dict[str, Callable[[str], int]]
+
+
+def fold_lines(
+    per_line: PerLine,
+    lines: Iterable[Union[str, bytes]],
+    every: Optional[int] = None,
+) -> Iterator[Tuple[int, Dict[str, int]]]:
+    """
+    Sums every part's per-line contribution over the lines, one line at a time.
+
+    Args:
+        per_line (dict): Part name to the function giving a line's contribution.
+        lines (iterable of str or bytes): The input lines, e.g. `sys.stdin`.
+        every (int, optional): Also yield the running totals every this many records.
+
+    Yields:
+        tuple: The number of records folded so far and the totals per part;
+        the last one holds the answers.
+    """
+    totals = dict.fromkeys(per_line, 0)
+    folds = list(per_line.items())
+    records = 0
+    for line in loader.lines(lines):
+        line = line.strip()
+        if not line:
+            continue
+        for part, fold in folds:
+            totals[part] += fold(line)
+        records += 1
+        if every and records % every == 0:
+            yield records, dict(totals)
+    yield records, totals
+
+
+def streaming_solver(year: int, day: int, name: Optional[str] = None) -> Tuple[Solver, PerLine]:
+    """Returns the solver module of a day declaring the most `PER_LINE` parts, and those parts."""
+    found = []
+    for solver in discover(years=[year], days=[day]):
+        per_line = getattr(import_solver(solver), "PER_LINE", None)
+        if per_line and name in (None, solver.name):
+            found.append((solver, per_line))
+    if not found:
+        raise LookupError(f"no solver for {year}/{day:02d} declares PER_LINE" + (f" named {name}" if name else ""))
+    return max(found, key=lambda item: len(item[1]))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("stream")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--input", type=Path, default=None, help="input file (default: stdin)")
+    parser.add_argument("--parts", nargs="+", default=None, help="only fold these parts")
+    parser.add_argument("--name", default=None, help="solver module, when a day has several")
+    parser.add_argument("--every", type=int, default=None, help="print running totals every this many records")
+    args = parser.parse_args(args)
+
+    try:
+        solver, per_line = streaming_solver(args.year, args.day, args.name)
+    except LookupError as e:
+        parser.error(str(e))
+    if args.parts:
+        missing = set(args.parts) - set(per_line)
+        if missing:
+            parser.error(f"{solver.key} does not stream {', '.join(sorted(missing))}")
+        per_line = {part: per_line[part] for part in args.parts}
+
+    def report(records: int, totals: Dict[str, int], label: str):
+        answers = "  ".join(f"{part} {total}" for part, total in totals.items())
+        print(f"{label:<8} {records:>12,} records  {time.perf_counter() - start:8.3f}s  {answers}", flush=True)
+
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        if args.input:
+            lines = loader.iter_lines(stack.enter_context(loader.map_input(args.input)))
+        else:
+            lines = sys.stdin
+        # The last totals are the answers; every earlier one is a running total
+        previous = None
+        for snapshot in fold_lines(per_line, lines, args.every):
+            if previous:
+                report(*previous, "running")
+            previous = snapshot
+    report(*previous, "total")
+
+
+if __name__ == "__main__":
+    main()
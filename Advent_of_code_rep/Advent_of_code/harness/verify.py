@@ -0,0 +1,168 @@
+"""
+Checks every day's sample answers and its time budget on the real input.
+
+A day declares what to check as module-level constants:
+
+    SAMPLE_ANSWERS = {"part1": 41, "part2": 6}  # expected answers on the sample
+    SAMPLE = "..."                              # the sample, when there is no sample file
+    TIME_BUDGET = 1.0                           # seconds for parse + parts on the real input
+
+Only the parts listed in `SAMPLE_ANSWERS` are run on the sample, and days
+without a `TIME_BUDGET` get `DEFAULT_TIME_BUDGET`. Every run happens in its own
+Python subprocess with a hard timeout (`--timeout-factor` times the budget for
+the real input), so a pathological regression fails the check instead of
+hanging the suite. Budgets are reported as pass/fail with the measured margin.
+
+Usage (from the repository root):
+    python -m Advent_of_code_rep.Advent_of_code.harness.verify              # everything
+    python -m Advent_of_code_rep.Advent_of_code.harness.verify 2024 6 7     # selected days
+    python -m Advent_of_code_rep.Advent_of_code.harness.verify --samples-only
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from Advent_of_code_rep.Advent_of_code.harness.cache import to_json
+from Advent_of_code_rep.Advent_of_code.harness.discovery import ROOT, Solver, discover, find_input, import_solver
+from Advent_of_code_rep.Advent_of_code.harness.runner import PARTS, timed
+
+DEFAULT_TIME_BUDGET = 1.0
+
+# Hard timeout of a sample run, and of a real run as a multiple of its budget
+SAMPLE_TIMEOUT = 10.0
+TIMEOUT_FACTOR = 5.0
+
+# Marks the module's `SAMPLE` instead of an input file in a child run
+INLINE_SAMPLE = "-"
+
+
+class Check(NamedTuple):
+    solver: Solver
+    name: str
+    passed: bool
+    detail: str
+
+
+def time_budget(module: ModuleType) -> float:
+    """Returns the `TIME_BUDGET` a solver module declares, or the default one."""
+    return getattr(module, "TIME_BUDGET", DEFAULT_TIME_BUDGET)
+
+
+def run_isolated(solver: Solver, source: str, parts: List[str], timeout: float) -> Dict[str, Any]:
+    """
+    Runs parse and `parts` of a solver in a fresh Python process.
+
+    Args:
+        solver (Solver): The solver to run.
+        source (str): Input file, or `INLINE_SAMPLE` for the module's `SAMPLE`.
+        parts (list[str]): The parts to run.
+        timeout (float): Seconds after which the process is killed.
+
+    Returns:
+        dict: `answers` and `timings`, or `error` if the run failed or timed out.
+    """
+    command = [sys.executable, "-m", __spec__.name, "--run", solver.key, "--source", source, "--parts", *parts]
+    try:
+        process = subprocess.run(command, cwd=ROOT.parent.parent, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout:.1f}s"}
+    if process.returncode:
+        lines = process.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit status {process.returncode}"}
+    return json.loads(process.stdout)
+
+
+def check_sample(solver: Solver, module: ModuleType) -> Optional[Check]:
+    """Compares the answers on the sample with `SAMPLE_ANSWERS`, if the module declares them."""
+    expected = getattr(module, "SAMPLE_ANSWERS", None)
+    if not expected:
+        return None
+    if hasattr(module, "SAMPLE"):
+        source = INLINE_SAMPLE
+    else:
+        path = find_input(solver, sample=True)
+        if path is None:
+            return Check(solver, "sample", False, "no sample input")
+        source = str(path)
+
+    result = run_isolated(solver, source, list(expected), SAMPLE_TIMEOUT)
+    if "error" in result:
+        return Check(solver, "sample", False, result["error"])
+    wrong = [f"{part} {result['answers'][part]!r} != {answer!r}"
+             for part, answer in expected.items() if result["answers"][part] != answer]
+    return Check(solver, "sample", not wrong, "; ".join(wrong) or "answers match")
+
+
+def check_budget(solver: Solver, module: ModuleType, timeout_factor: float = TIMEOUT_FACTOR) -> Optional[Check]:
+    """Times parse and every part on the real input against the day's time budget."""
+    path = find_input(solver)
+    if path is None:
+        return None
+    budget = time_budget(module)
+    parts = [part for part in PARTS if hasattr(module, part)]
+
+    result = run_isolated(solver, str(path), parts, budget * timeout_factor)
+    if "error" in result:
+        return Check(solver, "budget", False, f"{result['error']} (budget {budget:.3f}s)")
+    seconds = sum(result["timings"].values())
+    margin = budget - seconds
+    return Check(solver, "budget", margin >= 0, f"{seconds:.3f}s of {budget:.3f}s (margin {margin:+.3f}s)")
+
+
+def run_child(key: str, source: str, parts: List[str]):
+    """Entry point of a subprocess started by `run_isolated`; prints its result as JSON."""
+    solver = next(solver for solver in discover() if solver.key == key)
+    module = import_solver(solver)
+    text = module.SAMPLE if source == INLINE_SAMPLE else Path(source).read_text()
+
+    timings = {}
+    parsed = timed(timings, "parse", module.parse, text)
+    answers = {part: json.loads(to_json(timed(timings, part, getattr(module, part), parsed))) for part in parts}
+    print(json.dumps({"answers": answers, "timings": timings}))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser("verify")
+    parser.add_argument("year", nargs="?", type=int, help="only verify this year")
+    parser.add_argument("days", nargs="*", type=int, help="only verify these days")
+    parser.add_argument("--samples-only", action="store_true", help="skip the time budgets on the real inputs")
+    parser.add_argument("--timeout-factor", type=float, default=TIMEOUT_FACTOR,
+                        help=f"kill a real run after this many times its budget (default: {TIMEOUT_FACTOR:g})")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--source", help=argparse.SUPPRESS)
+    parser.add_argument("--parts", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args(args)
+
+    if args.run:
+        run_child(args.run, args.source, args.parts)
+        return
+
+    solvers = discover(years=[args.year] if args.year else None, days=args.days)
+    if not solvers:
+        parser.error("no solvers found")
+
+    checks: List[Check] = []
+    for solver in solvers:
+        try:
+            module = import_solver(solver)
+        except Exception as e:
+            found = [Check(solver, "import", False, f"{type(e).__name__}: {e}")]
+        else:
+            found = [check_sample(solver, module)]
+            if not args.samples_only:
+                found.append(check_budget(solver, module, args.timeout_factor))
+        for check in filter(None, found):
+            checks.append(check)
+            print(f"{solver.key:<28} {check.name:<6} {'ok' if check.passed else 'FAIL':<4}  {check.detail}", flush=True)
+
+    failed = [check for check in checks if not check.passed]
+    print(f"{len(checks)} checks, {len(failed)} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
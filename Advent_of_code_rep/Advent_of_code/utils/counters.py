@@ -0,0 +1,53 @@
+"""
+Opt-in work counters for the solvers' hot loops.
+
+Timings say how long a stage took; counters say how much work it did, such as
+the states a search popped or the steps a simulation ran. Counting only
+happens inside a `collect()` context (the runner's `--counters`); elsewhere
+`count` returns at once.
+
+Hot loops never count per iteration. They either derive the count once they
+are done (e.g. `len(seen)`), or, in the shared searches, swap a function they
+already call for a `counted` wrapper when counting is enabled, so the loop
+itself is unchanged when it is not.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+_active: ContextVar[Optional[Counter]] = ContextVar("counters", default=None)
+
+
+@contextmanager
+def collect() -> Iterator[Counter]:
+    """Enables counting for the duration of the context, yielding the counters."""
+    counter = Counter()
+    token = _active.set(counter)
+    try:
+        yield counter
+    finally:
+        _active.reset(token)
+
+
+def enabled() -> bool:
+    """Tells whether counting is enabled, to skip deriving counts otherwise."""
+    return _active.get() is not None
+
+
+def count(name: str, amount: int = 1):
+    """Adds `amount` to the counter `name`, if counting is enabled."""
+    counter = _active.get()
+    if counter is not None:
+        counter[name] += amount
+
+
+def counted(func: Callable, name: str) -> Callable:
+    """Wraps `func` so that every call adds 1 to the counter `name`; only call it when counting is enabled."""
+    counter = _active.get()
+
+    def wrapper(*args):
+        counter[name] += 1
+        return func(*args)
+
+    return wrapper
@@ -0,0 +1,106 @@
+"""
+Compact character grid shared by the grid puzzles.
+
+A `Grid` keeps its cells row-major in one contiguous `bytearray` (one byte per
+cell) and addresses them by a flat index instead of (row, col) tuples. The
+grid is surrounded by `pad` rings of `fill` cells, so walking off the map lands
+on a fill cell rather than out of range: a single byte comparison replaces the
+bounds checks, and moving is adding an offset from `dirs4` / `dirs8`.
+"""
+from typing import Iterator, List, Tuple
+
+# Fill byte of the padding unless another one is given
+OUTSIDE = "\0"
+
+
+class Grid:
+    """
+    A padded 2D character grid backed by a bytearray.
+
+    Args:
+        lines (list[str]): The rows of the grid, all of the same length.
+        pad (int): Number of fill rings around the grid.
+        fill (str): Single character used for the padding.
+
+    Attributes:
+        cells (bytearray): The padded cells, row-major.
+        rows (int): Number of rows, without padding.
+        cols (int): Number of columns, without padding.
+        width (int): Row stride of `cells`, i.e. `cols + 2 * pad`.
+        dirs4 (tuple[int, ...]): Flat offsets of the up, right, down and left neighbours.
+        dirs8 (tuple[int, ...]): Flat offsets of all 8 neighbours, clockwise from up.
+    """
+
+    __slots__ = ("cells", "rows", "cols", "pad", "fill", "width", "dirs4", "dirs8")
+
+    def __init__(self, lines: List[str], pad: int = 1, fill: str = OUTSIDE):
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.pad = pad
+        self.fill = ord(fill)
+        self.width = width = self.cols + 2 * pad
+
+        border = fill * (width * pad)
+        margin = fill * pad
+        self.cells = bytearray(
+            (border + "".join(margin + line + margin for line in lines) + border).encode("latin-1")
+        )
+
+        self.dirs4 = (-width, 1, width, -1)
+        self.dirs8 = (-width, -width + 1, 1, width + 1, width, width - 1, -1, -width - 1)
+
+    @classmethod
+    def parse(cls, text: str, pad: int = 1, fill: str = OUTSIDE) -> "Grid":
+        """Builds a grid from the puzzle input, ignoring trailing whitespace on each line."""
+        return cls([line.rstrip() for line in text.splitlines() if line.strip()], pad, fill)
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for name in self.__slots__:
+            setattr(grid, name, getattr(self, name))
+        grid.cells = self.cells.copy()
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        """Returns the flat index of (row, col), both counted without padding."""
+        return (row + self.pad) * self.width + col + self.pad
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        """Returns the (row, col) of a flat index, both counted without padding."""
+        row, col = divmod(index, self.width)
+        return row - self.pad, col - self.pad
+
+    def inside(self, index: int) -> bool:
+        """Tells whether a flat index lies on the grid rather than on its padding."""
+        row, col = self.coords(index)
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def find(self, char: str) -> int:
+        """Returns the flat index of the first `char` cell, or -1 if there is none."""
+        return self.cells.find(ord(char))
+
+    def positions(self, char: str) -> List[int]:
+        """Returns the flat indices of all `char` cells, in row-major order."""
+        cells, value = self.cells, ord(char)
+        found = []
+        index = cells.find(value)
+        while index != -1:
+            found.append(index)
+            index = cells.find(value, index + 1)
+        return found
+
+    def indices(self) -> Iterator[int]:
+        """Yields the flat indices of all cells on the grid, in row-major order."""
+        for row in range(self.pad, self.pad + self.rows):
+            start = row * self.width + self.pad
+            yield from range(start, start + self.cols)
+
+    def lines(self) -> List[str]:
+        """Returns the rows of the grid, without padding."""
+        return [
+            self.cells[start:start + self.cols].decode("latin-1")
+            for start in range(self.pad * self.width + self.pad, (self.pad + self.rows) * self.width, self.width)
+        ]
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
@@ -0,0 +1,116 @@
+"""
+Memory-mapped input loading for line-oriented puzzles.
+
+`map_input` maps an input file read-only, so even a multi-hundred-MB input is
+never copied into one Python string; `iter_lines` and `iter_chunks` then walk
+the mapping line by line or in newline-aligned chunks, and `split_ranges`
+cuts it into newline-aligned byte ranges for parallel workers.
+
+The line-oriented days build their parsed input with `lines`, which accepts
+the puzzle input as a string or as any iterable of lines, such as
+`iter_lines(mapping)`:
+
+    with map_input("input.txt") as data:
+        parsed = parse(iter_lines(data))
+"""
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Default size of the chunks yielded by `iter_chunks`
+CHUNK_SIZE = 1 << 20
+
+
+@contextmanager
+def map_input(path: Union[str, Path]) -> Iterator[Buffer]:
+    """
+    Maps a file read-only for the duration of the context.
+
+    Empty files cannot be mapped, so they are returned as empty bytes.
+    """
+    with open(path, "rb") as file:
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            yield mapping
+
+
+def iter_lines(buffer: Buffer, start: int = 0, end: int = None) -> Iterator[bytes]:
+    """
+    Yields the lines of `buffer[start:end]` without their line endings.
+
+    Only one line is copied at a time; a trailing newline does not add an
+    empty line.
+    """
+    end = len(buffer) if end is None else end
+    while start < end:
+        newline = buffer.find(b"\n", start, end)
+        if newline == -1:
+            newline = end
+        yield bytes(buffer[start:newline]).rstrip(b"\r")
+        start = newline + 1
+
+
+def iter_chunks(buffer: Buffer, chunk_size: int = CHUNK_SIZE, start: int = 0, end: int = None) -> Iterator[memoryview]:
+    """
+    Yields zero-copy views of roughly `chunk_size` bytes of `buffer[start:end]`
+    that end on a newline, e.g. of a range given by `split_ranges`.
+
+    A chunk only goes past `chunk_size` when a single line is longer than that.
+    """
+    view = memoryview(buffer)
+    size = len(buffer) if end is None else end
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = buffer.rfind(b"\n", start, end)
+            if newline == -1:
+                newline = buffer.find(b"\n", end, size)
+            end = size if newline == -1 else newline + 1
+        yield view[start:end]
+        start = end
+
+
+def split_ranges(buffer: Buffer, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits a buffer into at most `parts` newline-aligned `(start, end)` byte ranges.
+
+    Every range ends just after a newline (or at the end of the buffer), so a
+    worker can process `iter_lines(buffer, start, end)` without seeing a
+    partial line. Ranges are never empty, so short inputs give fewer of them.
+    """
+    size = len(buffer)
+    ranges = []
+    start = 0
+    for part in range(1, parts + 1):
+        if start >= size:
+            break
+        end = size if part == parts else max(start, size * part // parts)
+        if end < size:
+            newline = buffer.find(b"\n", end)
+            end = size if newline == -1 else newline + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def lines(source: Union[str, Buffer, Iterable[Union[str, bytes]]]) -> Iterator[str]:
+    """
+    Yields the lines of a puzzle input given as a string, a bytes-like buffer
+    (e.g. a memory map) or an iterable of str or bytes lines.
+
+    Line endings are removed, so a day can parse any of them the same way.
+    """
+    if isinstance(source, str):
+        yield from source.splitlines()
+        return
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        source = iter_lines(source)
+    for line in source:
+        if isinstance(line, (bytes, bytearray, memoryview)):
+            line = bytes(line).decode()
+        yield line.rstrip("\r\n")
@@ -0,0 +1,95 @@
+"""
+Multi-pattern string matching with an Aho-Corasick automaton.
+
+The automaton is built once from a mapping of patterns to values and turned
+into a full transition table (every failure link resolved up front), so
+scanning a string is one dict lookup per character, without slicing it or
+backtracking, and overlapping patterns such as "oneight" are all seen.
+Characters that appear in no pattern send the scan back to the root.
+
+`first` scans forward and stops at the first match; `last` scans the string
+backwards with a second automaton built from the reversed patterns, so it
+usually stops after a few characters too.
+"""
+from collections import deque
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+ROOT = 0
+
+
+def build(patterns: Mapping[str, Any]) -> Tuple[List[Dict[str, int]], List[Any]]:
+    """
+    Builds the transition table of an Aho-Corasick automaton.
+
+    Args:
+        patterns (Mapping[str, Any]): The (non-empty) patterns and the value each stands for.
+
+    Returns:
+        tuple: The transitions (for every state, the next state by character;
+        missing characters lead to the root) and the value matched on reaching
+        every state (the longest pattern ending there), or None.
+    """
+    goto: List[Dict[str, int]] = [{}]
+    output: List[Any] = [None]
+    for pattern, value in patterns.items():
+        if not pattern:
+            raise ValueError("patterns must not be empty")
+        state = ROOT
+        for char in pattern:
+            if char not in goto[state]:
+                goto[state][char] = len(goto)
+                goto.append({})
+                output.append(None)
+            state = goto[state][char]
+        output[state] = value
+
+    # Breadth-first, so the failure state of a state is complete before the state itself
+    fail = [ROOT] * len(goto)
+    delta = [dict(goto[ROOT])] + [{} for _ in goto[1:]]
+    queue = deque(goto[ROOT].values())
+    while queue:
+        state = queue.popleft()
+        if output[state] is None:
+            output[state] = output[fail[state]]
+        delta[state] = {**delta[fail[state]], **goto[state]}
+        for char, child in goto[state].items():
+            fail[child] = delta[fail[state]].get(char, ROOT)
+            queue.append(child)
+    return delta, output
+
+
+class Automaton:
+    """
+    Finds the first and last of several patterns in a string.
+
+    A match is found when it ends, so `first` returns the match ending first
+    and `last` the match starting last; when no pattern lies strictly inside
+    another, these are the leftmost and rightmost matches.
+
+    Args:
+        patterns (Mapping[str, Any]): The patterns and the value each stands for.
+    """
+
+    def __init__(self, patterns: Mapping[str, Any]):
+        self.delta, self.output = build(patterns)
+        self.reverse_delta, self.reverse_output = build({pattern[::-1]: value for pattern, value in patterns.items()})
+
+    def first(self, text: str, default: Optional[Any] = None) -> Any:
+        """Returns the value of the first pattern in `text`, or `default` if there is none."""
+        delta, output = self.delta, self.output
+        state = ROOT
+        for char in text:
+            state = delta[state].get(char, ROOT)
+            if output[state] is not None:
+                return output[state]
+        return default
+
+    def last(self, text: str, default: Optional[Any] = None) -> Any:
+        """Returns the value of the last pattern in `text`, or `default` if there is none."""
+        delta, output = self.reverse_delta, self.reverse_output
+        state = ROOT
+        for char in reversed(text):
+            state = delta[state].get(char, ROOT)
+            if output[state] is not None:
+                return output[state]
+        return default
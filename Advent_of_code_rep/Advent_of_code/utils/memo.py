@@ -0,0 +1,161 @@
+"""
+Memoization for the recursive and DP solvers, with an optional LRU bound and statistics.
+
+`memoize` wraps a function in a `Memo`, which keeps the hits, misses and
+evictions of its cache so that cache sizes can be tuned against a day's memory
+budget, and adds them to the work counters (see `counters`) on `report()`.
+
+The scope of a cache is explicit in where the memo is built: decorating a
+module-level function keeps its cache for the life of the process (only valid
+when the results do not depend on the input, e.g. stone counts after n blinks),
+while a memo built inside a part over a function of the parsed input lives for
+that input only.
+
+Keys are the single argument itself, or the argument tuple. Functions of
+several small ints can pass `key=packed(...)` to fold them into one int instead
+of building a tuple on every call.
+"""
+from collections import OrderedDict
+from functools import update_wrapper
+from typing import Callable, Dict, Optional
+
+from Advent_of_code_rep.Advent_of_code.utils import counters
+
+
+def packed(*bits: int) -> Callable[..., int]:
+    """
+    Returns a key function folding non-negative int arguments into a single int.
+
+    Args:
+        *bits (int): Width in bits of every argument after the first, which
+            must be below `2 ** bits`; the first one is unbounded.
+
+    Example:
+        `packed(7)` keys `(stone, blinks)` as `stone << 7 | blinks` for blinks below 128.
+    """
+    if len(bits) == 1:
+        shift = bits[0]
+        return lambda first, second: first << shift | second
+
+    def key(first, *rest):
+        for width, value in zip(bits, rest):
+            first = first << width | value
+        return first
+
+    return key
+
+
+class Memo:
+    """
+    A memoized function, with the statistics of its cache.
+
+    Args:
+        func (callable): The function to memoize; its results must only depend on its arguments.
+        maxsize (int, optional): Keep at most this many results, evicting the
+            least recently used ones. Unbounded by default.
+        key (callable, optional): Maps the arguments to the cache key. Defaults
+            to the argument of a single-argument call, or the argument tuple.
+        name (str, optional): Prefix of the work counters. Defaults to the function name.
+
+    Attributes:
+        cache (dict): The cached results by key.
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that ran the function.
+        evictions (int): Results dropped to stay within `maxsize`.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        maxsize: Optional[int] = None,
+        key: Optional[Callable] = None,
+        name: Optional[str] = None,
+    ):
+        self.func = func
+        self.maxsize = maxsize
+        self.key = key
+        self.name = name or func.__name__
+        self.cache = {} if maxsize is None else OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        self._reported = (0, 0, 0)
+        self._call = self._bounded if maxsize is not None else self._keyed if key else self._unbounded
+        update_wrapper(self, func)
+
+    def __call__(self, *args):
+        return self._call(*args)
+
+    def _unbounded(self, *args):
+        key = args[0] if len(args) == 1 else args
+        try:
+            value = self.cache[key]
+        except KeyError:
+            self.misses += 1
+            value = self.cache[key] = self.func(*args)
+            return value
+        self.hits += 1
+        return value
+
+    def _keyed(self, *args):
+        key = self.key(*args)
+        try:
+            value = self.cache[key]
+        except KeyError:
+            self.misses += 1
+            value = self.cache[key] = self.func(*args)
+            return value
+        self.hits += 1
+        return value
+
+    def _bounded(self, *args):
+        key = self.key(*args) if self.key else args[0] if len(args) == 1 else args
+        cache = self.cache
+        try:
+            value = cache[key]
+        except KeyError:
+            self.misses += 1
+            value = self.func(*args)
+            # The call may have filled the cache meanwhile, so evict after storing
+            cache[key] = value
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+                self.evictions += 1
+            return value
+        cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hits, misses and evictions so far, and the current cache size."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self.cache)}
+
+    def report(self):
+        """Adds the hits, misses and evictions since the last report to the work counters, if enabled."""
+        if not counters.enabled():
+            return
+        current = (self.hits, self.misses, self.evictions)
+        for stat, value, reported in zip(("hits", "misses", "evictions"), current, self._reported):
+            if value != reported:
+                counters.count(f"{self.name}.{stat}", value - reported)
+        self._reported = current
+
+    def cache_clear(self):
+        """Forgets every result; the statistics are kept."""
+        self.cache.clear()
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = None,
+    key: Optional[Callable] = None,
+    name: Optional[str] = None,
+):
+    """
+    Memoizes a function, as `@memoize` or `@memoize(maxsize=..., key=...)`; see `Memo`.
+
+    Recursive calls go through the memo when the function refers to itself by
+    its (decorated) name.
+    """
+    if func is None:
+        return lambda func: Memo(func, maxsize, key, name)
+    return Memo(func, maxsize, key, name)
@@ -0,0 +1,113 @@
+"""
+Bulk integer extraction for puzzle inputs.
+
+`ints` pulls every integer out of an input in one pass instead of running
+`re.findall(r"-?\\d+", line)` line by line: every byte that cannot be part of a
+number is translated to a space, and the remaining tokens are converted in C,
+by `numpy.fromstring` for large inputs or by `int` into an `array('q')`
+otherwise. Both give a contiguous int64 buffer.
+
+NumPy alone takes about 100 ms to import, more than parsing a whole puzzle
+input, so it is only imported (by `numpy_for`) once an input reaches
+`NUMPY_MIN_BYTES`, and solver modules never import it at load time.
+"""
+import mmap
+import re
+from array import array
+from typing import Iterable, Optional, Union
+
+from Advent_of_code_rep.Advent_of_code.utils import loader
+
+# Inputs below this size are handled without NumPy, so that solving them never pays its import
+NUMPY_MIN_BYTES = 1 << 20
+
+# Every byte other than a digit (or a minus sign, for signed numbers) becomes a separator
+SIGNED = bytes(c if c in b"0123456789-" else 32 for c in range(256))
+UNSIGNED = bytes(c if c in b"0123456789" else 32 for c in range(256))
+
+NUMBER = re.compile(rb"-?\d+")
+
+
+def _to_bytes(source: Union[str, loader.Buffer, Iterable[str]]) -> bytes:
+    if isinstance(source, str):
+        return source.encode()
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return bytes(source)
+    return "\n".join(loader.lines(source)).encode()
+
+
+def numpy_for(size: int):
+    """
+    Returns NumPy for data of `size` bytes, importing it on first use.
+
+    Returns:
+        module or None: `numpy`, or None when the data is below
+        `NUMPY_MIN_BYTES` or NumPy is not installed.
+    """
+    if size < NUMPY_MIN_BYTES:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _stray_minus(np, data: bytes) -> bool:
+    """Tells whether translated input has a minus sign that starts no number, as in "seed-to-soil" or "5-3"."""
+    chars = np.frombuffer(data, dtype=np.uint8)
+    minus = chars == ord("-")
+    if not minus.any():
+        return False
+    digit = chars >= ord("0")  # Only digits, "-" and spaces are left
+    return bool(minus[-1] or (minus[:-1] & ~digit[1:]).any() or (digit[:-1] & minus[1:]).any())
+
+
+def ints(source: Union[str, loader.Buffer, Iterable[str]], width: Optional[int] = None, signed: bool = True):
+    """
+    Extracts every integer of an input, as `re.findall(r"-?\\d+")` would.
+
+    Args:
+        source (str, bytes-like or iterable of lines): The puzzle input, e.g. a
+            string, a memory map or `loader.iter_lines(...)`.
+        width (int, optional): Number of integers per record; the result then
+            has one row per record.
+        signed (bool): Read a "-" before digits as a minus sign. When False
+            it is a separator, as in `re.findall(r"\\d+")`.
+
+    Returns:
+        The integers as int64, shaped `(n,)` or `(n // width, width)`: a NumPy
+        array for inputs of `NUMPY_MIN_BYTES` or more (when NumPy is
+        installed), or else a memoryview over an `array('q')`. Both have
+        `shape` and `tolist()`.
+
+    Raises:
+        ValueError: If the number of integers is not a multiple of `width`.
+    """
+    data = _to_bytes(source).translate(SIGNED if signed else UNSIGNED)
+    np = numpy_for(len(data))
+
+    if np is None:
+        try:
+            values = array("q", map(int, data.split()))
+        except ValueError:
+            # A token such as "-" or "5-3" holds a minus sign that starts no number
+            values = array("q", map(int, NUMBER.findall(data)))
+    elif signed and _stray_minus(np, data):
+        values = np.fromiter(map(int, NUMBER.findall(data)), dtype=np.int64)
+    elif data.isspace() or not data:
+        # `fromstring` reads a lone separator as a single 0
+        values = np.zeros(0, dtype=np.int64)
+    else:
+        values = np.fromstring(data, dtype=np.int64, sep=" ")
+
+    if width is None:
+        return values if np is not None else memoryview(values)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not split into records of {width}")
+    if np is not None:
+        return values.reshape(-1, width)
+    if not values:
+        # A memoryview cannot have a zero in its shape
+        return memoryview(values)
+    return memoryview(values).cast("B").cast("q", [len(values) // width, width])
@@ -0,0 +1,105 @@
+"""
+Streaming scanner for engine schematics (2023 day 3).
+
+A number is a part number when a symbol touches it, diagonals included, and a
+`*` touching exactly two numbers is a gear. Both only depend on the row above
+and the row below, so `scan` keeps a sliding window of three rows: every row
+is settled as soon as the row below it has been read (the last one against an
+empty row), and memory stays constant however many rows the schematic has.
+
+Rows may have different lengths; whatever lies past the end of a row counts
+as `.`.
+"""
+import math
+import re
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+from Advent_of_code_rep.Advent_of_code.utils import loader
+
+NUMBER = re.compile(r"\d+")
+SYMBOL = re.compile(r"[^.\d\s]")
+GEAR = re.compile(r"\*")
+
+
+class Row(NamedTuple):
+    """
+    Attributes:
+        text (str): The row.
+        ends (list[int]): The end column (exclusive) of every number, ascending.
+        numbers (list[tuple[int, int, int]]): The start and end column and the value of every number.
+    """
+    text: str
+    ends: List[int]
+    numbers: List[Tuple[int, int, int]]
+
+
+EMPTY = Row("", [], [])
+
+
+def read_row(text: str) -> Row:
+    numbers = [(match.start(), match.end(), int(match.group())) for match in NUMBER.finditer(text)]
+    return Row(text, [end for _, end, _ in numbers], numbers)
+
+
+def numbers_near(row: Row, column: int) -> List[int]:
+    """Returns the numbers of a row that touch `column`, i.e. overlap columns `column - 1` to `column + 1`."""
+    found = []
+    # The first number ending right of `column - 1` is the first one that can overlap
+    for start, _, value in row.numbers[bisect_left(row.ends, column):]:
+        if start > column + 1:
+            break
+        found.append(value)
+    return found
+
+
+def settle(above: Row, row: Row, below: Row) -> Tuple[List[int], List[int]]:
+    """Returns the part numbers and gear ratios of `row`, given its neighbouring rows."""
+    parts = []
+    for start, end, value in row.numbers:
+        left = max(start - 1, 0)
+        if any(SYMBOL.search(line.text, left, end + 1) for line in (above, row, below)):
+            parts.append(value)
+
+    ratios = []
+    for gear in GEAR.finditer(row.text):
+        column = gear.start()
+        numbers = numbers_near(above, column) + numbers_near(row, column) + numbers_near(below, column)
+        if len(numbers) == 2:
+            ratios.append(math.prod(numbers))
+    return parts, ratios
+
+
+def scan(lines: Iterable[str]) -> Iterator[Tuple[List[int], List[int]]]:
+    """
+    Scans a schematic row by row, holding three rows at a time.
+
+    Args:
+        lines (iterable of str or bytes): The schematic, e.g. a string, a file
+            or `loader.iter_lines(...)`; blank lines are skipped.
+
+    Yields:
+        tuple: The part numbers and the gear ratios of every row, in order,
+        once the row below it has been read.
+    """
+    above, row = EMPTY, None
+    for line in loader.lines(lines):
+        line = line.strip()
+        if not line:
+            continue
+        below = read_row(line)
+        if row is not None:
+            yield settle(above, row, below)
+            above = row
+        row = below
+    if row is not None:
+        yield settle(above, row, EMPTY)
+
+
+def sums(lines: Iterable[str]) -> Tuple[int, int]:
+    """Returns the sum of the part numbers and the sum of the gear ratios of a schematic, in one pass."""
+    part_sum = ratio_sum = 0
+    for parts, ratios in scan(lines):
+        part_sum += sum(parts)
+        ratio_sum += sum(ratios)
+    return part_sum, ratio_sum
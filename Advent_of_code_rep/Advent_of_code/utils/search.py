@@ -0,0 +1,228 @@
+"""
+Graph searches over integer-encoded states.
+
+States are ints in `range(size)`, such as a `Grid` flat index or
+`index * 4 + direction`, so distances and predecessors live in preallocated
+`array('q')` buffers rather than in dicts keyed by tuples. Every search accepts
+several start states, stops as soon as one of the optional `targets` is
+settled, and can record predecessors to rebuild a path with `path`.
+
+Neighbours are given as a callable: `neighbours(state)` yields the next states
+for `bfs`, while `edges(state)` yields `(next_state, cost)` pairs for the
+weighted searches (costs of 0 or 1 only for `zero_one_bfs`).
+
+Under `counters.collect()` every search counts its runs and the states it
+expanded, and the heap-based ones the entries they popped and relaxed.
+"""
+import heapq
+from array import array
+from collections import deque
+from typing import Callable, Container, Iterable, List, NamedTuple, Optional, Tuple
+
+from Advent_of_code_rep.Advent_of_code.utils import counters
+
+UNREACHED = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+Edges = Callable[[int], Iterable[Tuple[int, int]]]
+
+
+class SearchResult(NamedTuple):
+    """
+    Attributes:
+        dist (array): Distance of every state from the nearest start, UNREACHED if not reached.
+        pred (array or None): Predecessor of every state (UNREACHED for starts and
+            unreached states), if requested.
+        target (int): The target the search stopped at, or UNREACHED.
+    """
+    dist: array
+    pred: Optional[array]
+    target: int = UNREACHED
+
+
+def _buffers(size: int, starts: Iterable[int], predecessors: bool) -> Tuple[array, Optional[array], List[int]]:
+    dist = array("q", [UNREACHED]) * size
+    pred = array("q", [UNREACHED]) * size if predecessors else None
+    starts = list(starts)
+    for state in starts:
+        dist[state] = 0
+    return dist, pred, starts
+
+
+def bfs(
+    size: int,
+    starts: Iterable[int],
+    neighbours: Neighbours,
+    targets: Optional[Container[int]] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """
+    Breadth-first search where every move costs 1.
+
+    Args:
+        size (int): Number of states; states are ints in `range(size)`.
+        starts (iterable of int): Start states, all at distance 0.
+        neighbours (callable): Yields the states reachable from a state.
+        targets (container of int, optional): Stop when one of these is reached.
+        predecessors (bool): Also record the predecessor of every state.
+
+    Returns:
+        SearchResult: The distances, predecessors and reached target.
+    """
+    dist, pred, starts = _buffers(size, starts, predecessors)
+    queue = deque(starts)
+    if counters.enabled():
+        counters.count("bfs.searches")
+        neighbours = counters.counted(neighbours, "bfs.expanded")
+
+    while queue:
+        state = queue.popleft()
+        if targets is not None and state in targets:
+            return SearchResult(dist, pred, state)
+        step = dist[state] + 1
+        for next_state in neighbours(state):
+            if dist[next_state] == UNREACHED:
+                dist[next_state] = step
+                if pred is not None:
+                    pred[next_state] = state
+                queue.append(next_state)
+
+    return SearchResult(dist, pred)
+
+
+def zero_one_bfs(
+    size: int,
+    starts: Iterable[int],
+    edges: Edges,
+    targets: Optional[Container[int]] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """
+    Shortest paths when every move costs 0 or 1, using a deque instead of a heap.
+
+    Arguments and result are as for `dijkstra`.
+    """
+    dist, pred, starts = _buffers(size, starts, predecessors)
+    done = bytearray(size)
+    queue = deque(starts)
+    if counters.enabled():
+        counters.count("zero_one_bfs.searches")
+        edges = counters.counted(edges, "zero_one_bfs.expanded")
+
+    while queue:
+        state = queue.popleft()
+        if done[state]:
+            continue
+        done[state] = 1
+        if targets is not None and state in targets:
+            return SearchResult(dist, pred, state)
+        d = dist[state]
+        for next_state, cost in edges(state):
+            if dist[next_state] == UNREACHED or d + cost < dist[next_state]:
+                dist[next_state] = d + cost
+                if pred is not None:
+                    pred[next_state] = state
+                if cost:
+                    queue.append(next_state)
+                else:
+                    queue.appendleft(next_state)
+
+    return SearchResult(dist, pred)
+
+
+def dijkstra(
+    size: int,
+    starts: Iterable[int],
+    edges: Edges,
+    targets: Optional[Container[int]] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """
+    Shortest paths with non-negative move costs.
+
+    Args:
+        size (int): Number of states; states are ints in `range(size)`.
+        starts (iterable of int): Start states, all at distance 0.
+        edges (callable): Yields `(next_state, cost)` pairs for a state.
+        targets (container of int, optional): Stop when one of these is settled.
+        predecessors (bool): Also record the predecessor of every state.
+
+    Returns:
+        SearchResult: The distances, predecessors and reached target. Without
+        targets every reachable state holds its final distance; with targets
+        only the settled ones are final.
+    """
+    dist, pred, starts = _buffers(size, starts, predecessors)
+    queue = [(0, state) for state in starts]
+    heapq.heapify(queue)
+    push, pop = heapq.heappush, heapq.heappop
+    if counters.enabled():
+        counters.count("dijkstra.searches")
+        edges = counters.counted(edges, "dijkstra.expanded")
+        push, pop = counters.counted(push, "dijkstra.relaxed"), counters.counted(pop, "dijkstra.popped")
+
+    while queue:
+        d, state = pop(queue)
+        if d > dist[state]:
+            continue
+        if targets is not None and state in targets:
+            return SearchResult(dist, pred, state)
+        for next_state, cost in edges(state):
+            next_d = d + cost
+            known = dist[next_state]
+            if known == UNREACHED or next_d < known:
+                dist[next_state] = next_d
+                if pred is not None:
+                    pred[next_state] = state
+                push(queue, (next_d, next_state))
+
+    return SearchResult(dist, pred)
+
+
+def astar(
+    size: int,
+    starts: Iterable[int],
+    edges: Edges,
+    heuristic: Callable[[int], int],
+    targets: Container[int],
+    predecessors: bool = False,
+) -> SearchResult:
+    """
+    A* search: Dijkstra ordered by distance plus an admissible `heuristic(state)`.
+
+    Arguments and result are as for `dijkstra`, except that `targets` is
+    required; the heuristic estimates the remaining distance to them.
+    """
+    dist, pred, starts = _buffers(size, starts, predecessors)
+    queue = [(heuristic(state), 0, state) for state in starts]
+    heapq.heapify(queue)
+    push, pop = heapq.heappush, heapq.heappop
+    if counters.enabled():
+        counters.count("astar.searches")
+        edges = counters.counted(edges, "astar.expanded")
+        push, pop = counters.counted(push, "astar.relaxed"), counters.counted(pop, "astar.popped")
+
+    while queue:
+        _, d, state = pop(queue)
+        if d > dist[state]:
+            continue
+        if state in targets:
+            return SearchResult(dist, pred, state)
+        for next_state, cost in edges(state):
+            next_d = d + cost
+            known = dist[next_state]
+            if known == UNREACHED or next_d < known:
+                dist[next_state] = next_d
+                if pred is not None:
+                    pred[next_state] = state
+                push(queue, (next_d + heuristic(next_state), next_d, next_state))
+
+    return SearchResult(dist, pred)
+
+
+def path(pred: array, state: int) -> List[int]:
+    """Rebuilds the path from a start to `state` out of a predecessor array."""
+    states = [state]
+    while pred[states[-1]] != UNREACHED:
+        states.append(pred[states[-1]])
+    return states[::-1]